@@ -0,0 +1,13 @@
+"""Performance benchmarks for the last_assignment modules, grouped by topic:
+
+    entities: planet_memory, planet_conversion, entity_factory, jsonable
+    episodes: episode_conversion, director_counts, viewership_extrema
+    fleet: fleet_export, fleet_manifest
+    json_io: json_io, lazy_json
+
+Each benchmark is a < benchmark_< name > > function returning its measurements and a
+< run_< name > > function that prints them. Run from the last_assignment directory (the modules
+import swapi, sw_utils, etc. as top-level modules):
+
+    python -m benchmarks [< benchmark > [< count >]]
+"""
@@ -0,0 +1,55 @@
+import sys
+from . import entities, episodes, fleet, json_io
+
+
+# Benchmark name -> run function (prints the results); run in this order when none is named.
+BENCHMARKS = {
+    'planet_memory': entities.run_planet_memory,
+    'planet_conversion': entities.run_planet_conversion,
+    'entity_factory': entities.run_entity_factory,
+    'episode_conversion': episodes.run_episode_conversion,
+    'fleet_export': fleet.run_fleet_export,
+    'fleet_manifest': fleet.run_fleet_manifest,
+    'json_io': json_io.run_json_io,
+    'jsonable': entities.run_jsonable,
+    'lazy_json': json_io.run_lazy_json,
+    'director_counts': episodes.run_director_counts,
+    'viewership_extrema': episodes.run_viewership_extrema
+}
+
+
+def main():
+    """Entry point for program. Runs the named benchmark (or all of them) and prints the
+    results. < count > overrides the benchmark's default size (a scale for json_io and
+    lazy_json).
+
+    Usage:
+        python -m benchmarks [< benchmark > [< count >]]
+
+        benchmarks: see < BENCHMARKS >
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    args = sys.argv[1:]
+    if args and args[0] == 'planet_rss': # subprocess worker; see benchmark_planet_memory()
+        print(entities.measure_planet_rss(args[1], int(args[2])))
+        return
+
+    if not args:
+        for run in BENCHMARKS.values():
+            run()
+        return
+
+    run = BENCHMARKS.get(args[0])
+    if run is None:
+        sys.exit(f"Unknown benchmark {args[0]!r}; choose from: {', '.join(BENCHMARKS)}")
+    run(*map(int, args[1:2]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import json
+import os
+import resource
+import sys
+import time
+
+
+# Constants
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # last_assignment
+EPISODES_FILEPATH = os.path.join(ROOT_DIR, 'clone_wars_episodes.csv')
+JSON_SOURCES = {
+    'planets': os.path.join(ROOT_DIR, '..', 'problem_set_10', 'swapi_planets.json'),
+    'species': os.path.join(ROOT_DIR, '..', 'problem_set_09', 'swapi_species.json')
+}
+SWAPI_PLANETS_FILEPATH = JSON_SOURCES['planets']
+WOOKIEEPEDIA_PLANETS_FILEPATH = os.path.join(ROOT_DIR, 'wookieepedia_planets.csv')
+
+
+def get_peak_rss():
+    """Returns the peak resident set size of the current process in bytes."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024 # Linux reports kilobytes
+
+
+def stdlib_read_json(filepath):
+    """Baseline reader for < benchmark_json_io >: the original json.load() implementation."""
+
+    with open(filepath, 'r', encoding='utf-8') as file_obj:
+        return json.load(file_obj)
+
+
+def stdlib_write_json(filepath, data):
+    """Baseline writer for < benchmark_json_io >: the original json.dump() implementation."""
+
+    with open(filepath, 'w', encoding='utf-8') as file_obj:
+        json.dump(data, file_obj, ensure_ascii=False, indent=2)
+
+
+def time_best(repeat, func, *args):
+    """Returns the fastest of < repeat > timed calls of < func >(*args) in seconds."""
+
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return best
@@ -0,0 +1,365 @@
+import os
+import random
+import subprocess
+import sys
+import time
+import sw_utils as utl
+import swapi
+from .common import (
+    ROOT_DIR, SWAPI_PLANETS_FILEPATH, WOOKIEEPEDIA_PLANETS_FILEPATH, get_peak_rss
+)
+
+
+# Constants
+ENTITY_COUNT = 1_000_000
+ENTITY_WORKER_COUNTS = (1, 2, 4, 8) # pool sizes compared by benchmark_entity_factory()
+PERSON_COUNT = 100_000
+PLANET_COUNT = 1_000_000
+
+
+class DictPlanet:
+    """Planet with the original per-instance __dict__ layout. Used as the baseline when measuring
+    the memory saved by the slotted < swapi.Planet >."""
+
+    def __init__(self, url, name):
+        """Initialize a DictPlanet instance."""
+        self.url = url
+        self.name = name
+        self.region = None
+        self.sector = None
+        self.suns = None
+        self.moons = None
+        self.orbital_period_days = None
+        self.diameter_km = None
+        self.gravity_std = None
+        self.climate = None
+        self.terrain = None
+        self.population = None
+
+
+def benchmark_entity_factory(count=ENTITY_COUNT, worker_counts=ENTITY_WORKER_COUNTS):
+    """Compares the throughput (records/sec) of calling < swapi.create_planet > on each of
+    < count > synthetic planet rows (see < create_planet_dump >) with < swapi.create_entities >
+    converting the same rows in-process (workers=0) and across pools of each size in
+    < worker_counts >. A pool cannot beat the in-process path with more workers than cores
+    (see < os.cpu_count() >), since the workers then share the cores with the parent.
+
+    Parameters:
+        count (int): number of planet records
+        worker_counts (tuple): pool sizes to measure
+
+    Returns:
+        dict: 'serial', 'in_process' and 'pool_< n >' (records/sec) per pool size, 'cpus' and
+              'identical' (True if every run matches the serial planets)
+    """
+
+    rows = create_planet_dump(count)
+    runs = [
+        ('serial', lambda: [swapi.create_planet(row) for row in rows]),
+        ('in_process', lambda: swapi.create_entities('planets', rows, 0))
+    ]
+    for workers in worker_counts:
+        create = lambda workers=workers: swapi.create_entities('planets', rows, workers)
+        runs.append((f'pool_{workers}', create))
+
+    results = {'cpus': os.cpu_count() or 1, 'identical': True}
+    expected = None
+    for label, create in runs:
+        start = time.perf_counter()
+        planets = create()
+        results[label] = count / (time.perf_counter() - start)
+        if expected is None:
+            expected = [planet._jsonable() for planet in planets]
+        else:
+            results['identical'] = results['identical'] and all(
+                planet._jsonable() == other for planet, other in zip(planets, expected)
+            )
+        del planets
+
+    return results
+
+
+def benchmark_jsonable(count=PERSON_COUNT):
+    """Times batch exports of < count > synthetic < swapi.Person > instances whose homeworlds
+    are drawn from the Wookieepedia planets (see < create_planet_dump >), so each
+    < swapi.Planet > is shared by many people. The "cold" export builds every cached
+    representation (each planet once), the "warm" export reuses them, and the "dirty" export
+    follows a change to one planet, which rebuilds only that planet and the people living on it.
+
+    Parameters:
+        count (int): number of people exported
+
+    Returns:
+        dict: 'cold', 'warm' and 'dirty' (seconds), 'planets' (distinct homeworlds), 'shared'
+              (True if people sharing a homeworld share its dictionary)
+    """
+
+    rng = random.Random(506)
+    rows = utl.read_csv_to_dicts(WOOKIEEPEDIA_PLANETS_FILEPATH)
+    planets = [swapi.create_planet(data) for data in create_planet_dump(len(rows))]
+    people = []
+    for i in range(count):
+        person = swapi.Person(f"https://swapi.py4e.com/api/people/{i}/", f"Person {i}", '19BBY')
+        person.homeworld = rng.choice(planets)
+        people.append(person)
+
+    def export():
+        return [person.jsonable() for person in people]
+
+    results = {'planets': len(planets)}
+    for label in ('cold', 'warm'):
+        start = time.perf_counter()
+        exported = export()
+        results[label] = time.perf_counter() - start
+
+    planets[0].population = 1
+    start = time.perf_counter()
+    export()
+    results['dirty'] = time.perf_counter() - start
+    homeworlds = {id(data['homeworld']) for data in exported}
+    results['shared'] = len(homeworlds) <= len(planets)
+
+    return results
+
+
+def benchmark_planet_conversion(count=PLANET_COUNT):
+    """Compares the throughput (records/sec) of < swapi.create_planet >, which applies the
+    compiled < PLANET_FIELDS > converter, with < legacy_create_planet >, the previous
+    per-field < convert_to_* > implementation, over a synthetic dump of < count > planet rows.
+
+    Parameters:
+        count (int): number of planet records to convert
+
+    Returns:
+        dict: records/sec per implementation plus the speedup
+    """
+
+    records = create_planet_dump(count)
+    results = {}
+    implementations = (('legacy', legacy_create_planet), ('compiled', swapi.create_planet))
+    for label, create_planet in implementations:
+        start = time.perf_counter()
+        for record in records:
+            create_planet(record)
+        results[label] = count / (time.perf_counter() - start)
+
+    results['speedup'] = results['compiled'] / results['legacy']
+    return results
+
+
+def benchmark_planet_memory(count=PLANET_COUNT):
+    """Compares the resident set size (RSS) needed to hold < count > synthetic planets using the
+    __dict__ layout (< DictPlanet >) and the slotted layout (< swapi.Planet >). Each layout is
+    measured in a fresh interpreter so that the results do not contaminate one another.
+
+    Parameters:
+        count (int): number of planets to create
+
+    Returns:
+        dict: RSS growth in bytes per layout plus bytes per instance
+    """
+
+    results = {}
+    for layout in ('dict', 'slots'):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks', 'planet_rss', layout, str(count)],
+            capture_output=True, text=True, check=True, cwd=ROOT_DIR
+        ).stdout
+        results[layout] = int(output)
+
+    results['dict_per_instance'] = results['dict'] / count
+    results['slots_per_instance'] = results['slots'] / count
+    return results
+
+
+def create_planet_dump(count):
+    """Returns < count > planet records shaped like the merged SWAPI + Wookieepedia planet data
+    consumed by < swapi.create_planet >. Wookieepedia rows are cycled and combined with the
+    SWAPI "gravity" value for the same planet (or "unknown").
+
+    Parameters:
+        count (int): number of records to return
+
+    Returns:
+        list: planet dictionaries (string values)
+    """
+
+    gravity = {
+        planet['name']: planet['gravity'] for planet in utl.read_json(SWAPI_PLANETS_FILEPATH)
+    }
+    rows = []
+    for row in utl.read_csv_to_dicts(WOOKIEEPEDIA_PLANETS_FILEPATH):
+        row = dict(row)
+        row['gravity'] = gravity.get(row['name'], 'unknown')
+        rows.append(row)
+
+    return [rows[i % len(rows)] for i in range(count)]
+
+
+def create_synthetic_planets(planet_class, count):
+    """Returns a list of < count > planets of type < planet_class > populated with plausible,
+    distinct values.
+
+    Parameters:
+        planet_class (type): < swapi.Planet > or < DictPlanet >
+        count (int): number of planets to create
+
+    Returns:
+        list: planet instances
+    """
+
+    climate = ['temperate']
+    terrain = ['grasslands', 'mountains']
+    planets = []
+    for i in range(count):
+        planet = planet_class(f"https://swapi.py4e.com/api/planets/{i}/", f"Planet {i}")
+        planet.region = 'Outer Rim Territories'
+        planet.sector = 'Arkanis sector'
+        planet.suns = 1
+        planet.moons = i % 4
+        planet.orbital_period_days = 300.0 + i % 100
+        planet.diameter_km = 10000 + i
+        planet.gravity_std = 1.0
+        planet.climate = climate
+        planet.terrain = terrain
+        planet.population = i * 1000
+        planets.append(planet)
+
+    return planets
+
+
+def legacy_create_planet(data):
+    """The per-field < create_planet > implementation replaced by the compiled converter. Kept
+    as the baseline for < benchmark_planet_conversion >."""
+
+    new_instance = swapi.Planet(data, data['name'])
+
+    new_instance.suns = utl.convert_to_none(data['suns'])
+    if new_instance.suns is not None:
+        new_instance.suns = utl.convert_to_int(data['suns'])
+
+    new_instance.moons = utl.convert_to_none(data['moons'])
+    if new_instance.moons is not None:
+        new_instance.moons = utl.convert_to_int(data['moons'])
+
+    new_instance.orbital_period_days = utl.convert_to_none(data['orbital_period'])
+    if new_instance.orbital_period_days is not None:
+        new_instance.orbital_period_days = utl.convert_to_float(data['orbital_period'])
+
+    new_instance.diameter_km = utl.convert_to_none(data['diameter'])
+    if new_instance.diameter_km is not None:
+        new_instance.diameter_km = utl.convert_to_int(data['diameter'])
+
+    new_instance.gravity_std = utl.convert_to_none(data['gravity'])
+    if new_instance.gravity_std is not None:
+        new_instance.gravity_std = utl.convert_gravity_value(data['gravity'])
+
+    new_instance.climate = utl.convert_to_none(data['climate'])
+    if new_instance.climate is not None:
+        new_instance.climate = utl.convert_to_list(data['climate'], ', ')
+
+    new_instance.terrain = utl.convert_to_none(data['terrain'])
+    if new_instance.terrain is not None:
+        new_instance.terrain = utl.convert_to_list(data['terrain'], ', ')
+
+    new_instance.population = utl.convert_to_none(data['population'])
+    if new_instance.population is not None:
+        new_instance.population = utl.convert_to_int(data['population'])
+
+    new_instance.region = utl.convert_to_none(data['region'])
+    if new_instance.region is not None:
+        new_instance.region = data['region']
+
+    new_instance.sector = utl.convert_to_none(data['sector'])
+    if new_instance.sector is not None:
+        new_instance.sector = data['sector']
+
+    new_instance.url = utl.convert_to_none(data['url'])
+    if new_instance.url is not None:
+        new_instance.url = data['url']
+
+    return new_instance
+
+
+def measure_planet_rss(layout, count):
+    """Worker for < benchmark_planet_memory >: returns the peak RSS growth in bytes caused by
+    creating < count > planets using < layout > ('dict' or 'slots')."""
+
+    planet_class = DictPlanet if layout == 'dict' else swapi.Planet
+    before = get_peak_rss()
+    planets = create_synthetic_planets(planet_class, count)
+    after = get_peak_rss()
+    del planets
+
+    return after - before
+
+
+def run_entity_factory(count=ENTITY_COUNT):
+    """Runs < benchmark_entity_factory > and prints the throughput per run.
+
+    Parameters:
+        count (int): number of planet records
+
+    Returns:
+        None
+    """
+
+    results = benchmark_entity_factory(count)
+    print(f"entity_factory ({count:,} records, {results['cpus']} cpus)")
+    labels = ['serial', 'in_process'] + [f'pool_{workers}' for workers in ENTITY_WORKER_COUNTS]
+    for label in labels:
+        print(f"  {label:>10}: {results[label]:12,.0f} records/sec")
+    print(f"  identical: {results['identical']}")
+
+
+def run_jsonable(count=PERSON_COUNT):
+    """Runs < benchmark_jsonable > and prints the export times.
+
+    Parameters:
+        count (int): number of people
+
+    Returns:
+        None
+    """
+
+    results = benchmark_jsonable(count)
+    print(f"jsonable ({count:,} people, {results['planets']} shared homeworlds)")
+    for label in ('cold', 'warm', 'dirty'):
+        print(f"  {label:>5}: {results[label]:8.4f} sec")
+    print(f"  homeworlds shared: {results['shared']}")
+
+
+def run_planet_conversion(count=PLANET_COUNT):
+    """Runs < benchmark_planet_conversion > and prints the throughput per implementation.
+
+    Parameters:
+        count (int): number of planet records
+
+    Returns:
+        None
+    """
+
+    results = benchmark_planet_conversion(count)
+    print(f"planet_conversion ({count:,} records)")
+    for label in ('legacy', 'compiled'):
+        print(f"  {label:>8}: {results[label]:12,.0f} records/sec")
+    print(f"  speedup: {results['speedup']:.1f}x")
+
+
+def run_planet_memory(count=PLANET_COUNT):
+    """Runs < benchmark_planet_memory > and prints the RSS per layout.
+
+    Parameters:
+        count (int): number of planets
+
+    Returns:
+        None
+    """
+
+    results = benchmark_planet_memory(count)
+    print(f"planet_memory ({count:,} planets)")
+    for layout in ('dict', 'slots'):
+        print(
+            f"  {layout:>5}: {results[layout] / 2 ** 20:8.1f} MiB RSS "
+            f"({results[f'{layout}_per_instance']:.0f} bytes/planet)"
+        )
@@ -0,0 +1,328 @@
+import random
+import time
+import sw_utils as utl
+import swapi
+from .common import EPISODES_FILEPATH
+
+
+# Constants
+CATALOG_COUNT = 10_000_000
+CATALOG_DIRECTORS = 1_000
+CATALOG_LEGACY_COUNT = 100_000
+EPISODE_COUNT = 100_000
+LEGACY_DIRECTORS = [
+    'Dave Bullock', 'Dave Filoni', "Brian Kalin O'Connell", 'Justin Ridge', 'Rob Coleman',
+    'Jesse Yeh', 'Atsushi Takeuchi', 'Steward Lee', 'Giancarlo Volpe', 'Robert Dalva',
+    'Kyle Dunlevy'
+]
+VIEWERSHIP_COUNT = 1_000_000
+VIEWERSHIP_TOP_K = 10
+
+
+def benchmark_director_counts(count=CATALOG_COUNT, legacy_count=CATALOG_LEGACY_COUNT):
+    """Times < swapi.count_episodes_by_director > (< sw_utils.count_by >) over a synthetic,
+    streamed catalog of < count > episodes with < CATALOG_DIRECTORS > directors, and compares it
+    with < legacy_count_episodes_by_director > on < legacy_count > episodes drawn from the eleven
+    directors the legacy implementation recognizes.
+
+    Parameters:
+        count (int): number of catalog episodes counted by the current implementation
+        legacy_count (int): number of episodes used for the legacy comparison
+
+    Returns:
+        dict: 'catalog' (seconds for < count > episodes), 'legacy' and 'current' (seconds for
+              < legacy_count > episodes), 'directors' (distinct directors counted)
+    """
+
+    results = {}
+    legacy_episodes = list(create_episode_catalog(legacy_count, LEGACY_DIRECTORS))
+    for label, count_directors in (
+        ('legacy', legacy_count_episodes_by_director), ('current', swapi.count_episodes_by_director)
+    ):
+        start = time.perf_counter()
+        counts = count_directors(legacy_episodes)
+        results[label] = time.perf_counter() - start
+        results[f'{label}_total'] = sum(counts.values())
+
+    directors = [f"Director {i}" for i in range(CATALOG_DIRECTORS)]
+    start = time.perf_counter()
+    counts = swapi.count_episodes_by_director(create_episode_catalog(count, directors))
+    results['catalog'] = time.perf_counter() - start
+    results['directors'] = len(counts)
+
+    return results
+
+
+def benchmark_episode_conversion(count=EPISODE_COUNT):
+    """Compares the time taken by < legacy_convert_episode_values > (per-cell conversions) and
+    the column-at-a-time < swapi.convert_episode_values > to convert < count > episode rows
+    cycled from clone_wars_episodes.csv.
+
+    Parameters:
+        count (int): number of episode rows to convert
+
+    Returns:
+        dict: seconds per implementation plus the speedup
+    """
+
+    rows = utl.read_csv_to_dicts(EPISODES_FILEPATH)
+    results = {}
+    implementations = (
+        ('legacy', legacy_convert_episode_values), ('columnar', swapi.convert_episode_values)
+    )
+    for label, convert in implementations:
+        episodes = [dict(rows[i % len(rows)]) for i in range(count)]
+        start = time.perf_counter()
+        convert(episodes)
+        results[label] = time.perf_counter() - start
+
+    results['speedup'] = results['legacy'] / results['columnar']
+    return results
+
+
+def benchmark_viewership_extrema(count=VIEWERSHIP_COUNT, k=VIEWERSHIP_TOP_K):
+    """Compares the two scans made by < legacy_get_least_viewed_episode > and
+    < legacy_get_most_viewed_episode > with the single pass made by
+    < swapi.get_viewership_extrema > over a list of < count > synthetic episodes, then times
+    the < k > most and least viewed episodes of a streamed catalog of the same size.
+
+    Parameters:
+        count (int): number of episodes
+        k (int): number of episodes kept per side for the streamed catalog
+
+    Returns:
+        dict: 'legacy', 'current' and 'streamed' (seconds), 'identical' (bool)
+    """
+
+    results = {}
+    episodes = list(create_viewership_catalog(count))
+
+    start = time.perf_counter()
+    legacy = (legacy_get_least_viewed_episode(episodes), legacy_get_most_viewed_episode(episodes))
+    results['legacy'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    least_viewed, most_viewed = swapi.get_viewership_extrema(episodes)
+    results['current'] = time.perf_counter() - start
+    results['identical'] = legacy[0] is least_viewed[0] and legacy[1] is most_viewed[0]
+
+    del episodes
+    start = time.perf_counter()
+    swapi.get_viewership_extrema(create_viewership_catalog(count), k)
+    results['streamed'] = time.perf_counter() - start
+
+    return results
+
+
+def create_episode_catalog(count, directors, pool_size=10_000):
+    """Yields < count > synthetic episode dictionaries whose "episode_director" values are drawn
+    at random from < directors >. A pool of < pool_size > episodes is generated once and cycled
+    so that arbitrarily large catalogs can be streamed in constant memory.
+
+    Parameters:
+        count (int): number of episodes to yield
+        directors (list): director names
+        pool_size (int): number of distinct episode dictionaries
+
+    Returns:
+        generator: episode dictionaries
+    """
+
+    rng = random.Random(506)
+    template = utl.read_csv_to_dicts(EPISODES_FILEPATH)[0]
+    pool = [{**template, 'episode_director': rng.choice(directors)} for i in range(pool_size)]
+    for i in range(count):
+        yield pool[i % pool_size]
+
+
+def create_viewership_catalog(count, pool_size=10_000):
+    """Yields < count > synthetic episode dictionaries with random "episode_us_viewers_mm"
+    values between 0.5 and 4.99 million; roughly one in ten has no viewership data. A pool of
+    < pool_size > episodes is generated once and cycled (see < create_episode_catalog >).
+
+    Parameters:
+        count (int): number of episodes to yield
+        pool_size (int): number of distinct episode dictionaries
+
+    Returns:
+        generator: episode dictionaries
+    """
+
+    rng = random.Random(506)
+    template = utl.read_csv_to_dicts(EPISODES_FILEPATH)[0]
+    pool = []
+    for i in range(pool_size):
+        viewers = None if rng.random() < 0.1 else round(rng.uniform(0.5, 4.99), 2)
+        pool.append({**template, 'episode_us_viewers_mm': viewers})
+    for i in range(count):
+        yield pool[i % pool_size]
+
+
+def legacy_convert_episode_values(episodes):
+    """The per-cell < convert_episode_values > implementation replaced by the column-at-a-time
+    conversion. Kept as the baseline for < benchmark_episode_conversion >."""
+
+    for episode in episodes:
+        for key in episode:
+            if not episode[key]:
+                episode[key] = None
+            if episode['series_season_num']:
+                episode['series_season_num'] = utl.convert_to_int(episode['series_season_num'])
+            if episode['series_episode_num']:
+                episode['series_episode_num'] = utl.convert_to_int(episode['series_episode_num'])
+            if episode['season_episode_num']:
+                episode['season_episode_num'] = utl.convert_to_int(episode['season_episode_num'])
+            if episode['episode_prod_code']:
+                episode['episode_prod_code'] = utl.convert_to_float(episode['episode_prod_code'])
+            if episode['episode_us_viewers_mm']:
+                episode['episode_us_viewers_mm'] = utl.convert_to_float(episode['episode_us_viewers_mm'])
+            if episode['episode_writers']:
+                episode['episode_writers'] = utl.convert_to_list(episode['episode_writers'],', ')
+    return episodes
+
+
+def legacy_count_episodes_by_director(episodes):
+    """The if/elif < count_episodes_by_director > implementation replaced by < sw_utils.count_by >.
+    Kept as the baseline for < benchmark_director_counts >; only the eleven hardcoded
+    directors are counted."""
+
+    name_accum = []
+    count_accum = []
+    Bullock = 0
+    Filoni = 0
+    Connell = 0
+    Ridge = 0
+    Coleman = 0
+    Yeh = 0
+    Takeuchi = 0
+    Lee = 0
+    Volpe = 0
+    Dalva = 0
+    Dunlevy = 0
+    for episode in episodes:
+        for key in episode:
+            if episode['episode_director'] in name_accum:
+                continue
+            else:
+                name_accum.append(episode['episode_director'])
+    for episode in episodes:
+        if 'Dave Bullock' in episode['episode_director']:
+            Bullock = Bullock + 1
+        elif 'Dave Filoni' in episode['episode_director']:
+            Filoni = Filoni + 1
+        elif "Brian Kalin O'Connell" in episode['episode_director']:
+            Connell = Connell + 1
+        elif "Justin Ridge" in episode['episode_director']:
+            Ridge = Ridge + 1
+        elif 'Rob Coleman' in episode['episode_director']:
+            Coleman = Coleman + 1
+        elif 'Jesse Yeh' in episode['episode_director']:
+            Yeh = Yeh + 1
+        elif 'Atsushi Takeuchi' in episode['episode_director']:
+            Takeuchi = Takeuchi + 1
+        elif 'Steward Lee' in episode['episode_director']:
+            Lee = Lee + 1
+        elif 'Giancarlo Volpe' in episode['episode_director']:
+            Volpe = Volpe + 1
+        elif 'Robert Dalva' in episode['episode_director']:
+            Dalva = Dalva + 1
+        elif 'Kyle Dunlevy' in episode['episode_director']:
+            Dunlevy = Dunlevy +1
+    count_accum.append(Bullock)
+    count_accum.append(Filoni)
+    count_accum.append(Connell)
+    count_accum.append(Ridge)
+    count_accum.append(Coleman)
+    count_accum.append(Yeh)
+    count_accum.append(Takeuchi)
+    count_accum.append(Lee)
+    count_accum.append(Volpe)
+    count_accum.append(Dalva)
+    count_accum.append(Dunlevy)
+    director_dict = dict(zip(name_accum,count_accum))
+    return(director_dict)
+
+
+def legacy_get_least_viewed_episode(episodes):
+    """The sentinel-based < get_least_viewed_episode > implementation replaced by
+    < sw_utils.top_k >. Kept as the baseline for < benchmark_viewership_extrema >."""
+
+    mini = []
+    i = 5.0
+    for episode in episodes:
+        if swapi.has_viewer_data(episode):
+            if episode['episode_us_viewers_mm'] < i:
+                mini.clear()
+                i = episode['episode_us_viewers_mm']
+                mini.append(episode)
+    return mini[0]
+
+
+def legacy_get_most_viewed_episode(episodes):
+    """The sentinel-based < get_most_viewed_episode > implementation replaced by
+    < sw_utils.top_k >. Kept as the baseline for < benchmark_viewership_extrema >."""
+
+    maxi = []
+    i = 0
+    for episode in episodes:
+        if swapi.has_viewer_data(episode):
+            if episode['episode_us_viewers_mm'] > i:
+                maxi.clear()
+                i = episode['episode_us_viewers_mm']
+                maxi.append(episode)
+    return maxi[0]
+
+
+def run_director_counts(count=CATALOG_COUNT):
+    """Runs < benchmark_director_counts > and prints the counting times.
+
+    Parameters:
+        count (int): number of catalog episodes
+
+    Returns:
+        None
+    """
+
+    results = benchmark_director_counts(count)
+    print(f"director_counts ({CATALOG_LEGACY_COUNT:,} episodes)")
+    for label in ('legacy', 'current'):
+        print(f"  {label:>8}: {results[label]:8.3f} sec ({results[f'{label}_total']:,} counted)")
+    print(
+        f"director_counts ({count:,} streamed episodes, {results['directors']:,} directors): "
+        f"{results['catalog']:.3f} sec"
+    )
+
+
+def run_episode_conversion(count=EPISODE_COUNT):
+    """Runs < benchmark_episode_conversion > and prints the time per implementation.
+
+    Parameters:
+        count (int): number of episode rows
+
+    Returns:
+        None
+    """
+
+    results = benchmark_episode_conversion(count)
+    print(f"episode_conversion ({count:,} episodes)")
+    for label in ('legacy', 'columnar'):
+        print(f"  {label:>8}: {results[label]:8.3f} sec")
+    print(f"  speedup: {results['speedup']:.1f}x")
+
+
+def run_viewership_extrema(count=VIEWERSHIP_COUNT):
+    """Runs < benchmark_viewership_extrema > and prints the scan times.
+
+    Parameters:
+        count (int): number of episodes
+
+    Returns:
+        None
+    """
+
+    results = benchmark_viewership_extrema(count)
+    print(f"viewership_extrema ({count:,} episodes)")
+    for label in ('legacy', 'current'):
+        print(f"  {label:>8}: {results[label]:8.3f} sec")
+    print(f"  identical: {results['identical']}")
+    print(f"  streamed top {VIEWERSHIP_TOP_K}: {results['streamed']:8.3f} sec")
@@ -0,0 +1,162 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import sw_utils as utl
+import swapi
+
+
+# Constants
+FLEET_EXPORT_MEMBER_COUNT = 100_000
+FLEET_MEMBER_COUNT = 1_000_000
+FLEET_SHIP_COUNT = 10_000
+
+
+def benchmark_fleet_export(count=FLEET_EXPORT_MEMBER_COUNT, ships=FLEET_SHIP_COUNT):
+    """Compares exporting a synced < swapi.FleetManifest > of < count > people aboard < ships >
+    starships with < sw_utils.write_json > of the list of < Starship.jsonable() >
+    representations and with the streaming < swapi.write_fleet_json >. Each export runs twice
+    on a freshly built fleet (jsonable() caches its dictionaries): once timed and once with
+    tracemalloc tracing its peak memory allocation, which would distort the timing.
+
+    Parameters:
+        count (int): number of people assigned
+        ships (int): number of starships
+
+    Returns:
+        dict: 'jsonable' and 'streamed' (seconds), '<label>_peak' (bytes), 'identical' (bool)
+    """
+
+    def create_fleet():
+        starships, assignments = create_fleet_assignments(count, ships)
+        manifest = swapi.FleetManifest(starships)
+        manifest.assign(assignments)
+        manifest.sync()
+        return starships
+
+    def export_jsonable(filepath, starships):
+        utl.write_json(filepath, [starship.jsonable() for starship in starships])
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepaths = {}
+        for label, export in (('jsonable', export_jsonable), ('streamed', swapi.write_fleet_json)):
+            filepaths[label] = os.path.join(tmp_dir, f'{label}.json')
+            starships = create_fleet()
+            start = time.perf_counter()
+            export(filepaths[label], starships)
+            results[label] = time.perf_counter() - start
+
+            starships = create_fleet()
+            tracemalloc.start()
+            export(filepaths[label], starships)
+            results[f'{label}_peak'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del starships
+
+        with open(filepaths['jsonable'], 'rb') as file_obj:
+            expected = file_obj.read()
+        with open(filepaths['streamed'], 'rb') as file_obj:
+            results['identical'] = file_obj.read() == expected
+
+    return results
+
+
+def benchmark_fleet_manifest(count=FLEET_MEMBER_COUNT, ships=FLEET_SHIP_COUNT):
+    """Times a < swapi.FleetManifest > batch that assigns < count > synthetic people to
+    < ships > synthetic starships (a pilot, a copilot and passengers per starship), the sync
+    that assigns < Crew > and < Passengers > instances to every starship, and < count >
+    membership queries.
+
+    Parameters:
+        count (int): number of people assigned
+        ships (int): number of starships
+
+    Returns:
+        dict: 'assign', 'sync' and 'query' (seconds), 'posted' (members posted)
+    """
+
+    starships, assignments = create_fleet_assignments(count, ships)
+    results = {}
+    manifest = swapi.FleetManifest(starships)
+    start = time.perf_counter()
+    manifest.assign(assignments)
+    results['assign'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manifest.sync()
+    results['sync'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ship_url, person, role in assignments:
+        manifest.is_aboard(person.url, ship_url)
+    results['query'] = time.perf_counter() - start
+    results['posted'] = len(manifest)
+
+    return results
+
+
+def create_fleet_assignments(count, ships):
+    """Returns < ships > synthetic < swapi.Starship > instances and < count > assignments of
+    synthetic < swapi.Person > instances to them (see < swapi.FleetManifest.assign >): about
+    one in five people is assigned a pilot or copilot role, the rest board as passengers.
+
+    Parameters:
+        count (int): number of people assigned
+        ships (int): number of starships
+
+    Returns:
+        tuple: (list of starships, list of (starship url, person, role) assignments)
+    """
+
+    rng = random.Random(506)
+    starships = [
+        swapi.Starship(f"https://swapi.py4e.com/api/starships/{i}/", f"Starship {i}", 'model', 'A')
+        for i in range(ships)
+    ]
+    people = [
+        swapi.Person(f"https://swapi.py4e.com/api/people/{i}/", f"Person {i}", '19BBY')
+        for i in range(count)
+    ]
+    roles = ('pilot', 'copilot') + (None,) * 8
+    assignments = [(rng.choice(starships).url, person, rng.choice(roles)) for person in people]
+
+    return starships, assignments
+
+
+def run_fleet_export(count=FLEET_EXPORT_MEMBER_COUNT):
+    """Runs < benchmark_fleet_export > and prints the time and peak memory per export.
+
+    Parameters:
+        count (int): number of people assigned
+
+    Returns:
+        None
+    """
+
+    results = benchmark_fleet_export(count)
+    print(f"fleet_export ({count:,} people, {FLEET_SHIP_COUNT:,} starships)")
+    for label in ('jsonable', 'streamed'):
+        print(
+            f"  {label:>8}: {results[label]:8.3f} sec, "
+            f"peak {results[f'{label}_peak'] / 2 ** 20:8.1f} MiB"
+        )
+    print(f"  identical: {results['identical']}")
+
+
+def run_fleet_manifest(count=FLEET_MEMBER_COUNT):
+    """Runs < benchmark_fleet_manifest > and prints the time per phase.
+
+    Parameters:
+        count (int): number of people assigned
+
+    Returns:
+        None
+    """
+
+    results = benchmark_fleet_manifest(count)
+    print(f"fleet_manifest ({count:,} people, {FLEET_SHIP_COUNT:,} starships)")
+    for label in ('assign', 'sync', 'query'):
+        print(f"  {label:>6}: {results[label]:8.3f} sec")
+    print(f"  posted: {results['posted']:,}")
@@ -0,0 +1,120 @@
+import os
+import tempfile
+import sw_json
+import sw_utils as utl
+from .common import JSON_SOURCES, stdlib_read_json, stdlib_write_json, time_best
+
+
+# Constants
+JSON_SCALE = 1000
+
+
+def benchmark_json_io(scale=JSON_SCALE, repeat=3):
+    """Compares the standard library json module with < sw_json > (backend < JSON_BACKEND >) when
+    reading and writing each file in < JSON_SOURCES > scaled up < scale > times (the list of
+    entities repeated). Writes use the fixture settings (ensure_ascii=False, indent=2) and the
+    outputs of the two implementations are checked to be byte-identical. The best of
+    < repeat > runs is reported.
+
+    Parameters:
+        scale (int): number of times each source list is repeated
+        repeat (int): number of timed runs per measurement
+
+    Returns:
+        dict: source name -> {'mib', 'json_read', 'fast_read', 'json_write', 'fast_write'}
+              (seconds) plus 'identical' (bool)
+    """
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, filepath in JSON_SOURCES.items():
+            data = utl.read_json(filepath) * scale
+            source = os.path.join(tmp_dir, f"{name}.json")
+            json_target = os.path.join(tmp_dir, f"{name}-json.json")
+            fast_target = os.path.join(tmp_dir, f"{name}-fast.json")
+            stdlib_write_json(source, data)
+
+            result = {'mib': os.path.getsize(source) / 2 ** 20}
+            result['json_read'] = time_best(repeat, stdlib_read_json, source)
+            result['fast_read'] = time_best(repeat, sw_json.read_json, source)
+            result['json_write'] = time_best(repeat, stdlib_write_json, json_target, data)
+            result['fast_write'] = time_best(repeat, sw_json.write_json, fast_target, data)
+
+            with open(json_target, 'rb') as json_obj, open(fast_target, 'rb') as fast_obj:
+                result['identical'] = json_obj.read() == fast_obj.read()
+            results[name] = result
+
+    return results
+
+
+def benchmark_lazy_json(scale=JSON_SCALE, repeat=3):
+    """Compares fully decoding a large planet fixture (< sw_json.read_json >) with indexing it
+    through a memory-mapped < sw_json.JsonDocument > to fetch a single planet. The fixture has
+    the shape of PS10's fxt_planets_biggest_smallest.json with each list holding the
+    swapi_planets.json entities repeated < scale > times. "first" fetches doc['biggest'][0];
+    "last" fetches doc['smallest'][-1], which requires skipping (but not decoding) the rest.
+
+    Parameters:
+        scale (int): number of times the planet list is repeated in each bucket
+        repeat (int): number of timed runs per measurement
+
+    Returns:
+        dict: 'mib' plus seconds for 'full', 'lazy_first' and 'lazy_last'
+    """
+
+    planets = utl.read_json(JSON_SOURCES['planets'])
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, 'planets_biggest_smallest.json')
+        stdlib_write_json(filepath, {'biggest': planets * scale, 'smallest': planets * scale})
+
+        def read_full():
+            return sw_json.read_json(filepath)['biggest'][0]
+
+        def read_lazy(bucket, index):
+            with sw_json.JsonDocument(filepath) as doc:
+                return doc[bucket][index].decode()
+
+        assert read_full() == read_lazy('biggest', 0)
+        results = {'mib': os.path.getsize(filepath) / 2 ** 20}
+        results['full'] = time_best(repeat, read_full)
+        results['lazy_first'] = time_best(repeat, read_lazy, 'biggest', 0)
+        results['lazy_last'] = time_best(repeat, read_lazy, 'smallest', -1)
+
+    return results
+
+
+def run_json_io(scale=JSON_SCALE):
+    """Runs < benchmark_json_io > and prints the read/write times per source.
+
+    Parameters:
+        scale (int): number of times each source list is repeated
+
+    Returns:
+        None
+    """
+
+    results = benchmark_json_io(scale)
+    print(f"json_io ({scale:,}x, json vs {sw_json.JSON_BACKEND})")
+    for name, result in results.items():
+        print(
+            f"  {name:>8} ({result['mib']:.1f} MiB): "
+            f"read {result['json_read']:.3f} / {result['fast_read']:.3f} sec, "
+            f"write {result['json_write']:.3f} / {result['fast_write']:.3f} sec, "
+            f"identical: {result['identical']}"
+        )
+
+
+def run_lazy_json(scale=JSON_SCALE):
+    """Runs < benchmark_lazy_json > and prints the full and lazy read times.
+
+    Parameters:
+        scale (int): number of times each source list is repeated
+
+    Returns:
+        None
+    """
+
+    results = benchmark_lazy_json(scale)
+    print(f"lazy_json ({scale:,}x, {results['mib']:.1f} MiB)")
+    for label in ('full', 'lazy_first', 'lazy_last'):
+        print(f"  {label:>10}: {results[label]:8.4f} sec")
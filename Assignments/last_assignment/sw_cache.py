@@ -0,0 +1,289 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+import sw_json
+
+
+# Constants
+CACHE_FILEPATH = '.swapi_cache.sqlite'
+CACHE_MAX_BYTES = 64 * 1024 * 1024 # 64 MiB of stored response bodies
+CACHE_DEFAULT_TTL = 7 * 24 * 60 * 60 # one week, in seconds
+CACHE_ACCESS_FLUSH_SIZE = 256 # hits whose access times are written to the database at once
+
+
+class SwapiCache:
+    """Persistent SQLite-backed cache of decoded SWAPI responses.
+
+    Entries are keyed on the request URL plus its querystring < params > and hold the JSON
+    response body. Each entry expires after the time-to-live (TTL) configured for its resource
+    category (e.g., "planets", "people"). When the total size of the stored bodies (UTF-8
+    bytes) exceeds < max_bytes > the least recently used entries are evicted. Hits do not write
+    to the database: their access times are held in memory and written in one batch every
+    < CACHE_ACCESS_FLUSH_SIZE > hits, before an eviction, and on < close() >.
+
+    Attributes:
+        filepath (str): location of the SQLite database (':memory:' for a transient cache)
+        max_bytes (int): size cap applied to the sum of the stored response bodies
+        default_ttl (float): TTL in seconds applied to resources without an explicit TTL
+        ttls (dict): per-resource TTLs in seconds, e.g., {'planets': 86400}; None never expires
+        hits (int): number of lookups served from the cache
+        misses (int): number of lookups not found in the cache (or expired)
+        evictions (int): number of entries removed to honor < max_bytes >
+
+    Methods:
+        clear: remove all entries
+        close: close the underlying database connection
+        get: return a cached response or None
+        make_key: build the cache key for a url and params
+        set: store a response
+        stats: return the hit/miss/eviction counters and current size
+    """
+
+    def __init__(self, filepath=CACHE_FILEPATH, max_bytes=CACHE_MAX_BYTES,
+                 default_ttl=CACHE_DEFAULT_TTL, ttls=None):
+        """Initialize a SwapiCache instance, creating the database table if required."""
+
+        self.filepath = filepath
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = ttls if ttls else {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._accessed = {} # key -> access time of hits not yet written to the database
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                resource TEXT,
+                body TEXT,
+                size INTEGER,
+                stored_at REAL,
+                accessed_at REAL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"SwapiCache({self.filepath}): {self.hits} hits, {self.misses} misses"
+
+    def clear(self):
+        """Removes all entries from the cache. Counters are left unchanged.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._accessed.clear()
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        """Writes pending access times and closes the underlying database connection.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._flush_accessed()
+            self._conn.commit()
+            self._conn.close()
+
+    def get(self, url, params=None):
+        """Returns the cached, decoded response for < url > and < params > if present and not
+        expired; otherwise returns None. Expired entries are deleted on access. A hit refreshes
+        the entry's position in the LRU order (written to the database later; see
+        < SwapiCache >).
+
+        Parameters:
+            url (str): a url that specifies the resource
+            params (dict): optional dictionary of querystring arguments
+
+        Returns:
+            dict: decoded response or None
+        """
+
+        key = self.make_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT resource, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            resource, body, stored_at = row
+            ttl = self.ttls.get(resource, self.default_ttl)
+            if ttl is not None and now - stored_at > ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._accessed[key] = now
+            if len(self._accessed) >= CACHE_ACCESS_FLUSH_SIZE:
+                self._flush_accessed()
+                self._conn.commit()
+            self.hits += 1
+
+        return sw_json.loads(body)
+
+    def make_key(self, url, params=None):
+        """Returns the cache key for a request. Delegates to < make_request_key >.
+
+        Parameters:
+            url (str): a url that specifies the resource
+            params (dict): optional dictionary of querystring arguments
+
+        Returns:
+            str: cache key
+        """
+
+        return make_request_key(url, params)
+
+    def set(self, url, params, data):
+        """Stores the decoded response < data > for < url > and < params >, then evicts least
+        recently used entries until the stored bodies fit within < max_bytes >. Callers store
+        successful (2xx) responses only (see < sw_utils.fetch_swapi_resource >).
+
+        Parameters:
+            url (str): a url that specifies the resource
+            params (dict): optional dictionary of querystring arguments
+            data (dict): decoded response
+
+        Returns:
+            None
+        """
+
+        key = self.make_key(url, params)
+        body = json.dumps(data, ensure_ascii=False)
+        now = time.time()
+        size = len(body.encode('utf-8'))
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, get_resource_name(url), body, size, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        """Returns the cache counters and current size.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: hits, misses, evictions, entries and bytes
+        """
+
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': entries,
+            'bytes': size
+        }
+
+    def _evict(self):
+        """Deletes least recently used entries until the total size is within < max_bytes >.
+        Caller must hold the lock."""
+
+        if self.max_bytes is None:
+            return
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        self._flush_accessed() # LRU order must reflect recent hits
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def _flush_accessed(self):
+        """Writes the pending hit access times in one batch (committed by the caller). Caller
+        must hold the lock."""
+
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+
+def get_resource_name(url):
+    """Returns the SWAPI resource category named in a < url >, i.e., the path segment that
+    follows "api" (e.g., "https://swapi.py4e.com/api/planets/1/" -> "planets"). Returns None if
+    no category can be found.
+
+    Parameters:
+        url (str): a url that specifies the resource
+
+    Returns:
+        str: resource category name or None
+    """
+
+    segments = [segment for segment in urlsplit(url).path.split('/') if segment]
+    if 'api' in segments:
+        index = segments.index('api') + 1
+        if index < len(segments):
+            return segments[index]
+
+    return None
+
+
+def make_request_key(url, params=None):
+    """Returns a canonical key for a SWAPI request. Repeated slashes in the url path are
+    collapsed (e.g., "api//planets/" -> "api/planets/"), the path is given the trailing slash
+    SWAPI uses (e.g., "api/planets/1" -> "api/planets/1/") and the < params > are sorted so
+    that equivalent requests share a key.
+
+    Parameters:
+        url (str): a url that specifies the resource
+        params (dict): optional dictionary of querystring arguments
+
+    Returns:
+        str: request key
+    """
+
+    parts = urlsplit(url)
+    path = re.sub(r'/{2,}', '/', parts.path).rstrip('/') + '/'
+    url = urlunsplit(parts._replace(path=path))
+    if params:
+        return f"{url}?{json.dumps(params, sort_keys=True)}"
+    else:
+        return url
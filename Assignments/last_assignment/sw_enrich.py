@@ -0,0 +1,116 @@
+import sw_utils as utl
+from sw_store import normalize_name
+
+
+# Constants
+WOOKIEEPEDIA_SOURCES = {
+    'droids': 'wookieepedia_droids.json',
+    'people': 'wookieepedia_people.json',
+    'planets': 'wookieepedia_planets.csv',
+    'starships': 'wookieepedia_starships.csv'
+}
+
+
+class Enricher:
+    """Merges Wookieepedia supplemental data into SWAPI records.
+
+    Each supplemental file is read once and indexed by normalized name (see
+    < sw_store.normalize_name >). Records are then enriched with a single dictionary lookup
+    apiece, so enriching n records against m supplements costs O(n + m) rather than the
+    O(n * m) of rescanning the supplement list for every record.
+
+    Attributes:
+        indexes (dict): kind (e.g., "planets") -> {normalized name: supplement dictionary}
+
+    Methods:
+        enrich: merge supplements into a stream of records (generator)
+        lookup: return the supplement for a name
+        merge: return a record merged with its supplement
+    """
+
+    def __init__(self, sources=None):
+        """Initialize an Enricher instance. Reads and indexes each supplemental file named in
+        < sources > (kind -> filepath); defaults to < WOOKIEEPEDIA_SOURCES >. CSV files are read
+        lazily with < sw_utils.iter_csv_dicts >, all others with < sw_utils.read_json >."""
+
+        if sources is None:
+            sources = WOOKIEEPEDIA_SOURCES
+
+        self.indexes = {}
+        for kind, filepath in sources.items():
+            if filepath.endswith('.csv'):
+                records = utl.iter_csv_dicts(filepath)
+            else:
+                records = utl.read_json(filepath)
+            self.indexes[kind] = index_by_name(records)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        counts = ', '.join(f"{kind}: {len(index)}" for kind, index in self.indexes.items())
+        return f"Enricher({counts})"
+
+    def enrich(self, kind, records):
+        """Yields each record in < records > merged with its < kind > supplement (see < merge >).
+        Accepts any iterable, including the generator returned by
+        < sw_utils.iter_swapi_category >, and consumes it in a single pass.
+
+        Parameters:
+            kind (str): supplement kind, e.g., "planets"
+            records (iterable): SWAPI entity dictionaries
+
+        Returns:
+            generator: merged entity dictionaries
+        """
+
+        index = self.indexes[kind]
+        for record in records:
+            supplement = index.get(normalize_name(record['name']))
+            if supplement:
+                yield {**record, **supplement}
+            else:
+                yield record.copy()
+
+    def lookup(self, kind, name):
+        """Returns the < kind > supplement whose normalized name matches < name > or None.
+
+        Parameters:
+            kind (str): supplement kind, e.g., "starships"
+            name (str): entity name
+
+        Returns:
+            dict: supplement dictionary or None
+        """
+
+        return self.indexes[kind].get(normalize_name(name))
+
+    def merge(self, kind, record):
+        """Returns a new dictionary combining < record > with its < kind > supplement. Supplement
+        values take precedence over record values (e.g., the Wookieepedia "url"). If no
+        supplement exists a copy of < record > is returned. < record > is not mutated.
+
+        Parameters:
+            kind (str): supplement kind, e.g., "people"
+            record (dict): SWAPI entity dictionary
+
+        Returns:
+            dict: merged entity dictionary
+        """
+
+        return next(self.enrich(kind, [record]))
+
+
+def index_by_name(records, key='name'):
+    """Returns a dictionary that maps each record's normalized < key > value to the record. If
+    two records share a normalized name the later record wins, matching the outcome of applying
+    every match in turn with < dict.update() >.
+
+    Parameters:
+        records (iterable): dictionaries to index
+        key (str): name of the key holding the record name
+
+    Returns:
+        dict: normalized name -> record
+    """
+
+    return {normalize_name(record[key]): record for record in records}
@@ -0,0 +1,547 @@
+import json
+import math
+import mmap
+import os
+import re
+
+try:
+    import orjson # optional; fastest reader and writer
+except ImportError:
+    orjson = None
+try:
+    import simdjson # optional; reader only
+except ImportError:
+    simdjson = None
+try:
+    import ujson # optional; reader only (its writer formats floats and slashes differently)
+except ImportError:
+    ujson = None
+
+
+# Constants
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+    _fast_loads = orjson.loads
+elif simdjson is not None:
+    JSON_BACKEND = 'simdjson'
+    _fast_loads = simdjson.loads
+elif ujson is not None:
+    JSON_BACKEND = 'ujson'
+    _fast_loads = ujson.loads
+else:
+    JSON_BACKEND = 'json'
+    _fast_loads = None
+
+# orjson and json disagree on the text of very large and very small floats (e.g., 1e16 vs
+# 1e+16, 0.00001 vs 1e-05); see _has_float_mismatch().
+_EXPONENT = re.compile(rb'e-?[0-9]')
+_LINE_SEPARATOR = os.linesep.encode('ascii') # newline written by json in text mode
+
+# Byte-level scanners used by the lazy document classes to skip values without decoding them.
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_BRACKET = re.compile(rb'[\[\]{}]')
+_SCALAR = re.compile(rb'[^,\]}\s]+')
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_UTF8 = ('utf-8', 'utf8')
+
+
+class JsonDocument:
+    """Read-only, lazily decoded view of a JSON file.
+
+    The file is memory-mapped rather than read, and nothing is decoded up front. Indexing the
+    document (e.g., doc['biggest'][0]) scans the raw bytes only as far as the requested object
+    member or array element (earlier siblings are skipped, not decoded) and decodes only the
+    value that is returned. Containers are returned as < LazyJsonObject > / < LazyJsonArray >
+    views; scalars are returned decoded. Call < decode > on a view (or compare it with == ) to
+    obtain the equivalent Python object.
+
+    Attributes:
+        filepath (str): the path to the file
+        root (obj): < LazyJsonObject >, < LazyJsonArray >, or the decoded top-level scalar
+
+    Methods:
+        close: release the memory map and the file
+        decode: decode the whole document
+    """
+
+    def __init__(self, filepath):
+        """Initialize a JsonDocument instance, memory-mapping < filepath >."""
+
+        self.filepath = filepath
+        self._file_obj = open(filepath, 'rb')
+        try:
+            self._buffer = mmap.mmap(self._file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError: # empty file
+            self._file_obj.close()
+            raise
+
+        start = _WHITESPACE.match(self._buffer, 0).end()
+        end = len(self._buffer)
+        while end > start and self._buffer[end - 1:end] in b' \t\n\r':
+            end -= 1
+        self.root = _make_node(self._buffer, start, end)
+
+    def __contains__(self, key):
+        return key in self.root
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getitem__(self, key):
+        return self.root[key]
+
+    def __len__(self):
+        return len(self.root)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"JsonDocument: {self.filepath}"
+
+    def close(self):
+        """Releases the memory map and closes the file. Views obtained from the document can
+        no longer be used."""
+
+        if not self._file_obj.closed:
+            self._buffer.close()
+            self._file_obj.close()
+
+    def decode(self):
+        """Decodes and returns the whole document."""
+
+        return _decode(self.root)
+
+
+class LazyJsonArray:
+    """Lazily decoded view of a JSON array held in a < JsonDocument >. Element offsets are
+    located on demand, scanning no further than the highest index requested so far (negative
+    indexes, slices, len() and iteration scan to the end), and cached.
+
+    Methods:
+        decode: decode the whole array
+    """
+
+    def __init__(self, buffer, start, end=None):
+        """Initialize a LazyJsonArray instance for the array beginning at buffer[start]. The
+        < end > offset is located when first needed if not provided."""
+
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._starts = [] # element offsets located so far
+        self._position = _WHITESPACE.match(buffer, start + 1).end() # scan resume point
+        self._complete = False
+
+    def __eq__(self, other):
+        return self.decode() == _decode(other)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            self._scan()
+            starts = self._starts[index]
+        else:
+            self._scan(index + 1)
+            starts = self._starts[index] # IndexError if out of range
+
+        if isinstance(index, slice):
+            return [_make_node(self._buffer, start) for start in starts]
+
+        return _make_node(self._buffer, starts)
+
+    def __iter__(self):
+        index = 0
+        while True:
+            self._scan(index + 1)
+            if index >= len(self._starts):
+                return
+            yield _make_node(self._buffer, self._starts[index])
+            index += 1
+
+    def __len__(self):
+        self._scan()
+        return len(self._starts)
+
+    def __repr__(self):
+        return f"LazyJsonArray({len(self)} elements)"
+
+    def decode(self):
+        """Decodes and returns the array as a list."""
+
+        if self._end is None:
+            self._end = _skip_value(self._buffer, self._start)
+
+        return loads(self._buffer[self._start:self._end])
+
+    def _scan(self, count=None):
+        """Locates element offsets until < count > are known or the array ends (count=None
+        scans to the end)."""
+
+        buffer = self._buffer
+        while not self._complete and (count is None or len(self._starts) < count):
+            position = self._position
+            if self._starts: # step over the last element located
+                position = _WHITESPACE.match(buffer, _skip_value(buffer, position)).end()
+                if buffer[position:position + 1] == b',':
+                    position = _WHITESPACE.match(buffer, position + 1).end()
+
+            if buffer[position:position + 1] == b']':
+                self._complete = True
+                self._end = position + 1
+            else:
+                self._starts.append(position)
+            self._position = position
+
+
+class LazyJsonObject:
+    """Lazily decoded view of a JSON object held in a < JsonDocument >. Member keys are decoded
+    and their value offsets located on demand, scanning no further than the requested key
+    (missing keys, len() and iteration scan to the end), and cached. Values are decoded only
+    when accessed. NOTE: if a key is duplicated the first occurrence is returned, whereas
+    json.loads() (and < decode >) keep the last.
+
+    Methods:
+        decode: decode the whole object
+        get: return the value for a key or a default
+        items: (key, value) pairs
+        keys: member keys in document order
+        values: member values in document order
+    """
+
+    def __init__(self, buffer, start, end=None):
+        """Initialize a LazyJsonObject instance for the object beginning at buffer[start]. The
+        < end > offset is located when first needed if not provided."""
+
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._members = {} # key -> value offset for the members located so far
+        self._position = _WHITESPACE.match(buffer, start + 1).end() # scan resume point
+        self._complete = False
+
+    def __contains__(self, key):
+        self._scan(key)
+        return key in self._members
+
+    def __eq__(self, other):
+        return self.decode() == _decode(other)
+
+    def __getitem__(self, key):
+        self._scan(key)
+        return _make_node(self._buffer, self._members[key])
+
+    def __iter__(self):
+        self._scan()
+        return iter(self._members)
+
+    def __len__(self):
+        self._scan()
+        return len(self._members)
+
+    def __repr__(self):
+        return f"LazyJsonObject({self.keys()})"
+
+    def decode(self):
+        """Decodes and returns the object as a dictionary."""
+
+        if self._end is None:
+            self._end = _skip_value(self._buffer, self._start)
+
+        return loads(self._buffer[self._start:self._end])
+
+    def get(self, key, default=None):
+        """Returns the value for < key > if present; otherwise < default >."""
+
+        if key in self:
+            return self[key]
+
+        return default
+
+    def items(self):
+        """Returns a list of (key, value) pairs in document order."""
+
+        return [(key, self[key]) for key in self]
+
+    def keys(self):
+        """Returns a list of the member keys in document order."""
+
+        return list(self)
+
+    def values(self):
+        """Returns a list of the member values in document order."""
+
+        return [self[key] for key in self]
+
+    def _scan(self, key=None):
+        """Locates members until < key > is found or the object ends (key=None scans to the
+        end)."""
+
+        buffer = self._buffer
+        while not self._complete and (key is None or key not in self._members):
+            position = self._position
+            if self._members: # step over the last value located
+                position = _WHITESPACE.match(buffer, _skip_value(buffer, position)).end()
+                if buffer[position:position + 1] == b',':
+                    position = _WHITESPACE.match(buffer, position + 1).end()
+
+            if buffer[position:position + 1] == b'}':
+                self._complete = True
+                self._end = position + 1
+                self._position = position
+                continue
+
+            key_end = _STRING.match(buffer, position).end()
+            name = json.loads(buffer[position:key_end])
+            position = _WHITESPACE.match(buffer, key_end).end() + 1 # step over ":"
+            position = _WHITESPACE.match(buffer, position).end()
+            self._members.setdefault(name, position)
+            self._position = position
+
+
+def dumps(data, ensure_ascii=False, indent=2):
+    """Serializes < data > as a JSON string identical to json.dumps() with the same
+    < ensure_ascii > and < indent > settings. orjson is used when installed and able to produce
+    identical output (ensure_ascii=False, indent=2); otherwise the standard library is used.
+
+    Parameters:
+        data (obj): JSON-serializable object
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+
+    Returns:
+        str: encoded JSON
+    """
+
+    encoded = _orjson_dumps(data, ensure_ascii, indent)
+    if encoded is not None:
+        return encoded.decode('utf-8')
+
+    return json.dumps(data, ensure_ascii=ensure_ascii, indent=indent)
+
+
+def json_equal(filepath, other_filepath, *path):
+    """Compares the values found at < path > (a sequence of object keys and array indexes) in
+    two JSON files, e.g., a student output and its fixture. Both files are opened as
+    < JsonDocument > instances, so only the compared values are decoded.
+
+        json_equal('stu_planets_biggest_smallest.json',
+                   'fixtures/fxt_planets_biggest_smallest.json', 'biggest', 0)
+
+    Parameters:
+        filepath (str): path to the first file
+        other_filepath (str): path to the second file
+        path (str | int): keys and indexes to follow from the document root
+
+    Returns:
+        bool: True if the decoded values are equal; otherwise False
+    """
+
+    with JsonDocument(filepath) as doc, JsonDocument(other_filepath) as other_doc:
+        value, other_value = doc.root, other_doc.root
+        for key in path:
+            value, other_value = value[key], other_value[key]
+
+        return _decode(value) == _decode(other_value)
+
+
+def loads(data):
+    """Decodes a JSON document (str or bytes) using the fastest installed backend (see
+    < JSON_BACKEND >). Documents the backend rejects but the standard library accepts (e.g.,
+    NaN, integers wider than 64 bits) are decoded by the standard library, so the result (or
+    raised exception) always matches json.loads().
+
+    Parameters:
+        data (str | bytes): JSON document
+
+    Returns:
+        obj: decoded object
+    """
+
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except ValueError:
+            pass
+
+    return json.loads(data)
+
+
+def read_json(filepath, encoding='utf-8'):
+    """Reads a JSON document, decodes the file content, and returns a dictionary if provided
+    with a valid filepath. UTF-8 files are read as bytes and decoded by < loads >.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        dict/list: dict or list representations of the decoded JSON document
+    """
+
+    if encoding.lower() in _UTF8:
+        with open(filepath, 'rb') as file_obj:
+            return loads(file_obj.read())
+
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        return loads(file_obj.read())
+
+
+def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
+    """Serializes object as JSON. Writes content to the provided filepath. The file content is
+    byte-identical to json.dump() with the same arguments whichever backend is used, including
+    the platform line separator written in text mode (CRLF on Windows).
+
+    Parameters:
+        filepath (str): the path to the file
+        data (dict)/(list): the data to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+
+    Returns:
+        None
+    """
+
+    if encoding.lower() in _UTF8:
+        encoded = _orjson_dumps(data, ensure_ascii, indent)
+        if encoded is not None:
+            if _LINE_SEPARATOR != b'\n': # JSON strings never hold a raw newline
+                encoded = encoded.replace(b'\n', _LINE_SEPARATOR)
+            with open(filepath, 'wb') as file_obj:
+                file_obj.write(encoded)
+            return
+
+    with open(filepath, 'w', encoding=encoding) as file_obj:
+        json.dump(data, file_obj, ensure_ascii=ensure_ascii, indent=indent)
+
+
+def _decode(value):
+    """Returns < value > decoded if it is a lazy view; otherwise returns < value > unchanged."""
+
+    if isinstance(value, (LazyJsonArray, LazyJsonObject)):
+        return value.decode()
+
+    return value
+
+
+def _has_float_mismatch(encoded):
+    """Returns True if orjson output < encoded > may contain a float that json formats
+    differently: an exponent (e.g., 1e16) or a small fixed-point value (e.g., 0.00001). Matches
+    inside strings are false positives that merely force the json fallback. Substring searches
+    are used rather than a single regular expression, which is an order of magnitude slower."""
+
+    if b'0.0000' in encoded:
+        return True
+
+    for match in _EXPONENT.finditer(encoded):
+        if encoded[match.start() - 1:match.start()].isdigit():
+            return True
+
+    return False
+
+
+def _has_non_finite(data):
+    """Returns True if < data > holds a NaN or infinite float (as a value or an object key),
+    which json writes as NaN/Infinity but orjson writes as null. Only containers are pushed on
+    the stack; the common scalar types are skipped with identity checks."""
+
+    if type(data) is float:
+        return not math.isfinite(data)
+
+    stack = [data]
+    pop, push = stack.pop, stack.append
+    while stack:
+        container = pop()
+        if type(container) is dict:
+            for key in container:
+                if type(key) is float and not math.isfinite(key):
+                    return True
+            values = container.values()
+        elif type(container) in (list, tuple):
+            values = container
+        else:
+            continue
+
+        for value in values:
+            value_type = type(value)
+            if value_type is str or value_type is int or value is None:
+                continue
+            if value_type is dict or value_type is list or value_type is tuple:
+                push(value)
+            elif isinstance(value, float) and not math.isfinite(value):
+                return True
+
+    return False
+
+
+def _make_node(buffer, start, end=None):
+    """Returns a lazy view of the container beginning at buffer[start] or the decoded scalar."""
+
+    first = buffer[start:start + 1]
+    if first == b'{':
+        return LazyJsonObject(buffer, start, end)
+    if first == b'[':
+        return LazyJsonArray(buffer, start, end)
+
+    return loads(buffer[start:end if end is not None else _skip_value(buffer, start)])
+
+
+def _orjson_dumps(data, ensure_ascii, indent):
+    """Returns < data > encoded by orjson as UTF-8 bytes, or None if orjson is unavailable or
+    cannot reproduce the json module's output for these arguments. orjson writes NaN and
+    infinity as null where json writes NaN/Infinity, so output holding null is checked for
+    non-finite floats (see < _has_non_finite >)."""
+
+    if orjson is None or ensure_ascii or indent != 2:
+        return None
+
+    try:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except TypeError: # orjson.JSONEncodeError, e.g., unsupported type or int > 64 bits
+        return None
+
+    if _has_float_mismatch(encoded):
+        return None
+    if b'null' in encoded and _has_non_finite(data):
+        return None
+
+    return encoded
+
+
+def _skip_value(buffer, start):
+    """Returns the offset just past the JSON value beginning at buffer[start]. Containers are
+    skipped by jumping from bracket to bracket; a bracket is known to lie outside any string
+    when the bytes before it (since the last bracket) hold an even number of quotes and no
+    backslashes, which is checked with C-level byte counts. Otherwise the strings in between
+    are stepped over one at a time. Nothing is decoded."""
+
+    first = buffer[start:start + 1]
+    if first == b'"':
+        return _STRING.match(buffer, start).end()
+    if first not in (b'{', b'['):
+        return _SCALAR.match(buffer, start).end()
+
+    depth = 0
+    position = start
+    while True:
+        match = _BRACKET.search(buffer, position)
+        if match is None:
+            raise ValueError(f"unterminated JSON container at offset {start}")
+        bracket = match.start()
+        segment = buffer[position:bracket]
+        quotes = segment.count(b'"')
+        if quotes and (quotes % 2 or b'\\' in segment):
+            position = _STRING.match(buffer, position + segment.find(b'"')).end()
+            continue
+
+        position = bracket + 1
+        if match.group() in (b'{', b'['):
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return position
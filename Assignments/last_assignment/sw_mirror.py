@@ -0,0 +1,30 @@
+import sys
+import sw_utils as utl
+
+
+def main():
+    """Entry point for program. Snapshots every SWAPI category to local JSON Lines files so that
+    later pipelines can run offline.
+
+    Usage:
+        python sw_mirror.py [< dest_dir >] [< category > ...]
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    dest_dir = sys.argv[1] if len(sys.argv) > 1 else utl.SWAPI_MIRROR_DIR
+    categories = sys.argv[2:] if len(sys.argv) > 2 else None
+
+    with utl.swapi_session():
+        counts = utl.mirror_swapi(dest_dir, categories)
+
+    for category, count in counts.items():
+        print(f"{category}: {count} entities -> {dest_dir}/{category}.jsonl")
+
+
+if __name__ == '__main__':
+    main()
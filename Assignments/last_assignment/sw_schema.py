@@ -0,0 +1,170 @@
+import sys
+from collections import namedtuple
+from itertools import product
+
+
+# Constants
+NULL_TOKENS = frozenset(('n/a', 'none', 'unknown', '')) # compared case-insensitively
+
+# Conversion expressions applied to the local < value >; see compile_converter().
+CONVERSIONS = {
+    'float': 'float(value)',
+    'gravity': "float(value.strip('standard')) if 'standard' in value else float(value)",
+    'int': 'int(value)',
+    'list': 'value.split({delimiter!r})',
+    'str': None # no conversion
+}
+
+
+Field = namedtuple(
+    'Field',
+    ['target', 'source', 'type', 'nulls', 'delimiter', 'intern'],
+    defaults=(None, None, False)
+)
+Field.__doc__ = """Declarative description of one converted field.
+
+    target (str): attribute (or key) assigned on the target object
+    source (str): key read from the source dictionary
+    type (str): conversion name, a key of CONVERSIONS ('int', 'float', 'list', 'gravity', 'str')
+    nulls (frozenset): optional lowercase tokens converted to None before the type conversion
+                       (e.g., NULL_TOKENS); None disables null handling for the field
+    delimiter (str): optional delimiter used by the 'list' conversion (None splits on whitespace)
+    intern (bool): if True, string values ('str') or list items ('list') are interned with
+                   sys.intern() so repeated values (e.g., climate tokens) share one object
+"""
+
+
+def compile_converter(fields, name='convert', assign='attr', stale=None, cls=None):
+    """Compiles a sequence of < Field > declarations into a single specialized Python function
+    < name >(data, target). The generated function reads each field's source key from the
+    < data > dictionary, maps null tokens to None, applies the type conversion and assigns the
+    result to < target >, either as an attribute (assign='attr'), as an attribute set with
+    object.__setattr__() (assign='object') or as a key (assign='item').
+
+    assign='object' bypasses any __setattr__ override on < target >'s class (e.g.,
+    < swapi.CachedEntity >, which clears its cached representation on every assignment). Name
+    the attribute such an override would reset in < stale >; it is set to None once, after the
+    fields are assigned. If the slotted class < cls > is also passed, each attribute is set
+    through its slot descriptor and < target > may be omitted: a new < cls > instance is then
+    created with cls.__new__() (no __init__() call) and any slot not named by a field or by
+    < stale > is set to None.
+
+    Each field follows the semantics of the < sw_utils.convert_to_* > helpers: a value that
+    cannot be converted is assigned unchanged and None is never converted. Because the field
+    loop is unrolled at compile time there are no per-field function calls or table lookups at
+    run time. Null tokens are matched case-insensitively against a set holding every upper/
+    lower case spelling of each token, so no str.lower() call is made per value. The generated
+    source is available as the function's < source > attribute.
+
+    Fields declared with intern=True have their string values (or, for 'list' fields, each
+    item) passed through sys.intern(), so a value repeated across many records is stored once.
+
+    Parameters:
+        fields (iterable): < Field > declarations
+        name (str): name given to the generated function
+        assign (str): 'attr' or 'object' to set attributes on < target >; 'item' to set keys
+        stale (str): optional attribute set to None after the fields are assigned
+        cls (type): optional slotted class of < target > (assign='object' only)
+
+    Returns:
+        function: converter accepting (data, target) and returning < target >
+    """
+
+    fields = tuple(fields)
+    namespace = {'_intern': sys.intern, '_new': object.__new__, '_setattr': object.__setattr__}
+    lines = [f"def {name}(data, target{'=None' if cls is not None else ''}):"]
+    if cls is not None:
+        assigned = {field.target for field in fields} | {stale}
+        namespace['_cls'] = cls
+        lines.append("    if target is None:")
+        lines.append("        target = _new(_cls)")
+        for slot in _get_slots(cls):
+            if slot not in assigned:
+                lines.append(f"        {_assign(namespace, cls, assign, slot, 'None')}")
+
+    for index, field in enumerate(fields):
+        expression = CONVERSIONS[field.type]
+        if expression:
+            expression = expression.format(delimiter=field.delimiter)
+            if field.type == 'list' and field.delimiter is None:
+                expression = 'value.split()'
+            if field.type == 'list' and field.intern:
+                # map() rather than a comprehension, which is a nested function call in 3.11
+                expression = f"list(map(_intern, {expression}))"
+        source = f"data[{field.source!r}]"
+        if not (expression or field.nulls is not None or field.intern):
+            # Plain copy (e.g., a 'str' field without null tokens)
+            lines.append(f"    {_assign(namespace, cls, assign, field.target, source)}")
+            continue
+        lines.append(f"    value = {source}")
+
+        if field.nulls is not None:
+            namespace[f'_nulls_{index}'] = _get_case_variants(field.nulls)
+            lines.append(f"    if value.__class__ is str and value in _nulls_{index}:")
+            lines.append("        value = None")
+            if expression:
+                lines.append("    elif value is not None:")
+        elif expression:
+            lines.append("    if value is not None:")
+
+        if expression:
+            lines.append("        try:")
+            lines.append(f"            value = {expression}")
+            lines.append("        except Exception:")
+            lines.append("            pass")
+
+        if field.intern and field.type == 'str':
+            lines.append("    if value.__class__ is str:")
+            lines.append("        value = _intern(value)")
+
+        lines.append(f"    {_assign(namespace, cls, assign, field.target, 'value')}")
+
+    if stale is not None:
+        lines.append(f"    {_assign(namespace, cls, 'object', stale, 'None')}")
+    lines.append("    return target")
+    code = '\n'.join(lines) + '\n'
+
+    exec(compile(code, f"<sw_schema:{name}>", 'exec'), namespace)
+    converter = namespace[name]
+    converter.source = code
+
+    return converter
+
+
+def _assign(namespace, cls, assign, target, value):
+    """Returns the generated statement that assigns < value > (source text) to < target >,
+    registering the slot descriptor's __set__ method in < namespace > when one is used."""
+
+    if assign == 'attr':
+        return f"target.{target} = {value}"
+    if assign == 'item':
+        return f"target[{target!r}] = {value}"
+
+    descriptor = getattr(cls, target, None) if cls is not None else None
+    if descriptor is None or not hasattr(descriptor, '__set__'):
+        return f"_setattr(target, {target!r}, {value})"
+    setter = f"_set_{target}"
+    namespace[setter] = descriptor.__set__
+    return f"{setter}(target, {value})"
+
+
+def _get_case_variants(tokens):
+    """Returns a frozenset of every upper/lower case spelling of each of < tokens > (e.g.,
+    "n/a", "N/a", "n/A", "N/A"), so that a plain set lookup matches case-insensitively."""
+
+    variants = set()
+    for token in tokens:
+        variants.update(map(''.join, product(*({char.lower(), char.upper()} for char in token))))
+
+    return frozenset(variants)
+
+
+def _get_slots(cls):
+    """Returns the names of the __slots__ declared by < cls > and its base classes."""
+
+    slots = []
+    for base in reversed(cls.__mro__):
+        declared = base.__dict__.get('__slots__', ())
+        slots.extend((declared,) if isinstance(declared, str) else declared)
+
+    return slots
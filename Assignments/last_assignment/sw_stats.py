@@ -0,0 +1,521 @@
+import math
+import os
+import sw_utils as utl
+
+
+# Constants
+STATS_FILEPATH = os.path.join( # default ViewershipStats state file, kept next to this module
+    os.path.dirname(os.path.abspath(__file__)), 'clone_wars_viewership_stats.json'
+)
+STATS_PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+TDIGEST_BUFFER_FACTOR = 5 # buffered values per unit of compression before a merge
+TDIGEST_COMPRESSION = 100
+VIEWERS_KEY = 'episode_us_viewers_mm'
+
+
+class RunningStats:
+    """Streaming summary statistics of a sequence of numbers. Each value is folded in as it
+    arrives in O(1) time: count, sum, minimum and maximum are updated directly, the mean and
+    variance with Welford's online algorithm (numerically stable; no second pass), and the value
+    is added to a < TDigest > for approximate percentiles. The state can be saved with
+    < jsonable() > and restored by passing it back as < state >.
+
+    Attributes:
+        count (int): number of values added
+        total (float): sum of the values
+        minimum (float): smallest value (None if no values)
+        maximum (float): largest value (None if no values)
+        mean (float): running mean (0.0 if no values)
+        m2 (float): running sum of squared deviations from the mean
+        digest (TDigest): percentile sketch
+
+    Methods:
+        add: fold a value into the statistics
+        jsonable: return a JSON-friendly dictionary of the state
+        percentile: return an approximate percentile
+        summary: return the statistics as a dictionary
+        variance: return the population (or sample) variance
+    """
+
+    def __init__(self, compression=TDIGEST_COMPRESSION, state=None):
+        """Initialize a RunningStats instance, empty or restored from a < jsonable() > < state >."""
+
+        if state:
+            self.count = state['count']
+            self.total = state['total']
+            self.minimum = state['minimum']
+            self.maximum = state['maximum']
+            self.mean = state['mean']
+            self.m2 = state['m2']
+            self.digest = TDigest(compression, state['digest'])
+        else:
+            self.count = 0
+            self.total = 0.0
+            self.minimum = None
+            self.maximum = None
+            self.mean = 0.0
+            self.m2 = 0.0
+            self.digest = TDigest(compression)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"RunningStats: {self.count} values, mean {self.mean:.3f}"
+
+    def add(self, value):
+        """Folds < value > into the statistics.
+
+        Parameters:
+            value (float): the value to add
+
+        Returns:
+            None
+        """
+
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.digest.add(value)
+
+    def jsonable(self):
+        """Returns a JSON-friendly dictionary of the state, accepted as < state > by the
+        constructor.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: state dictionary
+        """
+
+        return {
+            'count': self.count,
+            'total': self.total,
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'mean': self.mean,
+            'm2': self.m2,
+            'digest': self.digest.jsonable()
+        }
+
+    def percentile(self, q):
+        """Returns the approximate < q > quantile (0 <= q <= 1) of the values added.
+
+        Parameters:
+            q (float): quantile, e.g., 0.5 for the median
+
+        Returns:
+            float: estimated value (None if no values)
+        """
+
+        return self.digest.percentile(q)
+
+    def summary(self, percentiles=STATS_PERCENTILES):
+        """Returns the statistics as a dictionary: count, sum, min, max, mean, variance, stdev
+        and one "p< nn >" entry per quantile in < percentiles >.
+
+        Parameters:
+            percentiles (tuple): quantiles to estimate
+
+        Returns:
+            dict: statistics
+        """
+
+        variance = self.variance()
+        summary = {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.minimum,
+            'max': self.maximum,
+            'mean': self.mean if self.count else None,
+            'variance': variance,
+            'stdev': math.sqrt(variance) if variance is not None else None
+        }
+        for q in percentiles:
+            summary[f"p{q * 100:g}"] = self.percentile(q)
+
+        return summary
+
+    def variance(self, sample=False):
+        """Returns the population variance of the values added (or the sample variance if
+        < sample > is True).
+
+        Parameters:
+            sample (bool): True to divide by count - 1 rather than count
+
+        Returns:
+            float: variance (None if there are too few values)
+        """
+
+        divisor = self.count - 1 if sample else self.count
+        return self.m2 / divisor if divisor > 0 else None
+
+
+class TDigest:
+    """Merging t-digest: a compact sketch of a distribution that estimates percentiles with
+    high accuracy near the tails. Values are appended to a buffer (O(1)); when the buffer fills
+    it is sorted and merged into at most ~< compression > weighted centroids sized by the arcsine
+    scale function, so adds cost amortized O(1) and memory stays bounded however many values are
+    added.
+
+    Attributes:
+        compression (int): accuracy parameter; larger values keep more centroids
+        count (int): total weight added
+        minimum (float): smallest value added (None if empty)
+        maximum (float): largest value added (None if empty)
+        centroids (list): [mean, weight] pairs sorted by mean
+
+    Methods:
+        add: add a value
+        jsonable: return a JSON-friendly dictionary of the state
+        percentile: return an approximate percentile
+    """
+
+    def __init__(self, compression=TDIGEST_COMPRESSION, state=None):
+        """Initialize a TDigest instance, empty or restored from a < jsonable() > < state >."""
+
+        self.compression = compression
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+        self.centroids = []
+        self._buffer = []
+        self._buffer_size = compression * TDIGEST_BUFFER_FACTOR
+        if state:
+            self.count = state['count']
+            self.minimum = state['minimum']
+            self.maximum = state['maximum']
+            self.centroids = [list(centroid) for centroid in state['centroids']]
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"TDigest: {self.count} values, {len(self.centroids)} centroids"
+
+    def add(self, value, weight=1):
+        """Adds < value > with the given < weight >.
+
+        Parameters:
+            value (float): the value to add
+            weight (int): the value's weight
+
+        Returns:
+            None
+        """
+
+        self._buffer.append([value, weight])
+        self.count += weight
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if len(self._buffer) >= self._buffer_size:
+            self._merge()
+
+    def jsonable(self):
+        """Returns a JSON-friendly dictionary of the state, accepted as < state > by the
+        constructor.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: state dictionary
+        """
+
+        self._merge()
+        return {
+            'count': self.count,
+            'minimum': self.minimum,
+            'maximum': self.maximum,
+            'centroids': self.centroids
+        }
+
+    def percentile(self, q):
+        """Returns the approximate < q > quantile (0 <= q <= 1). Interpolates linearly between
+        the centers of neighboring centroids, and between the outermost centroids and the
+        exact minimum and maximum.
+
+        Parameters:
+            q (float): quantile, e.g., 0.5 for the median
+
+        Returns:
+            float: estimated value (None if empty)
+        """
+
+        self._merge()
+        if not self.centroids:
+            return None
+        if q <= 0:
+            return self.minimum
+        if q >= 1:
+            return self.maximum
+
+        target = q * self.count
+        previous_mean, previous_center = self.minimum, 0
+        cumulative = 0
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_mean, previous_center = mean, center
+            cumulative += weight
+
+        fraction = (target - previous_center) / (self.count - previous_center)
+        return previous_mean + fraction * (self.maximum - previous_mean)
+
+    def _merge(self):
+        """Sorts the buffered values into the centroids, merging neighbors while the merged
+        centroid stays within the size allowed by the scale function at its quantile."""
+
+        if not self._buffer:
+            return
+
+        items = sorted(self.centroids + self._buffer)
+        self._buffer = []
+        merged = [items[0]]
+        cumulative = 0
+        limit = self.count * self._quantile_limit(0)
+        for mean, weight in items[1:]:
+            current = merged[-1]
+            if cumulative + current[1] + weight <= limit:
+                current[1] += weight
+                current[0] += (mean - current[0]) * weight / current[1]
+            else:
+                cumulative += current[1]
+                limit = self.count * self._quantile_limit(cumulative / self.count)
+                merged.append([mean, weight])
+        self.centroids = merged
+
+    def _quantile_limit(self, q):
+        """Returns the quantile one scale unit beyond < q > under the arcsine scale function
+        k(q) = compression / (2 pi) * asin(2q - 1)."""
+
+        scale = self.compression / (2 * math.pi)
+        k = scale * math.asin(2 * q - 1) + 1
+        if k >= scale * math.pi / 2:
+            return 1.0
+
+        return (math.sin(k / scale) + 1) / 2
+
+
+class ViewershipStats:
+    """Incremental "episode_us_viewers_mm" statistics over all episodes and grouped per season
+    and per director. Each new episode updates three < RunningStats > in O(1). Episodes are
+    identified by < key > and their counted values are kept in < episodes >: an episode fed
+    again unchanged is ignored, so the same CSV can be fed again after new rows are appended
+    and only the new rows are counted. An episode fed again with a different viewership value
+    (or season or director) replaces its previous values; because a t-digest cannot forget a
+    value, the statistics are then rebuilt from < episodes > (O(n), corrections only).
+    Episodes without viewership data (see < swapi.has_viewer_data >) or without a < key >
+    value cannot be identified on a later run, so they are skipped.
+    Persist with < save() > and restore with < load_viewership_stats() >.
+
+    Attributes:
+        key (str): episode key identifying an episode
+        compression (int): t-digest compression of every < RunningStats >
+        overall (RunningStats): statistics over all episodes
+        seasons (dict): season number (str) -> RunningStats
+        directors (dict): director name -> RunningStats
+        episodes (dict): episode key -> (viewers, season, director) of each episode counted
+
+    Methods:
+        add_episode: fold one episode into the statistics
+        add_episodes: fold a sequence of episodes into the statistics
+        jsonable: return a JSON-friendly dictionary of the state
+        save: write the state to a JSON file
+        summary: return the statistics as a nested dictionary
+    """
+
+    def __init__(self, key='series_episode_num', compression=TDIGEST_COMPRESSION, state=None):
+        """Initialize a ViewershipStats instance, empty or restored from a < jsonable() >
+        < state >."""
+
+        self.key = key
+        self.compression = compression
+        self.overall = RunningStats(compression)
+        self.seasons = {}
+        self.directors = {}
+        self.episodes = {}
+        if state:
+            self.key = state['key']
+            self.compression = state['compression']
+            self.overall = RunningStats(self.compression, state['overall'])
+            self.seasons = {
+                season: RunningStats(self.compression, stats)
+                for season, stats in state['seasons'].items()
+            }
+            self.directors = {
+                director: RunningStats(self.compression, stats)
+                for director, stats in state['directors'].items()
+            }
+            self.episodes = {
+                episode_key: (viewers, season, director)
+                for episode_key, viewers, season, director in state['episodes']
+            }
+
+    def __len__(self):
+        return len(self.episodes)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"ViewershipStats: {len(self)} episodes, {len(self.seasons)} seasons"
+
+    def add_episode(self, episode):
+        """Folds < episode > into the overall, season and director statistics unless it was
+        already counted with the same values, has no viewership data or has no < key > value.
+        An episode counted earlier with other values replaces them (see the class docstring).
+
+        Parameters:
+            episode (dict): converted episode dictionary
+
+        Returns:
+            bool: True if the episode was counted or corrected; otherwise False
+        """
+
+        viewers = episode[VIEWERS_KEY]
+        episode_key = episode[self.key]
+        if not viewers or episode_key is None:
+            return False
+
+        values = (viewers, episode['series_season_num'], episode['episode_director'])
+        previous = self.episodes.get(episode_key)
+        if previous == values:
+            return False
+
+        self.episodes[episode_key] = values
+        if previous is None:
+            self._add_values(*values)
+        else:
+            self._rebuild()
+
+        return True
+
+    def add_episodes(self, episodes):
+        """Folds each episode in < episodes > (a list or a stream) into the statistics (see
+        < add_episode >).
+
+        Parameters:
+            episodes (iterable): converted episode dictionaries
+
+        Returns:
+            int: number of episodes counted
+        """
+
+        return sum(self.add_episode(episode) for episode in episodes)
+
+    def jsonable(self):
+        """Returns a JSON-friendly dictionary of the state, accepted as < state > by the
+        constructor.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: state dictionary
+        """
+
+        return {
+            'key': self.key,
+            'compression': self.compression,
+            'overall': self.overall.jsonable(),
+            'seasons': {season: stats.jsonable() for season, stats in self.seasons.items()},
+            'directors': {
+                director: stats.jsonable() for director, stats in self.directors.items()
+            },
+            'episodes': [
+                [episode_key, *values] for episode_key, values in self.episodes.items()
+            ] # in the order counted; not re-sorted on every save
+        }
+
+    def save(self, filepath=STATS_FILEPATH):
+        """Writes the state to < filepath > as JSON. The file is written under a temporary name
+        and then moved into place, so an interrupted run leaves the previous state intact.
+
+        Parameters:
+            filepath (str): the path to the file
+
+        Returns:
+            None
+        """
+
+        temp_filepath = f"{filepath}.tmp"
+        utl.write_json(temp_filepath, self.jsonable())
+        os.replace(temp_filepath, filepath)
+
+    def summary(self, percentiles=STATS_PERCENTILES):
+        """Returns the statistics as a nested dictionary with "overall", "seasons" and
+        "directors" entries (see < RunningStats.summary >).
+
+        Parameters:
+            percentiles (tuple): quantiles to estimate
+
+        Returns:
+            dict: statistics
+        """
+
+        return {
+            'overall': self.overall.summary(percentiles),
+            'seasons': {
+                season: stats.summary(percentiles) for season, stats in self.seasons.items()
+            },
+            'directors': {
+                director: stats.summary(percentiles) for director, stats in self.directors.items()
+            }
+        }
+
+    def _add_values(self, viewers, season, director):
+        """Folds one episode's < viewers > into the overall, < season > and < director >
+        statistics."""
+
+        self.overall.add(viewers)
+        if season is not None:
+            self._get_stats(self.seasons, str(season)).add(viewers)
+        if director is not None:
+            self._get_stats(self.directors, director).add(viewers)
+
+    def _get_stats(self, groups, name):
+        """Returns the < RunningStats > of < name > in < groups >, adding it if required."""
+
+        stats = groups.get(name)
+        if stats is None:
+            stats = groups[name] = RunningStats(self.compression)
+
+        return stats
+
+    def _rebuild(self):
+        """Rebuilds every < RunningStats > from < episodes > (after a correction)."""
+
+        self.overall = RunningStats(self.compression)
+        self.seasons = {}
+        self.directors = {}
+        for values in self.episodes.values():
+            self._add_values(*values)
+
+
+def load_viewership_stats(filepath=STATS_FILEPATH, key='series_episode_num',
+                          compression=TDIGEST_COMPRESSION):
+    """Returns the < ViewershipStats > saved in < filepath >, or a new, empty instance if the file
+    does not exist.
+
+    Parameters:
+        filepath (str): the path to the file
+        key (str): episode key identifying an episode (new instances only)
+        compression (int): t-digest compression (new instances only)
+
+    Returns:
+        ViewershipStats: restored or new statistics
+    """
+
+    if not os.path.exists(filepath):
+        return ViewershipStats(key, compression)
+
+    return ViewershipStats(state=utl.read_json(filepath))
@@ -0,0 +1,125 @@
+import os
+import unicodedata
+import sw_utils as utl
+from sw_cache import make_request_key
+
+
+class SwapiStore:
+    """Read-only, in-memory store of SWAPI entities loaded from a local mirror (see
+    < sw_utils.mirror_swapi >). Entities are indexed by url and by normalized name so that
+    lookups are O(1) dictionary hits rather than network round trips plus a server-side search.
+
+    Attributes:
+        mirror_dir (str): directory holding the < category >.jsonl snapshot files
+        categories (dict): category name -> list of entity dictionaries
+        by_url (dict): normalized url -> entity dictionary
+        by_name (dict): (category, normalized name) -> entity dictionary
+
+    Methods:
+        find: return the entity in a category matching a name
+        get: return the entity identified by a url
+        load: read a category snapshot and index its entities
+    """
+
+    def __init__(self, mirror_dir=utl.SWAPI_MIRROR_DIR, categories=None):
+        """Initialize a SwapiStore instance. Loads and indexes every < category >.jsonl file
+        found in < mirror_dir > (or only the named < categories >)."""
+
+        self.mirror_dir = mirror_dir
+        self.categories = {}
+        self.by_url = {}
+        self.by_name = {}
+
+        if categories is None:
+            categories = [
+                filename[:-len('.jsonl')] for filename in sorted(os.listdir(mirror_dir))
+                if filename.endswith('.jsonl')
+            ]
+        for category in categories:
+            self.load(category)
+
+    def __len__(self):
+        return len(self.by_url)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"SwapiStore({self.mirror_dir}): {len(self)} entities"
+
+    def find(self, category, name):
+        """Returns the entity in < category > whose name matches < name >. Names are compared
+        after normalization (see < normalize_name >), so "Padmé Amidala" matches "Padme Amidala".
+        If no exact match exists, falls back to the first entity whose normalized name contains
+        < name > (the behavior of SWAPI's ?search= parameter). Returns None if nothing matches.
+
+        Parameters:
+            category (str): category name, e.g., "planets"
+            name (str): entity name or search term
+
+        Returns:
+            dict: entity dictionary or None
+        """
+
+        key = normalize_name(name)
+        entity = self.by_name.get((category, key))
+        if entity is None:
+            for candidate in self.categories.get(category, []):
+                if key in normalize_name(candidate['name']):
+                    return candidate
+
+        return entity
+
+    def get(self, url):
+        """Returns the entity identified by < url > (e.g., a person's "homeworld" url) or None
+        if the url is not in the store.
+
+        Parameters:
+            url (str): entity url
+
+        Returns:
+            dict: entity dictionary or None
+        """
+
+        return self.by_url.get(make_request_key(url))
+
+    def load(self, category):
+        """Reads < mirror_dir >/< category >.jsonl and adds its entities to the url and name
+        indexes. Where two entities share a normalized name the first one read is kept in the
+        name index.
+
+        Parameters:
+            category (str): category name, e.g., "planets"
+
+        Returns:
+            list: the category's entity dictionaries
+        """
+
+        filepath = os.path.join(self.mirror_dir, f"{category}.jsonl")
+        entities = []
+        for entity in utl.iter_jsonl(filepath):
+            entities.append(entity)
+            self.by_url[make_request_key(entity['url'])] = entity
+            name = entity.get('name', entity.get('title'))
+            if name is not None:
+                self.by_name.setdefault((category, normalize_name(name)), entity)
+
+        self.categories[category] = entities
+        return entities
+
+
+def normalize_name(name):
+    """Returns a normalized form of an entity < name > used as an index key: accents are removed,
+    the string is case-folded and runs of whitespace are collapsed, e.g.,
+    " Padmé  Amidala" -> "padme amidala".
+
+    Parameters:
+        name (str): entity name
+
+    Returns:
+        str: normalized name
+    """
+
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+    return ' '.join(stripped.casefold().split())
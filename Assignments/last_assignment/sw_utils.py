@@ -1,6 +1,26 @@
+import asyncio
 import csv
+import gzip
 import json
+import os
 import requests
+import sw_json
+import threading
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from heapq import heappush, heapreplace
+from itertools import islice
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from sw_cache import SwapiCache, CACHE_DEFAULT_TTL, CACHE_FILEPATH, CACHE_MAX_BYTES, make_request_key
+
+try:
+    import zstandard # optional; required only for ".zst" files
+except ImportError:
+    zstandard = None
 
 
 # Constants
@@ -12,6 +32,205 @@ SWAPI_PLANETS = f"{SWAPI_ENDPOINT}/planets/"
 SWAPI_SPECIES = f"{SWAPI_ENDPOINT}/species/"
 SWAPI_STARSHIPS = f"{SWAPI_ENDPOINT}/starships/"
 SWAPI_VEHICLES = f"{SWAPI_ENDPOINT}/vehicles/"
+SWAPI_CATEGORY_URLS = {
+    'films': SWAPI_FILMS,
+    'people': SWAPI_PEOPLE,
+    'planets': SWAPI_PLANETS,
+    'species': SWAPI_SPECIES,
+    'starships': SWAPI_STARSHIPS,
+    'vehicles': SWAPI_VEHICLES
+}
+CSV_COLUMN_TYPECODES = {'float': 'd', 'int': 'q'} # typed column conversions -> array typecode
+SWAPI_MIRROR_DIR = 'swapi_mirror' # default mirror_swapi() destination
+WRITE_BUFFER_SIZE = 1 << 20 # bytes buffered by open_text_file() before each write to disk
+
+SWAPI_POOL_SIZE = 10 # pooled connections kept alive per host
+SWAPI_RETRIES = 3 # retries on connection errors and 429/5xx responses
+SWAPI_BACKOFF = 0.5 # retry delay in seconds: backoff * (2 ** (retry - 1))
+SWAPI_CONCURRENCY = 8 # max in-flight requests issued by get_swapi_resources_async()
+
+_swapi_session = None # shared requests.Session; see open_swapi_session()
+_swapi_cache = None # persistent response cache; see enable_swapi_cache()
+_swapi_batch = None # decoded responses shared within a swapi_batch() block
+_swapi_inflight = {} # request key -> _Flight for fetches currently in progress
+_swapi_lock = threading.Lock() # guards _swapi_batch, _swapi_inflight and _swapi_stats
+_swapi_stats = {'requests': 0, 'cache_hits': 0, 'network_calls': 0, 'coalesced': 0}
+
+
+class _Flight:
+    """A single in-progress SWAPI fetch shared by every caller that requests the same key
+    while it is running (single-flight). The first caller performs the fetch and publishes the
+    decoded result (or exception); later callers block on < event > and reuse it."""
+
+    def __init__(self):
+        """Initialize a _Flight instance."""
+
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        """Blocks until the leading fetch completes; returns its result or re-raises its error."""
+
+        self.event.wait()
+        if self.error is not None:
+            raise self.error
+
+        return self.result
+
+
+class _Ranked:
+    """Heap entry used by < extrema > and < top_k >. Entries order from worst to best so that
+    the root of a heap is the entry to evict: a lower value ranks worse when keeping the
+    largest values (a higher value when keeping the smallest) and, between equal values, the
+    later record ranks worse, which keeps the results stable."""
+
+    __slots__ = ('value', 'index', 'record', 'largest')
+
+    def __init__(self, value, index, record, largest):
+        """Initialize a _Ranked instance."""
+
+        self.value = value
+        self.index = index
+        self.record = record
+        self.largest = largest
+
+    def __lt__(self, other):
+        if self.value == other.value:
+            return self.index > other.index
+        if self.largest:
+            return self.value < other.value
+
+        return other.value < self.value
+
+
+class JsonArrayWriter:
+    """Writes a JSON array to a file one element at a time.
+
+    The output is byte-for-byte identical to < write_json > (json.dump()) of the equivalent
+    list with the same < ensure_ascii > and < indent > settings, but each element is encoded
+    and written as it arrives so producers never need to accumulate the list in memory. The
+    file is opened with < open_text_file >, so ".gz" and ".zst" paths are compressed.
+
+    Attributes:
+        filepath (str): the path to the file
+        count (int): number of elements written
+
+    Methods:
+        close: terminate the array and close the file
+        write: encode and write one element
+        write_encoded: write one element supplied as pre-encoded JSON text chunks
+    """
+
+    def __init__(self, filepath, encoding='utf-8', ensure_ascii=False, indent=2):
+        """Initialize a JsonArrayWriter instance, opening < filepath > for writing."""
+
+        self.filepath = filepath
+        self.count = 0
+        self._ensure_ascii = ensure_ascii
+        self._indent = indent
+        self._file_obj = open_text_file(filepath, 'w', encoding)
+
+        if indent is None:
+            self._open, self._separator, self._close = '[', ', ', ']'
+        else:
+            self._padding = '\n' + ' ' * indent
+            self._open, self._separator, self._close = '[' + self._padding, ',' + self._padding, '\n]'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"JsonArrayWriter: {self.filepath} ({self.count} elements)"
+
+    def close(self):
+        """Writes the closing "]" (or "[]" if no elements were written) and closes the file."""
+
+        if not self._file_obj.closed:
+            self._file_obj.write(self._close if self.count else '[]')
+            self._file_obj.close()
+
+    def write(self, data):
+        """Encodes < data > as JSON and writes it as the next array element.
+
+        Parameters:
+            data (obj): JSON-serializable element
+
+        Returns:
+            None
+        """
+
+        encoded = sw_json.dumps(data, ensure_ascii=self._ensure_ascii, indent=self._indent)
+        if self._indent is not None:
+            encoded = encoded.replace('\n', self._padding) # nest one level; strings escape \n
+        self._file_obj.write(self._separator if self.count else self._open)
+        self._file_obj.write(encoded)
+        self.count += 1
+
+    def write_encoded(self, chunks):
+        """Writes the next array element supplied as an iterable of JSON text < chunks >, encoded
+        as a top-level value with the writer's < ensure_ascii > and < indent > settings (e.g., by
+        < swapi.iter_entity_json >). Each chunk is nested and written as it is produced, so an
+        element is never held in memory whole.
+
+        Parameters:
+            chunks (iterable): JSON text chunks that together encode one element
+
+        Returns:
+            None
+        """
+
+        self._file_obj.write(self._separator if self.count else self._open)
+        for chunk in chunks:
+            if self._indent is not None:
+                chunk = chunk.replace('\n', self._padding) # nest one level; strings escape \n
+            self._file_obj.write(chunk)
+        self.count += 1
+
+
+def convert_csv_column(values, type_name='str', delimiter=None):
+    """Converts a column of CSV string < values > to < type_name > in a single pass. Blank or
+    empty strings are treated as nulls and recorded in a companion null mask (bytearray,
+    1 = null). Numeric columns ('int', 'float') are returned as typed < array > columns holding
+    0 in null slots. If any non-blank value cannot be converted the column is returned as a list
+    instead, with that value left unchanged (mirroring the < convert_to_* > functions).
+
+    Conversions:
+        'int': array('q') of ints
+        'float': array('d') of floats
+        'list': list of lists split on < delimiter > (see < convert_to_list >)
+        'str': list of unchanged strings
+
+    Parameters:
+        values (iterable): column strings in row order
+        type_name (str): 'int', 'float', 'list', or 'str'
+        delimiter (str): optional delimiter used by the 'list' conversion
+
+    Returns:
+        tuple: (column, nulls) where column is an array or a list and nulls a bytearray
+    """
+
+    values = list(values)
+    nulls = bytearray(not value or value.isspace() for value in values)
+
+    typecode = CSV_COLUMN_TYPECODES.get(type_name)
+    if typecode:
+        func = int if type_name == 'int' else float
+        try:
+            return array(typecode, [0 if null else func(value) for value, null in zip(values, nulls)]), nulls
+        except (TypeError, ValueError):
+            convert = convert_to_int if type_name == 'int' else convert_to_float
+            return [None if null else convert(value) for value, null in zip(values, nulls)], nulls
+
+    if type_name == 'list':
+        return [None if null else convert_to_list(value, delimiter) for value, null in zip(values, nulls)], nulls
+
+    return [None if null else value for value, null in zip(values, nulls)], nulls
 
 
 def convert_gravity_value(value):
@@ -121,12 +340,192 @@ def convert_to_none(value):
 
 
 
+def close_swapi_session():
+    """Closes the shared SWAPI < requests.Session > (if open) and releases its pooled
+    connections. The next call to < get_swapi_resource > opens a fresh session.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    global _swapi_session
+
+    if _swapi_session is not None:
+        _swapi_session.close()
+        _swapi_session = None
+
+
+def columns_to_dicts(columns, nulls=None):
+    """Transposes a column mapping (e.g., as returned by < read_csv_to_columns >) into a list of
+    row dictionaries. Values flagged in a column's null mask are replaced with None. Each column
+    is traversed once.
+
+    Parameters:
+        columns (dict): column name -> column values (array or list)
+        nulls (dict): optional column name -> null mask (bytearray)
+
+    Returns:
+        list: nested dictionaries, one per row
+    """
+
+    if nulls is None:
+        nulls = {}
+
+    names = list(columns)
+    values = []
+    for name in names:
+        mask = nulls.get(name)
+        if mask is None:
+            values.append(list(columns[name]))
+        else:
+            values.append([None if null else value for value, null in zip(columns[name], mask)])
+
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+def count_by(records, key, counts=None):
+    """Counts < records > by the value of < key > in a single pass. Keys are counted in order of
+    first appearance. < records > may be any iterable, including a generator or a batch of a
+    larger stream: pass the Counter returned for earlier batches as < counts > to keep a running
+    total without holding the records. Records whose key value is None are not counted.
+
+    Parameters:
+        records (iterable): dictionaries (or other records) to count
+        key (str | callable): dictionary key, or a function returning the value to count by
+        counts (Counter): optional running counts to update
+
+    Returns:
+        Counter: value -> number of records
+    """
+
+    if counts is None:
+        counts = Counter()
+
+    get_value = key if callable(key) else itemgetter(key)
+    counts.update(value for value in map(get_value, records) if value is not None)
+
+    return counts
+
+
+def disable_swapi_cache():
+    """Closes the response cache enabled by < enable_swapi_cache > (if any). Subsequent calls to
+    < get_swapi_resource > go to the network. Cached entries remain on disk.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    global _swapi_cache
+
+    if _swapi_cache is not None:
+        _swapi_cache.close()
+        _swapi_cache = None
+
+
+def enable_swapi_cache(filepath=CACHE_FILEPATH, max_bytes=CACHE_MAX_BYTES,
+                       default_ttl=CACHE_DEFAULT_TTL, ttls=None):
+    """Enables the persistent response cache consulted by < get_swapi_resource >. Responses are
+    stored in the SQLite database located at < filepath > keyed on url plus params, so warm runs
+    are served without network calls. If a cache is already enabled it is returned unchanged.
+
+    Parameters:
+        filepath (str): location of the SQLite database
+        max_bytes (int): size cap on stored response bodies; LRU entries evicted beyond it
+        default_ttl (float): time-to-live in seconds for resources without an explicit TTL
+        ttls (dict): optional per-resource TTLs in seconds, e.g., {'people': 3600}
+
+    Returns:
+        SwapiCache: the enabled cache (see < SwapiCache.stats > for hit/miss counters)
+    """
+
+    global _swapi_cache
+
+    if _swapi_cache is None:
+        _swapi_cache = SwapiCache(filepath, max_bytes, default_ttl, ttls)
+
+    return _swapi_cache
+
+
+def extrema(records, key, k=1, include=None):
+    """Returns the < k > records with the smallest and the < k > records with the largest value
+    of < key >, found in a single pass over < records > (which may be a generator). Each side is
+    kept in a bounded heap, so memory is O(k) and time O(n log k). Ties are resolved in favor of
+    the record seen first. Records whose value is None, or that fail the optional < include >
+    predicate (e.g., < swapi.has_viewer_data >), are skipped.
+
+    Parameters:
+        records (iterable): dictionaries (or other records) to rank
+        key (str | callable): dictionary key, or a function returning the value to rank by
+        k (int): number of records to return per side
+        include (callable): optional predicate; records for which it returns False are skipped
+
+    Returns:
+        tuple: (smallest, largest) lists of records, each ordered best first
+    """
+
+    return _rank(records, key, k, True, True, include)
+
+
+def fetch_swapi_resource(url, params=None, timeout=10):
+    """Performs the actual lookup behind < get_swapi_resource >: consults the response cache
+    (if enabled), otherwise issues a GET request through the shared keep-alive session and
+    stores the decoded body in the cache. Only successful (2xx) responses are cached; error
+    bodies (e.g., a 404 "Not found") are returned but fetched again next time. Does not
+    participate in single-flight coalescing; call < get_swapi_resource > instead.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
+
+    if _swapi_cache is not None:
+        data = _swapi_cache.get(url, params)
+        if data is not None:
+            with _swapi_lock:
+                _swapi_stats['cache_hits'] += 1
+            return data
+
+    session = open_swapi_session()
+    with _swapi_lock:
+        _swapi_stats['network_calls'] += 1
+    if params:
+        response = session.get(url, params=params, timeout=timeout)
+    else:
+        response = session.get(url, timeout=timeout)
+    data = sw_json.loads(response.content)
+
+    if _swapi_cache is not None and 200 <= response.status_code < 300:
+        _swapi_cache.set(url, params, data)
+
+    return data
+
+
 def get_swapi_resource(url, params=None, timeout=10):
     """Returns a response object decoded into a dictionary. If query string < params > are
     provided the response object body is returned in the form on an "envelope" with the data
     payload of one or more SWAPI entities to be found in ['results'] list; otherwise, response
     object body is returned as a single dictionary representation of the SWAPI entity.
 
+    Requests are issued through the shared keep-alive session returned by
+    < open_swapi_session >, so repeated calls reuse pooled sockets rather than paying for a new
+    TCP/TLS handshake each time. If a response cache is enabled (see < enable_swapi_cache >)
+    it is consulted first and populated after each network fetch.
+
+    Concurrent calls for the same url and params are coalesced: only the first caller fetches
+    while the others wait for and share its decoded result. Inside a < swapi_batch > block
+    repeated calls also return the result decoded by the first call. See < get_swapi_stats >
+    for the number of fetches saved.
+
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
@@ -136,10 +535,357 @@ def get_swapi_resource(url, params=None, timeout=10):
         dict: dictionary representation of the decoded JSON.
     """
 
-    if params:
-        return requests.get(url, params, timeout=timeout).json()
-    else:
-        return requests.get(url, timeout=timeout).json()
+    key = make_request_key(url, params)
+    with _swapi_lock:
+        _swapi_stats['requests'] += 1
+        if _swapi_batch is not None and key in _swapi_batch:
+            _swapi_stats['coalesced'] += 1
+            return _swapi_batch[key]
+
+        flight = _swapi_inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _swapi_inflight[key] = _Flight()
+        else:
+            _swapi_stats['coalesced'] += 1
+
+    if not leader:
+        return flight.wait()
+
+    try:
+        flight.result = fetch_swapi_resource(url, params, timeout)
+    except Exception as error:
+        flight.error = error
+        raise
+    finally:
+        with _swapi_lock:
+            del _swapi_inflight[key]
+            if _swapi_batch is not None and flight.error is None:
+                _swapi_batch[key] = flight.result
+        flight.event.set()
+
+    return flight.result
+
+
+def get_swapi_resources(urls, params=None, concurrency=SWAPI_CONCURRENCY, timeout=10):
+    """Blocking convenience wrapper around < get_swapi_resources_async >. Runs the concurrent
+    fetch on a new event loop and returns the decoded responses in input order. Do not call
+    from code that is already running inside an event loop; await
+    < get_swapi_resources_async > instead.
+
+    Parameters:
+        urls (list): urls that specify the resources
+        params (list): optional querystring dictionaries, one per url (None entries allowed)
+        concurrency (int): maximum number of requests in flight at any one time
+        timeout (int): timeout value in seconds applied to each request
+
+    Returns:
+        list: dictionary representations of the decoded JSON, one per url
+    """
+
+    return asyncio.run(get_swapi_resources_async(urls, params, concurrency, timeout))
+
+
+async def get_swapi_resources_async(urls, params=None, concurrency=SWAPI_CONCURRENCY, timeout=10):
+    """Fetches many SWAPI resources concurrently and returns the decoded responses in the same
+    order as < urls >. Each request is delegated to < get_swapi_resource > on a thread of a
+    pool created for this call with < concurrency > threads (so the pooled session and response
+    cache are shared), which caps the number of requests in flight. The loop's default executor
+    is not used, since its size (min(32, cpu_count + 4)) would silently lower a larger
+    < concurrency >. Total latency approaches that of the slowest batch rather than the sum of
+    every round trip. Duplicate requests in < urls > are fetched once and share the same
+    decoded result.
+
+    Parameters:
+        urls (list): urls that specify the resources
+        params (list): optional querystring dictionaries, one per url (None entries allowed)
+        concurrency (int): maximum number of requests in flight at any one time
+        timeout (int): timeout value in seconds applied to each request
+
+    Returns:
+        list: dictionary representations of the decoded JSON, one per url
+    """
+
+    urls = list(urls)
+    if params is None:
+        params = [None] * len(urls)
+    keys = [make_request_key(url, url_params) for url, url_params in zip(urls, params)]
+    unique = {}
+    for key, url, url_params in zip(keys, urls, params):
+        unique.setdefault(key, (url, url_params))
+
+    with _swapi_lock:
+        _swapi_stats['requests'] += len(keys) - len(unique)
+        _swapi_stats['coalesced'] += len(keys) - len(unique)
+
+    open_swapi_session(pool_size=max(concurrency, SWAPI_POOL_SIZE))
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, get_swapi_resource, url, url_params, timeout)
+            for url, url_params in unique.values()
+        ])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    decoded = dict(zip(unique, results))
+
+    return [decoded[key] for key in keys]
+
+
+def get_swapi_stats():
+    """Returns a snapshot of the SWAPI request counters. "requests" counts calls made to
+    < get_swapi_resource > (plus duplicates folded by < get_swapi_resources_async >),
+    "cache_hits" the lookups served by the response cache, "network_calls" the GET requests
+    actually issued and "coalesced" the requests satisfied by sharing another caller's in-flight
+    fetch or batch result, i.e., the number of fetches saved.
+
+    Parameters:
+        None
+
+    Returns:
+        dict: requests, cache_hits, network_calls and coalesced counts
+    """
+
+    with _swapi_lock:
+        return dict(_swapi_stats)
+
+
+def iter_batches(iterable, batch_size):
+    """Yields successive lists of up to < batch_size > items drawn from < iterable >. Only one
+    batch is held in memory at a time.
+
+    Parameters:
+        iterable (iterable): items to group
+        batch_size (int): maximum number of items per batch
+
+    Returns:
+        generator: lists of items
+    """
+
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_csv(filepath, encoding='utf-8', newline='', delimiter=',', batch_size=None):
+    """Reads a CSV file lazily, yielding each row as a list (header row included) as it is
+    parsed. Memory use is independent of file size. If < batch_size > is provided rows are
+    yielded in lists of up to < batch_size > rows instead (see < iter_batches >).
+
+    Parameters:
+        filepath (str): The location of the file to read
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        batch_size (int): optional number of rows per yielded batch
+
+    Returns:
+        generator: "row" lists (or lists of rows if < batch_size > is provided)
+    """
+
+    with open(filepath, 'r', encoding=encoding, newline=newline) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        if batch_size:
+            yield from iter_batches(reader, batch_size)
+        else:
+            yield from reader
+
+
+def iter_csv_dicts(filepath, encoding='utf-8', newline='', delimiter=',', batch_size=None):
+    """Reads a CSV file lazily using the csv.DictReader(), yielding a dictionary per row as it is
+    parsed. Memory use is independent of file size. If < batch_size > is provided rows are
+    yielded in lists of up to < batch_size > dictionaries instead (see < iter_batches >).
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        batch_size (int): optional number of rows per yielded batch
+
+    Returns:
+        generator: row dictionaries (or lists of them if < batch_size > is provided)
+    """
+
+    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
+        reader = csv.DictReader(file_obj, delimiter=delimiter)
+        if batch_size:
+            yield from iter_batches(reader, batch_size)
+        else:
+            yield from reader
+
+
+def iter_jsonl(filepath, encoding='utf-8'):
+    """Reads a JSON Lines file lazily, yielding one decoded record per non-blank line. Files
+    ending in ".gz" or ".zst" are decompressed on the fly (see < open_text_file >).
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        generator: decoded records
+    """
+
+    with open_text_file(filepath, 'r', encoding) as file_obj:
+        for line in file_obj:
+            if line.strip():
+                yield sw_json.loads(line)
+
+
+def iter_swapi_category(category, params=None, timeout=10):
+    """Yields every SWAPI entity in a < category > (e.g., "starships"), following each page's
+    "next" link until the last page is reached. Entities are yielded as soon as their page
+    arrives. Pages are only requested once the caller moves past the previous page, so reading
+    a prefix of the first page (e.g., with islice()) makes a single request. From the second
+    page on, the following page is fetched on a background thread while the caller processes
+    the current one, so page latency overlaps with processing.
+
+    Parameters:
+        category (str): category name (a key of < SWAPI_CATEGORY_URLS >) or category url
+        params (dict): optional querystring arguments applied to the first page request
+        timeout (int): timeout value in seconds applied to each page request
+
+    Returns:
+        generator: dictionary representations of the category's entities
+    """
+
+    url = SWAPI_CATEGORY_URLS.get(category, category)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = get_swapi_resource(url, params, timeout)
+        next_page = None
+        while page:
+            for entity in page['results']:
+                yield entity
+
+            # the caller has moved past this page
+            if next_page:
+                page = next_page.result()
+            elif page.get('next'):
+                page = get_swapi_resource(page['next'], None, timeout)
+            else:
+                page = None
+
+            if page and page.get('next'):
+                next_page = executor.submit(get_swapi_resource, page['next'], None, timeout)
+            else:
+                next_page = None
+
+
+def mirror_swapi(dest_dir, categories=None, encoding='utf-8', timeout=10):
+    """Snapshots whole SWAPI categories to local JSON Lines files, one entity per line, named
+    < dest_dir >/< category >.jsonl (e.g., "swapi_mirror/planets.jsonl"). Pages are streamed
+    via < iter_swapi_category > and written as they arrive. Each file is written to a temporary
+    name and then renamed so an interrupted run never leaves a partial snapshot in place.
+
+    Parameters:
+        dest_dir (str): directory to write the snapshot to (created if required)
+        categories (list): optional category names; defaults to every key of
+                           < SWAPI_CATEGORY_URLS >
+        encoding (str): name of encoding used to encode the files
+        timeout (int): timeout value in seconds applied to each page request
+
+    Returns:
+        dict: number of entities written per category
+    """
+
+    if categories is None:
+        categories = list(SWAPI_CATEGORY_URLS.keys())
+
+    os.makedirs(dest_dir, exist_ok=True)
+    counts = {}
+    for category in categories:
+        filepath = os.path.join(dest_dir, f"{category}.jsonl")
+        counts[category] = write_jsonl(
+            f"{filepath}.tmp", iter_swapi_category(category, timeout=timeout), encoding
+        )
+        os.replace(f"{filepath}.tmp", filepath)
+
+    return counts
+
+
+def open_swapi_session(pool_size=SWAPI_POOL_SIZE, retries=SWAPI_RETRIES,
+                       backoff_factor=SWAPI_BACKOFF):
+    """Returns the shared SWAPI < requests.Session >, creating it on first use. The session
+    mounts an < HTTPAdapter > that keeps up to < pool_size > connections alive per host and
+    retries failed GET requests (connection errors, 429 and 5xx responses) with exponential
+    backoff. If a session is already open it is returned unchanged; call
+    < close_swapi_session > first to apply different settings.
+
+    Parameters:
+        pool_size (int): maximum number of pooled connections per host
+        retries (int): maximum number of retries per request
+        backoff_factor (float): base delay in seconds applied between retries
+
+    Returns:
+        requests.Session: shared keep-alive session
+    """
+
+    global _swapi_session
+
+    if _swapi_session is None:
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',)
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _swapi_session = session
+
+    return _swapi_session
+
+
+def open_text_file(filepath, mode='r', encoding='utf-8'):
+    """Opens < filepath > in text < mode > ('r', 'w' or 'a'), transparently compressing or
+    decompressing files whose names end in ".gz" (gzip) or ".zst" (Zstandard; requires the
+    optional < zstandard > package). Plain files opened for writing use a
+    < WRITE_BUFFER_SIZE > buffer so that many small writes reach the disk in large blocks.
+
+    Parameters:
+        filepath (str): path to file
+        mode (str): 'r', 'w' or 'a'
+        encoding (str): name of encoding used to encode/decode the file
+
+    Returns:
+        file object: text-mode file object
+    """
+
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, f"{mode}t", encoding=encoding)
+    if filepath.endswith('.zst'):
+        if zstandard is None:
+            raise ImportError("the zstandard package is required to read or write .zst files")
+        return zstandard.open(filepath, f"{mode}t", encoding=encoding)
+    if mode == 'r':
+        return open(filepath, mode, encoding=encoding)
+
+    return open(filepath, mode, encoding=encoding, buffering=WRITE_BUFFER_SIZE)
+
+
+def reset_swapi_stats():
+    """Resets the counters reported by < get_swapi_stats > to zero.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    with _swapi_lock:
+        for key in _swapi_stats:
+            _swapi_stats[key] = 0
 
 
 def read_csv(filepath, encoding='utf-8', newline='', delimiter=','):
@@ -161,16 +907,60 @@ def read_csv(filepath, encoding='utf-8', newline='', delimiter=','):
         delimiter (str): delimiter that separates the row values
 
     Returns:
-        list: a list of nested "row" lists
+        list: a list of nested "row" lists (see < iter_csv > to stream rows instead)
+    """
+
+    return list(iter_csv(filepath, encoding, newline, delimiter))
+
+
+def read_csv_to_columns(filepath, types=None, encoding='utf-8', newline='', delimiter=',',
+                        list_delimiter=', '):
+    """Reads a CSV file with a header row directly into typed columns. Rows are parsed once,
+    transposed, and each column is converted in a single pass by < convert_csv_column > using
+    the type named for it in < types > (columns not named remain strings). Blank values are
+    recorded in per-column null masks rather than as per-cell None checks. As with
+    csv.DictReader, empty lines are skipped and a row shorter than the header is padded: its
+    missing values are blank, so they are recorded as nulls. A row longer than the header
+    raises ValueError rather than silently losing values.
+
+    Parameters:
+        filepath (str): path to file
+        types (dict): optional column name -> 'int', 'float', 'list', or 'str'
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        list_delimiter (str): delimiter used to split 'list' column values
+
+    Returns:
+        tuple: (columns, nulls) dictionaries keyed by column name (see < columns_to_dicts >)
     """
 
+    if types is None:
+        types = {}
+
     with open(filepath, 'r', encoding=encoding, newline=newline) as file_obj:
-        data = []
         reader = csv.reader(file_obj, delimiter=delimiter)
+        header = next(reader)
+        width = len(header)
+        rows = []
         for row in reader:
-            data.append(row)
+            if len(row) == width:
+                rows.append(row)
+            elif len(row) > width:
+                raise ValueError(
+                    f"{filepath}, line {reader.line_num}: {len(row)} values for {width} columns"
+                )
+            elif row: # short row; empty lines are skipped
+                rows.append(row + [''] * (width - len(row)))
 
-        return data
+    transposed = zip(*rows) if rows else ([] for name in header)
+    columns = {}
+    nulls = {}
+    for name, values in zip(header, transposed):
+        columns[name], nulls[name] = convert_csv_column(values, types.get(name, 'str'), list_delimiter)
+
+    return columns, nulls
 
 
 def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=','):
@@ -185,22 +975,17 @@ def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=','):
         delimiter (str): delimiter that separates the row values
 
     Returns:
-        list: nested dictionaries representing the file contents
+        list: nested dictionaries representing the file contents (see < iter_csv_dicts > to
+              stream rows instead)
      """
 
-    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
-        data = []
-        reader = csv.DictReader(file_obj, delimiter=delimiter)
-        for line in reader:
-            data.append(line) # OrderedDict()
-            # data.append(dict(line)) # convert OrderedDict() to dict
-
-        return data
+    return list(iter_csv_dicts(filepath, encoding, newline, delimiter))
 
 
 def read_json(filepath, encoding='utf-8'):
     """Reads a JSON document, decodes the file content, and returns a list or dictionary if
-    provided with a valid filepath.
+    provided with a valid filepath. Decoding is delegated to < sw_json.read_json >, which uses
+    the fastest installed JSON backend.
 
     Parameters:
         filepath (str): path to file
@@ -210,12 +995,122 @@ def read_json(filepath, encoding='utf-8'):
         dict/list: dict or list representations of the decoded JSON document
     """
 
-    with open(filepath, 'r', encoding=encoding) as file_obj:
-        return json.load(file_obj)
+    return sw_json.read_json(filepath, encoding)
+
+
+@contextmanager
+def swapi_batch():
+    """Context manager that scopes a batch of SWAPI lookups. Inside the < with > block repeated
+    calls to < get_swapi_resource > for the same url and params return the decoded result of
+    the first call instead of fetching again (the same dictionary object is shared, so treat it
+    as read-only). Nested blocks share the outermost batch.
+
+    Usage:
+        with swapi_batch():
+            tatooine = get_swapi_resource(SWAPI_PLANETS, {'search': 'tatooine'})
+            again = get_swapi_resource(SWAPI_PLANETS, {'search': 'tatooine'}) # no fetch
+
+    Parameters:
+        None
+
+    Returns:
+        dict: batch results keyed on request key (bound by the < with > statement)
+    """
+
+    global _swapi_batch
+
+    with _swapi_lock:
+        outermost = _swapi_batch is None
+        if outermost:
+            _swapi_batch = {}
+        batch = _swapi_batch
+    try:
+        yield batch
+    finally:
+        if outermost:
+            with _swapi_lock:
+                _swapi_batch = None
+
+
+@contextmanager
+def swapi_cache(filepath=CACHE_FILEPATH, max_bytes=CACHE_MAX_BYTES, default_ttl=CACHE_DEFAULT_TTL,
+                ttls=None):
+    """Context manager that enables the persistent response cache on entry (see
+    < enable_swapi_cache >) and closes it on exit, including when the block raises, so the
+    SQLite connection is never left open. A cache already enabled by the caller is used as is
+    and left open.
+
+    Usage:
+        with swapi_cache(), swapi_session():
+            planet = get_swapi_resource(SWAPI_PLANETS, {'search': 'tatooine'})
+
+    Parameters:
+        filepath (str): location of the SQLite database
+        max_bytes (int): size cap on stored response bodies; LRU entries evicted beyond it
+        default_ttl (float): time-to-live in seconds for resources without an explicit TTL
+        ttls (dict): optional per-resource TTLs in seconds, e.g., {'people': 3600}
+
+    Returns:
+        SwapiCache: the enabled cache (bound by the < with > statement)
+    """
+
+    outermost = _swapi_cache is None
+    cache = enable_swapi_cache(filepath, max_bytes, default_ttl, ttls)
+    try:
+        yield cache
+    finally:
+        if outermost:
+            disable_swapi_cache()
+
+
+@contextmanager
+def swapi_session(pool_size=SWAPI_POOL_SIZE, retries=SWAPI_RETRIES, backoff_factor=SWAPI_BACKOFF):
+    """Context manager that opens the shared SWAPI session on entry and closes it on exit.
+    Calls to < get_swapi_resource > made inside the < with > block share pooled connections.
+
+    Usage:
+        with swapi_session(pool_size=4):
+            planet = get_swapi_resource(SWAPI_PLANETS, {'search': 'tatooine'})
+
+    Parameters:
+        pool_size (int): maximum number of pooled connections per host
+        retries (int): maximum number of retries per request
+        backoff_factor (float): base delay in seconds applied between retries
+
+    Returns:
+        requests.Session: shared keep-alive session (bound by the < with > statement)
+    """
+
+    session = open_swapi_session(pool_size, retries, backoff_factor)
+    try:
+        yield session
+    finally:
+        close_swapi_session()
+
+
+def top_k(records, key, k=1, largest=True, include=None):
+    """Returns the < k > records with the largest (or, if < largest > is False, the smallest)
+    value of < key >, ordered best first, in a single pass (see < extrema >). Ties are resolved
+    in favor of the record seen first; None values and records failing < include > are skipped.
+
+    Parameters:
+        records (iterable): dictionaries (or other records) to rank
+        key (str | callable): dictionary key, or a function returning the value to rank by
+        k (int): number of records to return
+        largest (bool): True to keep the largest values; False to keep the smallest
+        include (callable): optional predicate; records for which it returns False are skipped
+
+    Returns:
+        list: up to < k > records
+    """
+
+    smallest, largest = _rank(records, key, k, not largest, largest, include)
+    return largest or smallest
 
 
 def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
-    """Serializes object as JSON. Writes content to the provided filepath.
+    """Serializes object as JSON. Writes content to the provided filepath. Encoding is delegated
+    to < sw_json.write_json >; the file content is identical whichever JSON backend is used.
 
     Parameters:
         filepath (str): the path to the file
@@ -229,5 +1124,80 @@ def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
         None
     """
 
-    with open(filepath, 'w', encoding=encoding) as file_obj:
-        json.dump(data, file_obj, ensure_ascii=ensure_ascii, indent=indent)
+    sw_json.write_json(filepath, data, encoding, ensure_ascii, indent)
+
+
+def write_jsonl(filepath, records, encoding='utf-8', ensure_ascii=False):
+    """Serializes each record in < records > as one line of JSON (JSON Lines). Records are
+    encoded and written one at a time, so < records > may be any iterable, including a
+    generator, and is never accumulated in memory. Files ending in ".gz" or ".zst" are
+    compressed (see < open_text_file >).
+
+    Parameters:
+        filepath (str): the path to the file
+        records (iterable): JSON-serializable records
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+
+    Returns:
+        int: number of records written
+    """
+
+    count = 0
+    with open_text_file(filepath, 'w', encoding) as file_obj:
+        for record in records:
+            file_obj.write(json.dumps(record, ensure_ascii=ensure_ascii))
+            file_obj.write('\n')
+            count += 1
+
+    return count
+
+
+def _rank(records, key, k, smallest, largest, include):
+    """Single-pass ranking shared by < extrema > and < top_k >. Fills a bounded heap for each
+    requested side (< smallest >, < largest >) with the first < k > eligible records, after
+    which a record only touches a heap when it beats that heap's worst value, so most records
+    cost one comparison per side.
+
+    Returns:
+        tuple: (smallest, largest) lists of records, each ordered best first
+    """
+
+    get_value = key if callable(key) else itemgetter(key)
+    low, high = [], []
+    records = iter(records)
+    if k > 0 and (smallest or largest):
+        index = -1
+        for index, record in enumerate(records):
+            if include is not None and not include(record):
+                continue
+            value = get_value(record)
+            if value is None:
+                continue
+            if smallest:
+                heappush(low, _Ranked(value, index, record, False))
+            if largest:
+                heappush(high, _Ranked(value, index, record, True))
+            if len(low or high) == k:
+                break
+
+        ceiling = low[0].value if low else None
+        floor = high[0].value if high else None
+        for index, record in enumerate(records, index + 1):
+            if include is not None and not include(record):
+                continue
+            value = get_value(record)
+            if value is None:
+                continue
+            if low and value < ceiling:
+                heapreplace(low, _Ranked(value, index, record, False))
+                ceiling = low[0].value
+            if high and value > floor:
+                heapreplace(high, _Ranked(value, index, record, True))
+                floor = high[0].value
+
+    return (
+        [entry.record for entry in sorted(low, reverse=True)],
+        [entry.record for entry in sorted(high, reverse=True)]
+    )
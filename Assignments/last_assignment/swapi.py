@@ -1,8 +1,138 @@
+import os
+import sw_json
 import sw_utils as utl
-from sw_utils import read_csv, read_csv_to_dicts
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from sw_cache import make_request_key
+from sw_enrich import Enricher, index_by_name
+from sw_schema import Field, NULL_TOKENS, compile_converter
+from sw_stats import load_viewership_stats
+from sw_store import SwapiStore, normalize_name
+from sw_utils import read_csv
+
+
+# Records per task and tasks in flight per worker; see iter_entities().
+ENTITY_CHUNK_SIZE = 5_000
+ENTITY_PREFETCH = 2
+
+# Attributes or members encoded per sw_json.dumps() call; see iter_entity_json().
+ENTITY_JSON_RUN_SIZE = 256
+
+# Clone Wars episode column types and read batch size; see convert_episode_values().
+EPISODE_BATCH_SIZE = 10_000
+EPISODE_COLUMN_TYPES = {
+    'series_season_num': 'int',
+    'series_episode_num': 'int',
+    'season_episode_num': 'int',
+    'episode_prod_code': 'float',
+    'episode_us_viewers_mm': 'float',
+    'episode_writers': 'list'
+}
+
+# Conversion schemas: compiled once into one specialized converter per entity type.
+DROID_FIELDS = (
+    Field('manufacturer', 'manufacturer', 'str'),
+    Field('create_year', 'create_year', 'str'),
+    Field('height_m', 'height', 'float'),
+    Field('mass_kg', 'mass', 'float'),
+    Field('equipment', 'equipment', 'list', None, '|'),
+    Field('url', 'url', 'str')
+)
+PERSON_FIELDS = (
+    Field('height_m', 'height', 'float'),
+    Field('mass_kg', 'mass', 'float')
+)
+PLANET_FIELDS = (
+    Field('name', 'name', 'str'),
+    Field('suns', 'suns', 'int', NULL_TOKENS),
+    Field('moons', 'moons', 'int', NULL_TOKENS),
+    Field('orbital_period_days', 'orbital_period', 'float', NULL_TOKENS),
+    Field('diameter_km', 'diameter', 'int', NULL_TOKENS),
+    Field('gravity_std', 'gravity', 'gravity', NULL_TOKENS),
+    Field('climate', 'climate', 'list', NULL_TOKENS, ', ', True), # tokens interned
+    Field('terrain', 'terrain', 'list', NULL_TOKENS, ', ', True),
+    Field('population', 'population', 'int', NULL_TOKENS),
+    Field('region', 'region', 'str', NULL_TOKENS, None, True),
+    Field('sector', 'sector', 'str', NULL_TOKENS, None, True),
+    Field('url', 'url', 'str', NULL_TOKENS)
+)
+STARSHIP_FIELDS = (
+    Field('manufacturer', 'manufacturer', 'str'),
+    Field('length_m', 'length', 'float'),
+    Field('max_atmosphering_speed', 'max_atmosphering_speed', 'int'),
+    Field('hyperdrive_rating', 'hyperdrive_rating', 'float'),
+    Field('MGLT', 'MGLT', 'int', NULL_TOKENS),
+    Field('armament', 'armament', 'list', None, ','),
+    Field('cargo_capacity_kg', 'cargo_capacity', 'int'),
+    Field('consumables', 'consumables', 'str')
+)
+
+# Entity converters bypass CachedEntity.__setattr__ (writing through the slot descriptors) and
+# clear the cached representation once. They are compiled below, once the classes exist.
+
+
+class CachedEntity:
+    """Base class that memoizes an entity's < jsonable() > representation.
+
+    The first call to < _jsonable() > builds the representation and caches it; later calls
+    return the same object by reference, so an entity shared by several others (e.g., a
+    homeworld shared by many people) is serialized once per batch. Assigning or deleting any
+    attribute marks the cache stale (< __setattr__ > clears it, acting as a dirty flag).
+    Representations that embed nested entities (a person's homeworld, a starship's crew) are
+    also rebuilt when a nested entity's own representation changes, which is detected by
+    identity.
+
+    < jsonable() > returns a shallow copy of the cached representation, so callers may add,
+    replace or remove its entries without corrupting the cache. Nested representations (e.g.,
+    the "homeworld" dictionary of a person) are still shared and must be treated as read-only.
+    The copy is the price of that safety: a warm < jsonable() > call costs one dict (or list)
+    copy, several times the by-reference lookup of < _jsonable() > (~0.26 vs ~0.06 us for a
+    planet, CPython 3.11). Code in this module that only reads the representation (serializers,
+    nested entities) calls < _jsonable() > and skips the copy. A read-only MappingProxyType is
+    not returned instead because json.dump() and orjson cannot serialize it.
+    In-place changes to a mutable attribute value (e.g., appending to < Planet.climate >) are
+    not tracked; reassign the attribute instead.
 
+    Methods:
+        jsonable: return a shallow copy of the JSON-friendly representation
+        _jsonable: implemented by subclasses; return the cached representation
+    """
+
+    __slots__ = ('_json',) # cached representation; None when stale
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        object.__setattr__(self, '_json', None)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, '_json', None)
+
+    def jsonable(self):
+        """Returns a JSON-friendly representation of the object: a shallow copy of the cached
+        representation built by < _jsonable() >.
+
+        Parameters:
+            None
 
-class Crew:
+        Returns:
+            dict | list: representation of the object's instance variables (a new shallow copy
+                         on every call; see the class docstring for its cost)
+        """
+
+        return self._jsonable().copy()
+
+    def _cache(self, data):
+        """Caches and returns < data >, the freshly built representation."""
+
+        object.__setattr__(self, '_json', data)
+        return data
+
+
+class Crew(CachedEntity):
     """Represents a Starship or Vehicle crew.
 
     Attributes:
@@ -29,6 +159,7 @@ class Crew:
             None
         """
 
+        self._json = None # cache lives in a slot (see CachedEntity), not in __dict__
         for key, val in crew_members.items():
             setattr(self, key, val) # call built-in function
 
@@ -48,13 +179,14 @@ class Crew:
 
         return crew
 
-    def jsonable(self):
+    def _jsonable(self):
         """Returns a JSON-friendly representation of the object. Loops over a < Crew > instance's
         __dict__ items and assigns new key-value pairs to an empty dictionary using the existing
         key as the new key and a dictionary representation of the < Person > or < Droid > instance
         as the value. After the loop terminates the new dictionary is returned to the caller.
         Do not simply return self.__dict__. It can be intercepted and mutated, adding, modifying
-        and/or removing instance attributes as a result.
+        and/or removing instance attributes as a result. The dictionary is cached and rebuilt
+        only when a crew member is reassigned or changed (see < CachedEntity >).
 
         Parameters:
             None
@@ -63,16 +195,28 @@ class Crew:
             dict: dictionary of the object's instance variables
         """
 
-        crew = {}
-        for key, val in self.__dict__.items():
-            crew[key] = val.jsonable() # person or droid object
+        crew = self._json
+        if crew is not None:
+            for key, val in self.__dict__.items():
+                if crew[key] is not _get_jsonable(val): # crew member changed
+                    crew = None
+                    break
+
+        if crew is None:
+            crew = {}
+            for key, val in self.__dict__.items():
+                crew[key] = _get_jsonable(val) # person or droid object
+            self._cache(crew)
 
         return crew
 
 
-class Droid:
+class Droid(CachedEntity):
     """Represents a mechanical being that possesses artificial intelligence.
 
+    Instances use __slots__ rather than a per-instance __dict__: ~104 bytes per instance excluding
+    attribute values, versus ~144 bytes with a __dict__ (CPython 3.11; see benchmarks/entities.py).
+
     Attributes:
        Required
             url (str): identifier/locator (required)
@@ -90,6 +234,10 @@ class Droid:
         store_instructions: provides Droid instance with data to store
     """
 
+    __slots__ = (
+        'url', 'name', 'model', 'manufacturer', 'create_year', 'height_m', 'mass_kg', 'equipment'
+    )
+
     def __init__(self, url, name, model):
         """Initialize a Droid instance."""
 
@@ -107,11 +255,12 @@ class Droid:
 
         return self.name
 
-    def jsonable(self):
+    def _jsonable(self):
         """Returns a JSON-friendly representation of the object. Use a dictionary literal rather
         than a built-in dict() to avoid built-in lookup costs. Do not simply return self.__dict__.
         It can be intercepted and mutated, adding, modifying and/or removing instance attributes as
         a result.
+        The dictionary is cached and shared (see < CachedEntity >); < jsonable() > returns a copy.
 
         Parameters:
             None
@@ -130,19 +279,307 @@ class Droid:
             equipment
         """
 
-        return {
-            'url': self.url,
-            'name': self.name,
-            'model': self.model,
-            'manufacturer': self.manufacturer,
-            'create_year': self.create_year,
-            'height_m': self.height_m,
-            'mass_kg': self.mass_kg,
-            'equipment': self.equipment
-        }
+        droid = self._json
+        if droid is None:
+            droid = self._cache({
+                'url': self.url,
+                'name': self.name,
+                'model': self.model,
+                'manufacturer': self.manufacturer,
+                'create_year': self.create_year,
+                'height_m': self.height_m,
+                'mass_kg': self.mass_kg,
+                'equipment': self.equipment
+            })
+
+        return droid
+
+
+class FleetManifest:
+    """Crew and passenger assignments for a fleet of starships, built in batches.
+
+    Members (< Person > or < Droid > instances) are stored by reference and indexed by url, as
+    are the starships, so finding the starship and role of a member, or the crew and passengers
+    of a starship, is a dictionary lookup. A member holds at most one posting: assigning a
+    member who is already posted moves the member, and assigning a crew role already filled
+    replaces its holder. Assignments are recorded in the manifest; < sync() > then assigns
+    fresh < Crew > and < Passengers > instances to the starships changed since the last sync
+    (see < Starship.assign_crew_members > and < Starship.add_passengers >).
+
+    Attributes:
+        ships (dict): starship url -> Starship
+        members (dict): member url -> Person | Droid
+        crews (dict): starship url -> {role: member url}
+        passengers (dict): starship url -> {member url: None} (passengers in boarding order)
+        postings (dict): member url -> (starship url, role); role is None for passengers
+
+    Methods:
+        add_ships: index starships by url
+        assign: assign a batch of crew members and passengers
+        get_crew: return a starship's crew members by role
+        get_passengers: return a starship's passengers
+        get_posting: return the starship and role of a member
+        is_aboard: check whether a member is posted to a starship
+        remove_member: remove a member's posting
+        sync: assign Crew and Passengers instances to the changed starships
+    """
+
+    def __init__(self, starships=None):
+        """Initialize a FleetManifest instance, indexing the optional < starships >."""
+
+        self.ships = {}
+        self.members = {}
+        self.crews = {}
+        self.passengers = {}
+        self.postings = {}
+        self._changed = set() # starship urls changed since the last sync()
+        if starships:
+            self.add_ships(starships)
+
+    def __contains__(self, member_url):
+        return member_url in self.postings
+
+    def __len__(self):
+        return len(self.postings)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"FleetManifest: {len(self.ships)} starships, {len(self)} members posted"
+
+    def add_ships(self, starships):
+        """Indexes each < Starship > in < starships > by url. A starship whose url is already
+        indexed is replaced; its postings are kept.
+
+        Parameters:
+            starships (iterable): < Starship > instances
+
+        Returns:
+            None
+        """
+
+        for starship in starships:
+            self.ships[starship.url] = starship
+            self.crews.setdefault(starship.url, {})
+            self.passengers.setdefault(starship.url, {})
+            self._changed.add(starship.url)
+
+    def assign(self, assignments):
+        """Records a batch of postings. Each assignment is a (starship url, member, role) tuple;
+        a role (e.g., "pilot") posts the member to the crew and None boards the member as a
+        passenger. Members are indexed by url. Each assignment costs O(1), so thousands of
+        members can be assigned to thousands of starships in one pass.
+
+        Parameters:
+            assignments (iterable): (starship url, < Person > | < Droid >, role | None) tuples
+
+        Returns:
+            int: number of assignments recorded
+        """
+
+        count = 0
+        for ship_url, member, role in assignments:
+            if ship_url not in self.ships:
+                raise KeyError(f"unknown starship: {ship_url}")
+            self.remove_member(member.url)
+            self.members[member.url] = member
+            if role is None:
+                self.passengers[ship_url][member.url] = None
+            else:
+                replaced = self.crews[ship_url].get(role)
+                if replaced is not None:
+                    self.remove_member(replaced)
+                self.crews[ship_url][role] = member.url
+            self.postings[member.url] = (ship_url, role)
+            self._changed.add(ship_url)
+            count += 1
+
+        return count
 
+    def get_crew(self, ship_url):
+        """Returns the crew members of the starship identified by < ship_url >.
+
+        Parameters:
+            ship_url (str): starship url
+
+        Returns:
+            dict: {role: < Person > | < Droid >} in assignment order
+        """
+
+        return {role: self.members[url] for role, url in self.crews[ship_url].items()}
+
+    def get_passengers(self, ship_url):
+        """Returns the passengers of the starship identified by < ship_url >.
+
+        Parameters:
+            ship_url (str): starship url
+
+        Returns:
+            list: < Person > and/or < Droid > instances in boarding order
+        """
+
+        return [self.members[url] for url in self.passengers[ship_url]]
+
+    def get_posting(self, member_url):
+        """Returns the posting of the member identified by < member_url >.
+
+        Parameters:
+            member_url (str): member url
+
+        Returns:
+            tuple: (< Starship >, role) where role is None for a passenger; None if not posted
+        """
+
+        posting = self.postings.get(member_url)
+        if posting is None:
+            return None
+
+        return self.ships[posting[0]], posting[1]
+
+    def is_aboard(self, member_url, ship_url):
+        """Checks whether the member identified by < member_url > is posted, as crew or as a
+        passenger, to the starship identified by < ship_url >.
+
+        Parameters:
+            member_url (str): member url
+            ship_url (str): starship url
 
-class Passengers:
+        Returns:
+            bool: True if the member is aboard; otherwise False
+        """
+
+        posting = self.postings.get(member_url)
+        return posting is not None and posting[0] == ship_url
+
+    def remove_member(self, member_url):
+        """Removes the posting of the member identified by < member_url >, if any.
+
+        Parameters:
+            member_url (str): member url
+
+        Returns:
+            bool: True if a posting was removed; otherwise False
+        """
+
+        posting = self.postings.pop(member_url, None)
+        if posting is None:
+            return False
+
+        ship_url, role = posting
+        if role is None:
+            del self.passengers[ship_url][member_url]
+        else:
+            del self.crews[ship_url][role]
+        del self.members[member_url]
+        self._changed.add(ship_url)
+
+        return True
+
+    def sync(self):
+        """Assigns a < Crew > and a < Passengers > instance built from the manifest to each
+        starship changed since the last sync (None where a starship has no crew or no
+        passengers). Unchanged starships keep their instances, and their cached
+        < jsonable() > representations.
+
+        Parameters:
+            None
+
+        Returns:
+            int: number of starships updated
+        """
+
+        for ship_url in self._changed:
+            starship = self.ships[ship_url]
+            crew = self.get_crew(ship_url)
+            passengers = self.get_passengers(ship_url)
+            starship.assign_crew_members(Crew(crew) if crew else None)
+            starship.add_passengers(Passengers(passengers) if passengers else None)
+        count = len(self._changed)
+        self._changed.clear()
+
+        return count
+
+
+class IdentityMap:
+    """Maps entity references to the single instance created for each entity so that an entity
+    referenced many times (e.g., a homeworld shared by many people) is fetched, converted and
+    serialized once. A reference is an entity url, normalized with < sw_cache.make_request_key >,
+    or (as in merged Wookieepedia data) an entity name, normalized with < normalize_name >.
+    Memory grows with the number of distinct entities rather than with the number of
+    references.
+
+    Attributes:
+        instances (dict): normalized reference -> instance
+        hits (int): number of lookups answered with an existing instance
+        misses (int): number of lookups that created a new instance
+
+    Methods:
+        clear: remove all instances
+        get: return the instance for a reference, creating it on first use
+    """
+
+    def __init__(self):
+        """Initialize an empty IdentityMap instance."""
+
+        self.instances = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, ref):
+        return self._make_key(ref) in self.instances
+
+    def __len__(self):
+        return len(self.instances)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"IdentityMap: {len(self)} instances ({self.hits} hits, {self.misses} misses)"
+
+    def clear(self):
+        """Removes all instances and resets the hit/miss counters.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        self.instances.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, ref, create, *args):
+        """Returns the instance identified by < ref >. On first use the instance is created by
+        calling < create >(*< args >) and remembered; later calls return the same instance.
+
+        Parameters:
+            ref (str): entity url or name
+            create (callable): factory called to create the instance on a miss
+            args (tuple): arguments passed to < create >
+
+        Returns:
+            object: the shared instance
+        """
+
+        key = self._make_key(ref)
+        instance = self.instances.get(key)
+        if instance is None:
+            self.misses += 1
+            instance = self.instances[key] = create(*args)
+        else:
+            self.hits += 1
+
+        return instance
+
+    def _make_key(self, ref):
+        """Returns the normalized key of an entity url or name."""
+
+        return make_request_key(ref) if ref.startswith('http') else normalize_name(ref)
+
+
+class Passengers(CachedEntity):
     """Represents passengers carried on a Starship or Vehicle.
 
     Attributes:
@@ -182,8 +619,9 @@ class Passengers:
             None
         """
 
+        self._json = None # cache lives in a slot (see CachedEntity), not in __dict__
         for data in passengers:
-            setattr(self, data.name, data.jsonable()) # call built-in function
+            setattr(self, data.name, data) # call built-in function
 
     def __str__(self):
         """Loops over instance variable values and returns a string representation of each
@@ -198,12 +636,14 @@ class Passengers:
 
         return passengers
 
-    def jsonable(self):
+    def _jsonable(self):
         """Returns a JSON-friendly representation of the object. Loops over the < Passengers >
         instance's __dict__ values and converts each < Person > or < Droid > object encountered
         to a dictionary. Accumulates dictionaries in a < list >.  After the loop terminates the
         new list is returned to the caller. Do not simply return self.__dict__. It can be
         intercepted and mutated, adding, modifying and/or removing instance attributes as a result.
+        The list is cached and rebuilt only when a passenger is added, removed or changed (see
+        < CachedEntity >).
 
         Parameters:
             None
@@ -212,29 +652,49 @@ class Passengers:
             list: nested person or droid dictionaries
         """
 
-        passengers = []
-        for val in self.__dict__.items():
-            passengers = val.jsonable() # person or droid object
+        passengers = self._json
+        if passengers is not None:
+            for data, val in zip(passengers, self.__dict__.values()):
+                if data is not _get_jsonable(val): # passenger changed
+                    passengers = None
+                    break
+
+        if passengers is None:
+            passengers = []
+            for val in self.__dict__.values():
+                passengers.append(_get_jsonable(val)) # person or droid object
+            self._cache(passengers)
 
         return passengers
 
 
-class Person:
+class Person(CachedEntity):
     """Represents a person.
 
+    Instances use __slots__ rather than a per-instance __dict__: ~96 bytes per instance excluding
+    attribute values, versus ~136 bytes with a __dict__ (CPython 3.11; see benchmarks/entities.py).
+
     Attributes:
         url (str): identifer/locator
         name (str): person name
         birth_year (str): person's birth_year
         height_m (float): person's height in centimeters
         mass_kg (float): person's weight in kilograms
-        homeworld (Planet): person's home planet
+        homeworld (Planet): person's home planet. create_person() assigns a < Planet > instance
+                            (it previously assigned the planet's jsonable() dictionary, so
+                            callers that subscript it, e.g. person.homeworld['name'], must use
+                            person.homeworld.name or person.jsonable()['homeworld']); a
+                            dictionary assigned directly is still serialized as is
         force_sensitive (bool): ability to harness the power of the Force.
 
     Methods:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    __slots__ = (
+        'url', 'name', 'birth_year', 'height_m', 'mass_kg', 'homeworld', 'force_sensitive'
+    )
+
     def __init__(self, url, name, birth_year, force_sensitive=False):
         """Initialize a Person instance."""
         self.url = url
@@ -250,11 +710,12 @@ class Person:
 
         return self.name
 
-    def jsonable(self):
+    def _jsonable(self):
         """Return a JSON-friendly representation of the object. Use a dictionary literal rather
         than a built-in dict() to avoid built-in lookup costs. Do not simply return self.__dict__.
         It can be intercepted and mutated, adding, modifying and/or removing instance attributes
         as a result.
+        The dictionary is cached and shared (see < CachedEntity >); < jsonable() > returns a copy.
 
         Parameters:
             None
@@ -272,21 +733,29 @@ class Person:
            force_sensitive
         """
 
-        return {
-            'url': self.url,
-            'name': self.name,
-            'birth_year': self.birth_year,
-            'height_m': self.height_m,
-            'mass_kg': self.mass_kg,
-            'homeworld': self.homeworld,
-            'force_sensitive': self.force_sensitive
-        }
+        homeworld = _get_jsonable(self.homeworld) # None, Planet or (legacy) dictionary
+        person = self._json
+        if person is None or person['homeworld'] is not homeworld: # shared planet dictionary
+            person = self._cache({
+                'url': self.url,
+                'name': self.name,
+                'birth_year': self.birth_year,
+                'height_m': self.height_m,
+                'mass_kg': self.mass_kg,
+                'homeworld': homeworld,
+                'force_sensitive': self.force_sensitive
+            })
 
+        return person
 
 
-class Planet:
+
+class Planet(CachedEntity):
     """Represents a planet.
 
+    Instances use __slots__ rather than a per-instance __dict__: ~136 bytes per instance excluding
+    attribute values, versus ~176 bytes with a __dict__ (CPython 3.11; see benchmarks/entities.py).
+
     Attributes:
         url (str): identifier/locator
         name (str): planet name
@@ -306,16 +775,21 @@ class Planet:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    __slots__ = (
+        'url', 'name', 'region', 'sector', 'suns', 'moons', 'orbital_period_days', 'diameter_km',
+        'gravity_std', 'climate', 'terrain', 'population'
+    )
+
     def __init__(self, url, name):
         """Initialize a Planet instance."""
         self.url = url
         self.name = name
         self.region = None
-        self. sector = None
+        self.sector = None
         self.suns = None
         self.moons = None
         self.orbital_period_days = None
-        self. diameter_km = None
+        self.diameter_km = None
         self.gravity_std = None
         self.climate = None
         self.terrain = None
@@ -326,11 +800,12 @@ class Planet:
 
         return self.name
 
-    def jsonable(self):
+    def _jsonable(self):
         """Return a JSON-friendly representation of the object. Use a dictionary literal rather
         than built-in dict() to avoid built-in lookup costs. Do not simply return self.__dict__.
         It can be intercepted and mutated, adding, modifying and/or removing instance attributes
         as a result.
+        The dictionary is cached and shared (see < CachedEntity >); < jsonable() > returns a copy.
 
         Parameters:
             None
@@ -353,25 +828,32 @@ class Planet:
             population
         """
 
-        return {
-            'url': self.url,
-            'name': self.name,
-            'region': self.region,
-            'sector': self. sector,
-            'suns': self.suns,
-            'moons': self.moons,
-            'orbital_period_days': self.orbital_period_days,
-            'diameter_km': self. diameter_km,
-            'gravity_std': self.gravity_std,
-            'climate': self.climate,
-            'terrain': self.terrain,
-            'population': self.population,
-        }
-
-
-class Starship:
+        planet = self._json
+        if planet is None:
+            planet = self._cache({
+                'url': self.url,
+                'name': self.name,
+                'region': self.region,
+                'sector': self.sector,
+                'suns': self.suns,
+                'moons': self.moons,
+                'orbital_period_days': self.orbital_period_days,
+                'diameter_km': self.diameter_km,
+                'gravity_std': self.gravity_std,
+                'climate': self.climate,
+                'terrain': self.terrain,
+                'population': self.population,
+            })
+
+        return planet
+
+
+class Starship(CachedEntity):
     """A crewed vehicle used for traveling in realspace or hyperspace.
 
+    Instances use __slots__ rather than a per-instance __dict__: ~152 bytes per instance excluding
+    attribute values, versus ~200 bytes with a __dict__ (CPython 3.11; see benchmarks/entities.py).
+
     Attributes:
         url (str): identifier/locator
         name (str): starship name or nickname
@@ -394,6 +876,12 @@ class Starship:
         jsonable: return JSON-friendly dict representation of the object
     """
 
+    __slots__ = (
+        'url', 'name', 'model', 'starship_class', 'manufacturer', 'length_m',
+        'max_atmosphering_speed', 'hyperdrive_rating', 'MGLT', 'armament', 'crew_members',
+        'passengers_on_board', 'cargo_capacity_kg', 'consumables'
+    )
+
     def __init__(self, url, name, model, starship_class):
         """Initalize instance of a Starship."""
 
@@ -456,11 +944,12 @@ class Starship:
 
 
 
-    def jsonable(self):
+    def _jsonable(self):
         """Return a JSON-friendly representation of the object. Use a dictionary literal rather
         than a built-in dict() to avoid built-in lookup costs. Do not simply return self.__dict__.
         It can be intercepted and mutated, adding, modifying or removing instance attributes as a
         result.
+        The dictionary is cached and shared (see < CachedEntity >); < jsonable() > returns a copy.
 
         Parameters:
             None
@@ -485,36 +974,193 @@ class Starship:
             consumables
         """
         if self.crew_members:
-            crew_members = self.crew_members.jsonable()
+            crew_members = self.crew_members._jsonable()
         else:
             crew_members = None
         if self.passengers_on_board:
-            passengers_on_board = self.passengers_on_board.jsonable()
+            passengers_on_board = self.passengers_on_board._jsonable()
         else:
             passengers_on_board = None
-        return{
-            'url': self.url,
-            'name': self.name,
-            'model': self.model,
-            'starship_class': self.starship_class,
-            'manufacturer': self.manufacturer,
-            'length_m': self.length_m,
-            'max_atmosphering_speed': self.max_atmosphering_speed,
-            'hyperdrive_rating': self.hyperdrive_rating,
-            'MGLT': self.MGLT,
-            'armament': self.armament,
-            'crew_members': crew_members,
-            'passengers_on_board': passengers_on_board,
-            'cargo_capacity_kg': self.cargo_capacity_kg,
-            'consumables': self.consumables
-        }
+
+        starship = self._json
+        if (
+            starship is None
+            or starship['crew_members'] is not crew_members
+            or starship['passengers_on_board'] is not passengers_on_board
+        ):
+            starship = self._cache({
+                'url': self.url,
+                'name': self.name,
+                'model': self.model,
+                'starship_class': self.starship_class,
+                'manufacturer': self.manufacturer,
+                'length_m': self.length_m,
+                'max_atmosphering_speed': self.max_atmosphering_speed,
+                'hyperdrive_rating': self.hyperdrive_rating,
+                'MGLT': self.MGLT,
+                'armament': self.armament,
+                'crew_members': crew_members,
+                'passengers_on_board': passengers_on_board,
+                'cargo_capacity_kg': self.cargo_capacity_kg,
+                'consumables': self.consumables
+            })
+
+        return starship
+
+
+class WriterIndex:
+    """Inverted index that maps each writer to the ids of the episodes they contributed to.
+
+    The index is built in a single pass over the episodes and maintained incrementally: adding
+    or removing an episode touches only the postings of that episode's writers, so importing a
+    new episode never requires regrouping the catalog. Postings are kept sorted by episode id,
+    optionally as compact integer arrays.
+
+    Attributes:
+        episodes (dict): episode id -> episode dictionary
+        postings (dict): writer name -> episode ids (array or list) in ascending order
+
+    Methods:
+        add_episode: index an episode and return its id
+        get_episodes: return the episodes a writer contributed to
+        group: return the writer -> episodes grouping (see < group_episodes_by_writer >)
+        remove_episode: remove an episode from the index
+    """
+
+    def __init__(self, episodes=None, typecode='q'):
+        """Initialize a WriterIndex instance, adding each episode in < episodes > (if any).
+        Postings are stored as < array >(typecode) columns; pass typecode=None to use lists."""
+
+        self.episodes = {}
+        self.postings = {}
+        self._typecode = typecode
+        self._next_id = 0
+
+        if episodes:
+            for episode in episodes:
+                self.add_episode(episode)
+
+    def __len__(self):
+        return len(self.episodes)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"WriterIndex: {len(self.postings)} writers, {len(self.episodes)} episodes"
+
+    def add_episode(self, episode, episode_id=None):
+        """Adds < episode > to the index under < episode_id > (by default the next unused id, so
+        ids follow the order in which episodes are added).
+
+        Parameters:
+            episode (dict): episode dictionary with converted "episode_writers"
+            episode_id (int): optional unique episode id
+
+        Returns:
+            int: the episode id
+        """
+
+        if episode_id is None:
+            episode_id = self._next_id
+        if episode_id in self.episodes:
+            raise ValueError(f"episode id {episode_id} is already indexed")
+        self._next_id = max(self._next_id, episode_id + 1)
+
+        self.episodes[episode_id] = episode
+        for writer in get_episode_writers(episode):
+            postings = self.postings.get(writer)
+            if postings is None:
+                postings = self.postings[writer] = array(self._typecode) if self._typecode else []
+            if not postings or postings[-1] < episode_id:
+                postings.append(episode_id)
+            else:
+                insort(postings, episode_id)
+
+        return episode_id
+
+    def get_episodes(self, writer):
+        """Returns the episodes that < writer > contributed to, in episode id order.
+
+        Parameters:
+            writer (str): writer name
+
+        Returns:
+            list: episode dictionaries (empty if the writer is not indexed)
+        """
+
+        return [self.episodes[episode_id] for episode_id in self.postings.get(writer, ())]
+
+    def group(self):
+        """Returns a dictionary that maps each writer to the episodes they contributed to. The
+        result is identical to regrouping the indexed episodes (in id order) from scratch:
+        writers appear in order of their first episode and, within an episode, in the order
+        they are credited.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: writer name -> list of episode dictionaries
+        """
+
+        def first_credit(writer):
+            first_id = self.postings[writer][0]
+            return first_id, get_episode_writers(self.episodes[first_id]).index(writer)
+
+        return {writer: self.get_episodes(writer) for writer in sorted(self.postings, key=first_credit)}
+
+    def remove_episode(self, episode_id):
+        """Removes the episode indexed under < episode_id >. Writers left without episodes are
+        removed from the index.
+
+        Parameters:
+            episode_id (int): episode id returned by < add_episode >
+
+        Returns:
+            dict: the removed episode dictionary
+        """
+
+        episode = self.episodes.pop(episode_id)
+        for writer in get_episode_writers(episode):
+            postings = self.postings[writer]
+            del postings[bisect_left(postings, episode_id)]
+            if not postings:
+                del self.postings[writer]
+
+        return episode
+
+
+# Entity kinds built by iter_entities(): kind -> (class, constructor keys, converted fields)
+ENTITY_KINDS = {
+    'droids': (Droid, ('url', 'name', 'model'), DROID_FIELDS),
+    'people': (Person, ('url', 'name', 'birth_year', 'force_sensitive'), PERSON_FIELDS),
+    'planets': (Planet, ('url', 'name'), PLANET_FIELDS), # url, name reassigned from PLANET_FIELDS
+    'starships': (Starship, ('url', 'name', 'model', 'starship_class'), STARSHIP_FIELDS)
+}
+
+convert_droid_fields = compile_converter(
+    DROID_FIELDS, 'convert_droid_fields', 'object', '_json', Droid
+)
+convert_person_fields = compile_converter(
+    PERSON_FIELDS, 'convert_person_fields', 'object', '_json', Person
+)
+convert_planet_fields = compile_converter(
+    PLANET_FIELDS, 'convert_planet_fields', 'object', '_json', Planet
+)
+convert_starship_fields = compile_converter(
+    STARSHIP_FIELDS, 'convert_starship_fields', 'object', '_json', Starship
+)
+
+# Row converters compiled on first use in each (worker) process; see _convert_entity_rows().
+_ROW_CONVERTERS = {}
 
 
 def convert_episode_values(episodes):
     """Converts select string values to either int, float, list, or None in the passed in list of
-    nested dictionaries. The function delegates to the `convert_to_*` functions located in the
-    module `swapi_utils` the task of converting the specified strings to either int, float, or
-    list. Converting empty or blank values to None is handled locally.
+    nested dictionaries. Each column is gathered and converted in a single pass by
+    < sw_utils.convert_csv_column > (see < EPISODE_COLUMN_TYPES >) and the converted values are
+    written back to the episode dictionaries, so the cost is one pass per column rather than
+    repeated conversions per cell. Blank or empty values are converted to None.
 
     Conversions:
         str to None: all blank or empty values
@@ -529,22 +1175,16 @@ def convert_episode_values(episodes):
         list: nested episode dictionaries containing mutated key-value pairs
     """
 
-    for episode in episodes:
-        for key in episode:
-            if not episode[key]:
-                episode[key] = None
-            if episode['series_season_num']:
-                episode['series_season_num'] = utl.convert_to_int(episode['series_season_num'])
-            if episode['series_episode_num']:
-                episode['series_episode_num'] = utl.convert_to_int(episode['series_episode_num'])
-            if episode['season_episode_num']:
-                episode['season_episode_num'] = utl.convert_to_int(episode['season_episode_num'])
-            if episode['episode_prod_code']:
-                episode['episode_prod_code'] = utl.convert_to_float(episode['episode_prod_code'])
-            if episode['episode_us_viewers_mm']:
-                episode['episode_us_viewers_mm'] = utl.convert_to_float(episode['episode_us_viewers_mm'])
-            if episode['episode_writers']:
-                episode['episode_writers'] = utl.convert_to_list(episode['episode_writers'],', ')
+    if not episodes:
+        return episodes
+
+    for key in episodes[0]:
+        column, nulls = utl.convert_csv_column(
+            [episode[key] for episode in episodes], EPISODE_COLUMN_TYPES.get(key, 'str'), ', '
+        )
+        for episode, value, null in zip(episodes, column, nulls):
+            episode[key] = None if null else value
+
     return episodes
 
 
@@ -554,7 +1194,9 @@ def count_episodes_by_director(episodes):
     """Constructs and returns a dictionary of key-value pairs that associate each director with a
     count of the episodes that they directed. The director's name comprises the key and the
     associated value a count of the number of episodes they directed. Duplicate keys are NOT
-    permitted.
+    permitted. Directors appear in order of their first episode. Counting is delegated to
+    < sw_utils.count_by > (a single pass), so any director is counted and < episodes > may be
+    any iterable of episodes, including a stream.
 
     Format:
         {
@@ -564,69 +1206,14 @@ def count_episodes_by_director(episodes):
         }
 
     Parameters:
-        episodes (list): nested episode dictionaries
+        episodes (iterable): nested episode dictionaries
 
     Returns:
         dict: a dictionary that store counts of the number of episodes directed
               by each director
     """
-    name_accum = []
-    count_accum = []
-    Bullock = 0
-    Filoni = 0
-    Connell = 0
-    Ridge = 0
-    Coleman = 0
-    Yeh = 0
-    Takeuchi = 0
-    Lee = 0
-    Volpe = 0
-    Dalva = 0
-    Dunlevy = 0
-    for episode in episodes:
-        for key in episode:
-            if episode['episode_director'] in name_accum:
-                continue
-            else:
-                name_accum.append(episode['episode_director'])
-    for episode in episodes:
-        if 'Dave Bullock' in episode['episode_director']:
-            Bullock = Bullock + 1
-        elif 'Dave Filoni' in episode['episode_director']:
-            Filoni = Filoni + 1
-        elif "Brian Kalin O'Connell" in episode['episode_director']:
-            Connell = Connell + 1
-        elif "Justin Ridge" in episode['episode_director']:
-            Ridge = Ridge + 1
-        elif 'Rob Coleman' in episode['episode_director']:
-            Coleman = Coleman + 1
-        elif 'Jesse Yeh' in episode['episode_director']:
-            Yeh = Yeh + 1
-        elif 'Atsushi Takeuchi' in episode['episode_director']:
-            Takeuchi = Takeuchi + 1
-        elif 'Steward Lee' in episode['episode_director']:
-            Lee = Lee + 1
-        elif 'Giancarlo Volpe' in episode['episode_director']:
-            Volpe = Volpe + 1
-        elif 'Robert Dalva' in episode['episode_director']:
-            Dalva = Dalva + 1
-        elif 'Kyle Dunlevy' in episode['episode_director']:
-            Dunlevy = Dunlevy +1
-    count_accum.append(Bullock)
-    count_accum.append(Filoni)
-    count_accum.append(Connell)
-    count_accum.append(Ridge)
-    count_accum.append(Coleman)
-    count_accum.append(Yeh)
-    count_accum.append(Takeuchi)
-    count_accum.append(Lee)
-    count_accum.append(Volpe)
-    count_accum.append(Dalva)
-    count_accum.append(Dunlevy)
-    director_dict = dict(zip(name_accum,count_accum))
-    return(director_dict)
-
 
+    return dict(utl.count_by(episodes, 'episode_director'))
 
 
 def create_droid(data):
@@ -645,23 +1232,72 @@ def create_droid(data):
     Returns:
         Droid: new < Droid > instance
     """
-    for a in data:
-        utl.convert_to_none(a)
-    new_instance = Droid(data, data['name'], data['model'])
-    new_instance.manufacturer = data['manufacturer']
-    new_instance.create_year = data['create_year']
-    new_instance.height_m = utl.convert_to_float(data['height'])
-    new_instance.mass_kg = utl.convert_to_float(data['mass'])
-    new_instance.equipment = utl.convert_to_list(data['equipment'],'|')
-    new_instance.url = data['url']
-    return new_instance
+    new_instance = Droid(data['url'], data['name'], data['model'])
+    return convert_droid_fields(data, new_instance) # see DROID_FIELDS
+
+
+def create_entities(kind, records, workers=None, chunksize=ENTITY_CHUNK_SIZE, planets=None,
+                    store=None, homeworlds=None):
+    """Creates one entity instance per dictionary in < records > and returns them in a list, in
+    input order. A list() wrapper around < iter_entities >, which converts the records in
+    parallel; see it for the parameters.
+
+    Parameters:
+        kind (str): entity kind, a key of < ENTITY_KINDS > ('droids', 'people', 'planets',
+                    'starships')
+        records (iterable): source dictionaries
+        workers (int): number of worker processes (None uses every core)
+        chunksize (int): number of records converted per task
+        planets (dict | list): optional supplemental planetary data ('people' only)
+        store (SwapiStore): optional local entity store ('people' only)
+        homeworlds (IdentityMap): optional identity map shared across batches ('people' only)
+
+    Returns:
+        list: new < Droid >, < Person >, < Planet > or < Starship > instances
+    """
 
-def create_person(data, planets=None):
+    return list(
+        iter_entities(kind, records, workers, chunksize, planets, store, homeworlds)
+    )
+
+
+def create_homeworld(homeworld, planets=None, store=None):
+    """Creates the < Planet > instance identified by a person's < homeworld > url or name. Calls
+    < find_swapi_entity() > to retrieve the planet data; if a local < store > is passed in the
+    planet is resolved from its indexes without touching the network. Adds additional planet
+    information to the planet data dictionary if optional < planets > supplemental data is
+    passed in. Pass a name-keyed index (e.g., < Enricher.indexes['planets'] >) so the
+    supplement is found with a single lookup; a plain list is indexed on each call.
+
+    Parameters:
+        homeworld (str): planet url or name
+        planets (dict | list): optional supplemental planetary data (name-keyed index or list)
+        store (SwapiStore): optional local entity store used in place of a SWAPI search
+
+    Returns:
+        Planet: new < Planet > instance
+    """
+
+    planet_data = find_swapi_entity('planets', homeworld, store)
+    if planets:
+        if isinstance(planets, list):
+            planets = index_by_name(planets)
+        supplement = planets.get(normalize_name(homeworld))
+        if supplement:
+            planet_data.update(supplement)
+
+    return create_planet(planet_data)
+
+
+def create_person(data, planets=None, store=None, homeworlds=None):
     """Creates a < Person > instance from dictionary data, converting optional string values to the
-    appropriate type whenever possible. Calls < utl.get_swapi_resource() > to retrieve homeworld
-    data. Adds additional planet information to the homeworld data dictionary if an optional
-    < planets > dictionary is passed in as a second argument. Calls < create_planet() > to add
-    a < Planet > object to the person instance before returning the new instance to the caller.
+    appropriate type whenever possible. The person's homeworld is created with
+    < create_homeworld() > (passing along the optional < planets > supplemental data and local
+    < store >). To share homeworlds, pass the same < homeworlds > identity map (see
+    < IdentityMap >) to each call: the first resident of a planet creates it and every later
+    resident shares the same < Planet > instance, so each planet is fetched, converted and
+    serialized once. Supplemental data passed for later residents of a mapped planet is
+    ignored, so use one map per batch of consistent data.
 
     Type conversions:
         height -> height_m (str to float)
@@ -670,23 +1306,21 @@ def create_person(data, planets=None):
 
     Parameters:
         data (dict): source data
-        planets (list): optional supplemental planetary data
+        planets (dict | list): optional supplemental planetary data (name-keyed index or list)
+        store (SwapiStore): optional local entity store used in place of a SWAPI search
+        homeworlds (IdentityMap): optional homeworld identity map shared with other calls
 
     Returns:
         Person: new < Person > instance
     """
-    base_url = 'https://swapi.py4e.com/api/'
-    planet_params = {'search': data['homeworld'].lower()}
-    planet_data = utl.get_swapi_resource(base_url + '/planets', planet_params)['results'][0]
-    for dict in planets:
-        if dict['name'].lower() == data['homeworld'].lower():
-            planet_data.update(dict)
-    for a in data:
-        utl.convert_to_none(a)
+    homeworld_ref = data['homeworld']
+    if homeworlds is None:
+        homeworld = create_homeworld(homeworld_ref, planets, store)
+    else:
+        homeworld = homeworlds.get(homeworld_ref, create_homeworld, homeworld_ref, planets, store)
     new_instance = Person(data['url'], data['name'], data['birth_year'], data['force_sensitive'])
-    new_instance.height_m = utl.convert_to_float(data['height'])
-    new_instance.mass_kg = utl.convert_to_float(data['mass'])
-    new_instance.homeworld = create_planet(planet_data).jsonable()
+    convert_person_fields(data, new_instance) # see PERSON_FIELDS
+    new_instance.homeworld = homeworld # shared; serialized on demand (see Person._jsonable)
     return new_instance
 
 
@@ -711,54 +1345,7 @@ def create_planet(data):
         Planet: new < Planet > instance
     """
 
-    new_instance = Planet(data, data['name'])
-
-    new_instance.suns = utl.convert_to_none(data['suns'])
-    if new_instance.suns is not None:
-        new_instance.suns = utl.convert_to_int(data['suns'])
-
-    new_instance.moons = utl.convert_to_none(data['moons'])
-    if new_instance.moons is not None:
-        new_instance.moons = utl.convert_to_int(data['moons'])
-
-    new_instance.orbital_period_days = utl.convert_to_none(data['orbital_period'])
-    if new_instance.orbital_period_days is not None:
-        new_instance.orbital_period_days = utl.convert_to_float(data['orbital_period'])
-
-    new_instance.diameter_km = utl.convert_to_none(data['diameter'])
-    if new_instance.diameter_km is not None:
-        new_instance.diameter_km = utl.convert_to_int(data['diameter'])
-
-    new_instance.gravity_std = utl.convert_to_none(data['gravity'])
-    if new_instance.gravity_std is not None:
-        new_instance.gravity_std = utl.convert_gravity_value(data['gravity'])
-
-    new_instance.climate = utl.convert_to_none(data['climate'])
-    if new_instance.climate is not None:
-        new_instance.climate = utl.convert_to_list(data['climate'],', ')
-
-    new_instance.terrain = utl.convert_to_none(data['terrain'])
-    if new_instance.terrain is not None:
-        new_instance.terrain = utl.convert_to_list(data['terrain'],', ')
-
-    new_instance.population = utl.convert_to_none(data['population'])
-    if new_instance.population is not None:
-        new_instance.population = utl.convert_to_int(data['population'])
-
-    new_instance.region = utl.convert_to_none(data['region'])
-    if new_instance.region is not None:
-        new_instance.region = data['region']
-
-    new_instance.sector = utl.convert_to_none(data['sector'])
-    if new_instance.sector is not None:
-        new_instance.sector = data['sector']
-
-    new_instance.url = utl.convert_to_none(data['url'])
-    if new_instance.url is not None:
-        new_instance.url = data['url']
-
-
-    return new_instance
+    return convert_planet_fields(data) # new instance, no __init__() call; see PLANET_FIELDS
 
 
 def create_starship(data):
@@ -781,75 +1368,116 @@ def create_starship(data):
         starship: a new < Starship > instance
     """
 
-    for a in data:
-        utl.convert_to_none(a)
     new_instance = Starship(data['url'], data['name'], data['model'], data['starship_class'])
-    new_instance.manufacturer = data['manufacturer']
-    new_instance.length_m = utl.convert_to_float(data['length'])
-    new_instance.max_atmosphering_speed = utl.convert_to_int(data['max_atmosphering_speed'])
-    new_instance.hyperdrive_rating = utl.convert_to_float(data['hyperdrive_rating'])
+    return convert_starship_fields(data, new_instance) # see STARSHIP_FIELDS
 
-    new_instance.MGLT = utl.convert_to_none(data['MGLT'])
-    if new_instance.MGLT is not None:
-        new_instance.MGLT = utl.convert_to_int(data['MGLT'])
 
-    new_instance.armament = utl.convert_to_list(data['armament'],',')
-    new_instance.cargo_capacity_kg = utl.convert_to_int(data['cargo_capacity'])
-    new_instance.consumables = data['consumables']
+def find_swapi_entity(category, name, store=None):
+    """Returns a copy of the SWAPI entity in < category > identified by < name >. A url (e.g., a
+    person's "homeworld" url) is resolved directly; otherwise < name > is treated as a search
+    term. If a local < store > (see < SwapiStore >) is passed in it is consulted first via its
+    url and name indexes; SWAPI is only called when the store has no match. A copy is returned
+    so the caller can merge supplemental data without mutating shared (stored or batched)
+    results.
 
-    return new_instance
+    Parameters:
+        category (str): category name, e.g., "planets"
+        name (str): entity name, search term or url
+        store (SwapiStore): optional local entity store
+
+    Returns:
+        dict: copy of the entity dictionary
+    """
+
+    is_url = name.startswith('http')
+    if store is not None:
+        entity = store.get(name) if is_url else store.find(category, name)
+        if entity is not None:
+            return entity.copy()
+
+    if is_url:
+        return utl.get_swapi_resource(name).copy()
+    else:
+        params = {'search': name}
+        return utl.get_swapi_resource(utl.SWAPI_CATEGORY_URLS[category], params)['results'][0].copy()
+
+
+def get_episode_writers(episode):
+    """Returns the distinct writers credited on < episode >, in credited order. A writer
+    credited more than once is returned once; a missing (None) value yields no writers.
+
+    Parameters:
+        episode (dict): episode dictionary with converted "episode_writers"
+
+    Returns:
+        list: writer names
+    """
+
+    writers = episode['episode_writers']
+    if writers is None:
+        return []
+    if isinstance(writers, str):
+        return [writers]
+
+    return list(dict.fromkeys(writers))
 
 
 def get_least_viewed_episode(episodes):
     """Identifies and returns episode with the lowest recorded viewership. Ignores episodes with
-    no viewship value. Ignores ties. Delegates to the function < has_viewer_data > the task of
-    determing if the episode includes viewership "episode_us_viewers_mm" data.
+    no viewship value. If several episodes share the lowest viewership the first one is
+    returned. Delegates to the function < has_viewer_data > the task of determing if the
+    episode includes viewership "episode_us_viewers_mm" data.
 
     Parameters:
-        episodes (list): nested episode dictionaries
+        episodes (iterable): nested episode dictionaries
 
     Returns:
-        dict: episode with the lowest recorded viewership.
+        dict: episode with the lowest recorded viewership (None if no episode has viewer data).
     """
 
-    mini = []
-    i = 5.0
-    for episode in episodes:
-        if has_viewer_data(episode):
-            if episode['episode_us_viewers_mm'] < i:
-                mini.clear()
-                i = episode['episode_us_viewers_mm']
-                mini.append(episode)
-    return mini[0]
+    least_viewed = utl.top_k(episodes, 'episode_us_viewers_mm', 1, False, has_viewer_data)
+    return least_viewed[0] if least_viewed else None
+
 
 def get_most_viewed_episode(episodes):
     """Identifies and returns the episode with the highest recorded viewership. Ignores episodes
-    with no viewship value. Ignores ties. Delegates to the function < has_viewer_data > the task
-    of determing if the episode includes viewership "episode_us_viewers_mm" data.
+    with no viewship value. If several episodes share the highest viewership the first one is
+    returned. Delegates to the function < has_viewer_data > the task of determing if the
+    episode includes viewership "episode_us_viewers_mm" data.
 
     Parameters:
-        episodes (list): nested episode dictionaries
+        episodes (iterable): nested episode dictionaries
 
     Returns:
-        dict: episode with the highest recorded viewership.
+        dict: episode with the highest recorded viewership (None if no episode has viewer data).
     """
-    maxi = []
-    i = 0
-    for episode in episodes:
-        if has_viewer_data(episode):
-            if episode['episode_us_viewers_mm'] > i:
-                maxi.clear()
-                i = episode['episode_us_viewers_mm']
-                maxi.append(episode)
-    return maxi[0]
 
+    most_viewed = utl.top_k(episodes, 'episode_us_viewers_mm', 1, True, has_viewer_data)
+    return most_viewed[0] if most_viewed else None
 
 
+def get_viewership_extrema(episodes, k=1):
+    """Returns the < k > least viewed and the < k > most viewed episodes, found in a single pass
+    over < episodes > (a list or a stream). Episodes without viewership data are skipped (see
+    < has_viewer_data >); ties are resolved in favor of the episode listed first.
+
+    Parameters:
+        episodes (iterable): nested episode dictionaries
+        k (int): number of episodes to return per side
+
+    Returns:
+        tuple: (least viewed, most viewed) lists of episodes, each ordered best first
+    """
+
+    return utl.extrema(episodes, 'episode_us_viewers_mm', k, has_viewer_data)
+
 
 def group_episodes_by_writer(episodes):
     """Utilizes a dictionary to group individual episodes by a contributing writer. The writer's
     name comprises the key and the associated value comprises a list of one or more episode
-    dictionaries. Duplicate keys are NOT permitted.
+    dictionaries. Duplicate keys are NOT permitted. Writers appear in order of their first
+    episode. The grouping is produced from a < WriterIndex > built in a single pass; keep the
+    index itself to add or remove episodes later without regrouping.
 
     Format:
         {
@@ -864,22 +1492,9 @@ def group_episodes_by_writer(episodes):
     Returns:
         dict: a dictionary that groups episodes by a contributing writer
     """
-    writer_accum = []
-    new_dict = {}
-    for episode in episodes:
-        for key in episodes:
-                for name in episode['episode_writers']:
-                    if name in writer_accum:
-                        continue
-                    else:
-                        writer_accum.append(name)
-    for episode in episodes:
-        for writer in writer_accum:
-            if writer in episode['episode_writers']:
-                if writer not in new_dict.keys():
-                    new_dict[writer] = []
-                new_dict[writer].append(episode)
-    return(new_dict)
+
+    return WriterIndex(episodes).group()
+
 
 def has_viewer_data(episode):
     """Checks the truth value of an episode's "episode_us_viewers_mm" key-value pair. Returns
@@ -898,6 +1513,252 @@ def has_viewer_data(episode):
     else:
         return False
 
+def iter_entities(kind, records, workers=None, chunksize=ENTITY_CHUNK_SIZE, planets=None,
+                  store=None, homeworlds=None):
+    """Yields one entity instance per dictionary in < records > (a list or a stream), in input
+    order, equivalent to calling < create_droid >, < create_person >, < create_planet > or
+    < create_starship > on each record. The type conversions run in a pool of < workers >
+    processes (see < concurrent.futures.ProcessPoolExecutor >): records are grouped in chunks
+    of < chunksize >, and for each record only a compact tuple of the source values named by
+    the kind's schema (e.g., < PLANET_FIELDS >) is sent to a worker, which returns a tuple of
+    converted values. Instances are assembled in this process without running __init__ or
+    < CachedEntity.__setattr__ >: each slot is filled once with object.__setattr__ from the
+    constructor arguments, the converted values and None for the rest. Homeworlds are resolved
+    once per batch through an identity map (see < create_person >): < homeworlds > if passed
+    in, otherwise a new < IdentityMap > used by this call only. At most
+    < ENTITY_PREFETCH > chunks per worker are in flight, so memory use is bounded however many
+    records are streamed. With < workers > set to 0 or 1 the records are converted in-process.
+
+    Parameters:
+        kind (str): entity kind, a key of < ENTITY_KINDS > ('droids', 'people', 'planets',
+                    'starships')
+        records (iterable): source dictionaries
+        workers (int): number of worker processes (None uses every core)
+        chunksize (int): number of records converted per task
+        planets (dict | list): optional supplemental planetary data ('people' only)
+        store (SwapiStore): optional local entity store ('people' only)
+        homeworlds (IdentityMap): optional identity map shared across batches ('people' only)
+
+    Returns:
+        generator: new < Droid >, < Person >, < Planet > or < Starship > instances
+    """
+
+    if homeworlds is None:
+        homeworlds = IdentityMap() # shared within this batch only
+    entity_class, constructor_keys, fields = ENTITY_KINDS[kind]
+    get_constructor_args = itemgetter(*constructor_keys)
+    sources = [field.source for field in fields]
+    get_row = itemgetter(*sources) if len(sources) > 1 else lambda record: (record[sources[0]],)
+    targets = tuple(field.target for field in fields)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    # Every slot is assigned exactly once per instance, in this order (a planet's url is
+    # assigned twice: the converted value wins, as with create_planet()).
+    if len(constructor_keys) == 1:
+        get_constructor_args = lambda record, get=get_constructor_args: (get(record),)
+    defaults = [
+        name for name in entity_class.__slots__ if name not in constructor_keys + targets
+    ]
+    names = constructor_keys + tuple(defaults) + targets + ('_json',)
+    blanks = (None,) * len(defaults)
+    new, set_slot = entity_class.__new__, object.__setattr__
+
+    def assemble(chunk, converted):
+        for record, values in zip(chunk, converted):
+            instance = new(entity_class)
+            for name, value in zip(names, get_constructor_args(record) + blanks + values + (None,)):
+                set_slot(instance, name, value)
+            if kind == 'people':
+                ref = record['homeworld']
+                instance.homeworld = homeworlds.get(ref, create_homeworld, ref, planets, store)
+            yield instance
+
+    chunks = utl.iter_batches(records, chunksize)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from assemble(chunk, _convert_entity_rows(kind, list(map(get_row, chunk))))
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque() # (chunk, future) pairs in input order
+        for chunk in chunks:
+            rows = list(map(get_row, chunk)) # compact tuples; the dictionaries stay here
+            pending.append((chunk, executor.submit(_convert_entity_rows, kind, rows)))
+            if len(pending) >= workers * ENTITY_PREFETCH:
+                chunk, future = pending.popleft()
+                yield from assemble(chunk, future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from assemble(chunk, future.result())
+
+
+def iter_entity_json(entity, indent=2, ensure_ascii=False, level=0):
+    """Yields the JSON encoding of < entity > (e.g., a < Starship >) as a series of text chunks.
+    The text is byte-for-byte identical to < sw_utils.write_json > of < entity.jsonable() >,
+    but the entity graph is walked rather than converted: a starship's < Crew > and
+    < Passengers > are visited in turn and each member (< Person > with its homeworld
+    < Planet >, or < Droid >) is turned into a temporary dictionary (see < _get_entity_data >)
+    that is discarded once written. Runs of up to < ENTITY_JSON_RUN_SIZE > plain attributes or
+    members are encoded with one < sw_json.dumps > call and spliced into the output. Nothing is
+    cached, so memory is bounded by one run however many crew members and passengers a
+    starship carries. Pass the chunks to a file's < writelines() > or to
+    < sw_utils.JsonArrayWriter.write_encoded > (see < write_fleet_json >).
+
+    Parameters:
+        entity (obj): < Starship >, < Crew >, < Passengers >, < Person >, < Droid > or < Planet >
+                      instance, or a JSON-serializable attribute value
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        level (int): nesting level of < entity > within the enclosing document
+
+    Returns:
+        generator: JSON text chunks
+    """
+
+    nesting = '\n' + ' ' * (indent * level) if indent is not None else None
+    if indent is None:
+        run_start, run_end = 1, -1 # "{" ... "}"
+    else:
+        run_start, run_end = 2 + indent, -2 # "{\n" plus the first indent ... "\n}"
+
+    def encode(data, splice=False):
+        # Encodes < data > at < level >; < splice > strips the brackets of a run of items.
+        encoded = sw_json.dumps(data, ensure_ascii, indent)
+        if splice:
+            encoded = encoded[run_start:run_end]
+        return encoded.replace('\n', nesting) if level and nesting else encoded
+
+    is_object = isinstance(entity, (Crew, Starship))
+    if isinstance(entity, Crew):
+        items = list(entity.__dict__.items()) # role -> member
+    elif isinstance(entity, Passengers):
+        items = list(entity.__dict__.values())
+    elif isinstance(entity, Starship):
+        items = [(name, getattr(entity, name)) for name in entity.__slots__]
+    else:
+        yield encode(_get_entity_data(entity) if isinstance(entity, CachedEntity) else entity)
+        return
+
+    brackets = '{}' if is_object else '[]'
+    if not items:
+        yield brackets
+        return
+
+    if indent is None:
+        opening, separator, closing = brackets[0], ', ', brackets[1]
+    else:
+        padding = '\n' + ' ' * (indent * (level + 1))
+        opening, separator, closing = brackets[0] + padding, ',' + padding, nesting + brackets[1]
+
+    yield opening
+    run = []
+    written = False # True once an item has been written; later items are preceded by separators
+    for item in items:
+        value = item[1] if is_object else item
+        nested = isinstance(value, (Crew, Passengers)) # walked rather than encoded in a run
+        if not nested:
+            if isinstance(value, CachedEntity):
+                value = _get_entity_data(value) # temporary; dropped with the run
+                item = (item[0], value) if is_object else value
+            elif hasattr(value, 'jsonable'): # member outside this module's entity classes
+                value = value.jsonable()
+                item = (item[0], value) if is_object else value
+            run.append(item)
+
+        if run and (nested or len(run) == ENTITY_JSON_RUN_SIZE):
+            if written:
+                yield separator
+            yield encode(dict(run) if is_object else run, True)
+            run = []
+            written = True
+
+        if nested:
+            if written:
+                yield separator
+            yield f"{sw_json.dumps(item[0], ensure_ascii, indent)}: "
+            yield from iter_entity_json(value, indent, ensure_ascii, level + 1)
+            written = True
+
+    if run:
+        if written:
+            yield separator
+        yield encode(dict(run) if is_object else run, True)
+    yield closing
+
+
+def write_fleet_json(filepath, starships, encoding='utf-8', ensure_ascii=False, indent=2):
+    """Writes < starships > (a list, a stream or, e.g., < FleetManifest.ships.values() >) to
+    < filepath > as a JSON array. Each starship is streamed with < iter_entity_json > through a
+    < sw_utils.JsonArrayWriter >, so neither the list nor any starship's nested dictionaries
+    are held in memory. The file content is identical to < sw_utils.write_json > of the list
+    of < jsonable() > representations.
+
+    Parameters:
+        filepath (str): the path to the file
+        starships (iterable): < Starship > instances
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+
+    Returns:
+        int: number of starships written
+    """
+
+    with utl.JsonArrayWriter(filepath, encoding, ensure_ascii, indent) as writer:
+        for starship in starships:
+            writer.write_encoded(iter_entity_json(starship, indent, ensure_ascii))
+
+    return writer.count
+
+
+def _convert_entity_rows(kind, rows):
+    """Worker task for < iter_entities >: converts each row tuple of source values (ordered as
+    the kind's fields) and returns a list of tuples of converted values. The row converter is
+    compiled from the kind's schema on first use in each process (see < compile_converter >)."""
+
+    fields = ENTITY_KINDS[kind][2]
+    convert = _ROW_CONVERTERS.get(kind)
+    if convert is None:
+        # Sources and targets become positions so rows and results can be plain tuples.
+        row_fields = [field._replace(source=i, target=i) for i, field in enumerate(fields)]
+        convert = compile_converter(row_fields, f'convert_{kind}_row', 'item')
+        _ROW_CONVERTERS[kind] = convert
+
+    size = len(fields)
+    return [tuple(convert(row, [None] * size)) for row in rows]
+
+
+def _get_entity_data(entity):
+    """Returns a temporary, uncached dictionary equal to < entity.jsonable() > for a < Person >,
+    < Droid > or < Planet > (and the homeworld it references). Keys follow each class's
+    __slots__, which lists the attributes in < jsonable() > key order."""
+
+    data = {}
+    for name in entity.__slots__:
+        value = getattr(entity, name)
+        data[name] = _get_entity_data(value) if isinstance(value, CachedEntity) else value
+
+    return data
+
+
+def _get_jsonable(value):
+    """Returns the JSON-friendly representation of a nested member < value > (crew member,
+    passenger or homeworld): the cached < _jsonable() > representation of a < CachedEntity >,
+    else the result of its < jsonable() > method (a new object on every call, so the enclosing
+    cache is rebuilt each time), else < value > itself (e.g., None or a plain dictionary)."""
+
+    get_json = getattr(value, '_jsonable', None)
+    if get_json is None:
+        get_json = getattr(value, 'jsonable', None)
+        if get_json is None:
+            return value
+
+    return get_json()
+
+
 def main():
     """Entry point for program.
 
@@ -916,17 +1777,30 @@ def main():
     clone_wars_even_num_seasons = clone_wars[2::2]
 
     # 8.2 CHALLENGE 02
-    clone_wars_episodes = read_csv_to_dicts('clone_wars_episodes.csv')
+    # Rows are streamed in batches, converted (8.4) and written as they are read; raw string
+    # rows for the whole file are never held at once. Viewership statistics persist between
+    # runs in clone_wars_viewership_stats.json next to sw_stats.py (see sw_stats.STATS_FILEPATH);
+    # only episodes that are new or whose values changed update them, and the cumulative summary
+    # is written out below.
+    clone_wars_episodes = []
+    viewership_stats = load_viewership_stats()
+    with utl.JsonArrayWriter('stu-clone_wars-episodes_converted.json') as writer:
+        for batch in utl.iter_csv_dicts('clone_wars_episodes.csv', batch_size=EPISODE_BATCH_SIZE):
+            for episode in convert_episode_values(batch):
+                writer.write(episode)
+                viewership_stats.add_episode(episode)
+                clone_wars_episodes.append(episode)
+    viewership_stats.save()
+    utl.write_json('stu-clone_wars-viewership_stats.json', viewership_stats.summary())
     #a = has_viewer_data(clone_wars_episodes[3])
 
     # 8.3 Challenge 03
 
-    # 8.4 Challenge 04
-    clone_wars_episodes = convert_episode_values(clone_wars_episodes)
-    utl.write_json('stu-clone_wars-episodes_converted.json',clone_wars_episodes)
+    # 8.4 Challenge 04 (see 8.2)
     # 8.5 Challenge 05
-    most_viewed_episode = get_most_viewed_episode(clone_wars_episodes)
-    least_viewed_episode = get_least_viewed_episode(clone_wars_episodes)
+    least_viewed_episodes, most_viewed_episodes = get_viewership_extrema(clone_wars_episodes)
+    most_viewed_episode = most_viewed_episodes[0]
+    least_viewed_episode = least_viewed_episodes[0]
 
     # 8.6 Challenge 06
     director_episode_counts = count_episodes_by_director(clone_wars_episodes)
@@ -936,70 +1810,59 @@ def main():
     utl.write_json('stu-clone_wars-writer_episodes.json',writer_episodes)
     # 8.8 CHALLENGE 08
     # 8.9 CHALLENGE 09
-    base_url = 'https://swapi.py4e.com/api/'
-    tatooine_params = {'search': 'tatooine'}
-    wookiee_planets = utl.read_csv_to_dicts('wookieepedia_planets.csv')
-    tatooine_data = utl.get_swapi_resource(base_url + '/planets', tatooine_params)['results'][0]
-    for dict in wookiee_planets:
-        if dict['name'].lower() == 'tatooine':
-            tatooine_data.update(dict)
-    tatooine = create_planet(tatooine_data)
-    utl.write_json('stu-tatooine.json', tatooine.jsonable())
-
-    # 8.10 CHALLENGE 10
-    R2D2_params = {'search': 'R2-D2'}
-    wookie_droids = utl.read_json('wookieepedia_droids.json')
-    r2_d2_data = utl.get_swapi_resource(base_url + '/people', R2D2_params)['results'][0]
-    for dict in wookie_droids:
-        if dict['name'] == 'R2-D2':
-            r2_d2_data.update(dict)
-    r2_d2 = create_droid(r2_d2_data)
-    utl.write_json('stu-r2_d2.json', r2_d2.jsonable())
-    # 8.11 Challenge 11
-    anakin_params = {'search': 'Anakin'}
-    wookiee_people = utl.read_json('wookieepedia_people.json')
-    anakin_data = utl.get_swapi_resource(base_url + '/people', anakin_params)['results'][0]
-    for dict in wookiee_people:
-        if dict['name'] == 'Anakin Skywalker':
-            anakin_data.update(dict)
-    anakin = create_person(anakin_data, wookiee_planets)
-    utl.write_json('stu-anakin_skywalker.json', anakin.jsonable())
-
-    # 8.12 CHALLENGE 12
-    wookiee_starships = utl.read_csv_to_dicts('wookieepedia_starships.csv')
-    twilight_data = wookiee_starships
-    for dict in wookiee_starships:
-        if dict['name'] == 'Twilight':
-            twilight_data = dict
-    twilight = create_starship(twilight_data)
-    utl.write_json('stu-twilight.json',twilight.jsonable())
-
-    # 8.13 CHALLENGE 13
-    obi_wan_params = {'search': 'Obi-Wan Kenobi'}
-    obi_wan_data = utl.get_swapi_resource(base_url + '/people', obi_wan_params)['results'][0]
-    for dict in wookiee_people:
-        if dict['name'] == 'Obi-Wan Kenobi':
-            obi_wan_data.update(dict)
-    obi_wan = create_person(obi_wan_data, wookiee_planets)
-    crew_dict = {'pilot': anakin, 'copilot': obi_wan}
-    crew = Crew(crew_dict)
-    twilight.assign_crew_members(crew)
-    utl.write_json('stu-twilight.json',twilight.jsonable())
-    # 8.14 CHALLENGE 14
-    padme_params = {'search': 'Padmé Amidala'}
-    padme_data = utl.get_swapi_resource(base_url + '/people', padme_params)['results'][0]
-    for dict in wookiee_people:
-        if dict['name'] == 'Padme Amidala':
-            padme_data.update(dict)
-    padme = create_person(padme_data, wookiee_planets)
-
-    c_3po_params = {'search': 'C-3PO'}
-    c_3po_data = utl.get_swapi_resource(base_url + '/people', c_3po_params)['results'][0]
-    for dict in wookie_droids:
-        if dict['name'] == 'C-3PO':
-            c_3po_data.update(dict)
-    print(c_3po_data)
-    c_3po = create_droid(c_3po_data)
-    passengers = Passengers([padme, c_3po, r2_d2])
+    store = SwapiStore() if os.path.isdir(utl.SWAPI_MIRROR_DIR) else None # see sw_mirror.py
+    # Warm runs are served from .swapi_cache.sqlite; connections are pooled and repeat lookups
+    # coalesced. The cache and the session are closed on exit, even if a step below raises.
+    with utl.swapi_cache(), utl.swapi_session(), utl.swapi_batch():
+        enricher = Enricher() # Wookieepedia supplements indexed once by name
+        homeworlds = IdentityMap() # residents of a planet share one Planet instance
+        wookiee_planets = enricher.indexes['planets']
+        tatooine_data = enricher.merge('planets', find_swapi_entity('planets', 'tatooine', store))
+        tatooine = create_planet(tatooine_data)
+        utl.write_json('stu-tatooine.json', tatooine.jsonable())
+
+        # 8.10 CHALLENGE 10
+        r2_d2_data = enricher.merge('droids', find_swapi_entity('people', 'R2-D2', store))
+        r2_d2 = create_droid(r2_d2_data)
+        utl.write_json('stu-r2_d2.json', r2_d2.jsonable())
+        # 8.11 Challenge 11
+        anakin_data = find_swapi_entity('people', 'Anakin Skywalker', store)
+        anakin_data = enricher.merge('people', anakin_data)
+        anakin = create_person(anakin_data, wookiee_planets, store, homeworlds)
+        utl.write_json('stu-anakin_skywalker.json', anakin.jsonable())
+
+        # 8.12 CHALLENGE 12
+        twilight_data = enricher.lookup('starships', 'Twilight')
+        twilight = create_starship(twilight_data)
+        utl.write_json('stu-twilight.json',twilight.jsonable())
+
+        # 8.13 CHALLENGE 13
+        obi_wan_data = find_swapi_entity('people', 'Obi-Wan Kenobi', store)
+        obi_wan_data = enricher.merge('people', obi_wan_data)
+        obi_wan = create_person(obi_wan_data, wookiee_planets, store, homeworlds)
+        crew_dict = {'pilot': anakin, 'copilot': obi_wan}
+        crew = Crew(crew_dict)
+        twilight.assign_crew_members(crew)
+        utl.write_json('stu-twilight.json',twilight.jsonable())
+        # 8.14 CHALLENGE 14
+        padme_data = enricher.merge('people', find_swapi_entity('people', 'Padmé Amidala', store))
+        padme = create_person(padme_data, wookiee_planets, store, homeworlds)
+
+        c_3po_data = enricher.merge('droids', find_swapi_entity('people', 'C-3PO', store))
+        print(c_3po_data)
+        c_3po = create_droid(c_3po_data)
+        manifest = FleetManifest([twilight]) # members stored by reference, indexed by url
+        manifest.assign([
+            (twilight.url, anakin, 'pilot'),
+            (twilight.url, obi_wan, 'copilot'),
+            (twilight.url, padme, None),
+            (twilight.url, c_3po, None),
+            (twilight.url, r2_d2, None)
+        ])
+        manifest.sync()
+        with open('stu-twilight_departs.json', 'w', encoding='utf-8') as file_obj:
+            file_obj.writelines(iter_entity_json(twilight)) # streamed; see write_fleet_json()
+
+
 if __name__ == '__main__':
     main()
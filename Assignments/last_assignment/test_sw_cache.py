@@ -0,0 +1,125 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import sw_utils as utl
+from sw_cache import SwapiCache, make_request_key
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """Serves SWAPI-shaped JSON: "/api/planets/< id >/" returns a planet, any other path a 404
+    "Not found" body. Every request path is recorded in the server's < requests > list."""
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path.startswith('/api/planets/'):
+            status, data = 200, {'name': f"Planet {self.path.strip('/').split('/')[-1]}"}
+        else:
+            status, data = 404, {'detail': 'Not found'}
+
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SwapiCacheTest(unittest.TestCase):
+    """Exercises < SwapiCache > behind < sw_utils.get_swapi_resource > against a local
+    http.server fixture."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/api"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        utl.close_swapi_session()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.tmp_dir.name, 'cache.sqlite')
+
+    def tearDown(self):
+        utl.disable_swapi_cache()
+        self.tmp_dir.cleanup()
+
+    def test_hits_and_misses(self):
+        cache = utl.enable_swapi_cache(self.filepath)
+        url = f"{self.base_url}/planets/1/"
+        first = utl.get_swapi_resource(url)
+        second = utl.get_swapi_resource(url)
+
+        self.assertEqual(first, {'name': 'Planet 1'})
+        self.assertEqual(second, first)
+        self.assertEqual(self.server.requests, ['/api/planets/1/'])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_trailing_slash_shares_key(self):
+        utl.enable_swapi_cache(self.filepath)
+        utl.get_swapi_resource(f"{self.base_url}/planets/2/")
+        utl.get_swapi_resource(f"{self.base_url}/planets/2")
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(
+            make_request_key(f"{self.base_url}/planets/2"),
+            make_request_key(f"{self.base_url}//planets/2/")
+        )
+
+    def test_ttl_expiry(self):
+        cache = utl.enable_swapi_cache(self.filepath, ttls={'planets': 0.2})
+        url = f"{self.base_url}/planets/3/"
+        utl.get_swapi_resource(url)
+        utl.get_swapi_resource(url)
+        time.sleep(0.3)
+        utl.get_swapi_resource(url)
+
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_error_responses_not_stored(self):
+        cache = utl.enable_swapi_cache(self.filepath)
+        url = f"{self.base_url}/starships/999/"
+        first = utl.get_swapi_resource(url)
+        second = utl.get_swapi_resource(url)
+
+        self.assertEqual(first, {'detail': 'Not found'})
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    def test_size_counts_bytes(self):
+        with SwapiCache(':memory:') as cache:
+            cache.set(f"{self.base_url}/planets/4/", None, {'name': 'Dagobah é'})
+            body = json.dumps({'name': 'Dagobah é'}, ensure_ascii=False)
+
+            self.assertEqual(cache.stats()['bytes'], len(body.encode('utf-8')))
+
+    def test_hits_update_lru_order(self):
+        body_size = len(json.dumps({'name': 'Planet 5'}))
+        with SwapiCache(':memory:', max_bytes=2 * body_size) as cache:
+            cache.set(f"{self.base_url}/planets/5/", None, {'name': 'Planet 5'})
+            cache.set(f"{self.base_url}/planets/6/", None, {'name': 'Planet 6'})
+            cache.get(f"{self.base_url}/planets/5/") # 6 is now least recently used
+            cache.set(f"{self.base_url}/planets/7/", None, {'name': 'Planet 7'})
+
+            self.assertIsNotNone(cache.get(f"{self.base_url}/planets/5/"))
+            self.assertIsNone(cache.get(f"{self.base_url}/planets/6/"))
+            self.assertEqual(cache.evictions, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
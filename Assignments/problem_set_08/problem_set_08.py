@@ -1,4 +1,5 @@
-import json, requests, copy
+import asyncio, json, requests, copy
+from concurrent.futures import ThreadPoolExecutor
 
 
 # Problem 01
@@ -41,6 +42,34 @@ def get_swapi_resource(url, params=None, timeout=10):
     return response.json()
 
 
+async def get_swapi_resources_async(urls, params=None, concurrency=8, timeout=10):
+    """Fetches many SWAPI resources concurrently and returns the decoded responses in the same
+    order as < urls >. Each request is delegated to < get_swapi_resource > on a thread of a
+    pool of < concurrency > threads created for this call, which caps the number of requests
+    in flight (the loop's default executor would cap it at min(32, cpu_count + 4)).
+
+    Parameters:
+        urls (list): urls that specify the resources.
+        params (list): optional querystring dictionaries, one per url (None entries allowed).
+        concurrency (int): maximum number of requests in flight at any one time.
+        timeout (int): timeout value in seconds applied to each request.
+
+    Returns:
+        list: dictionary representations of the decoded JSON, one per url.
+    """
+    if params is None:
+        params = [None] * len(urls)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        return await asyncio.gather(*[
+            loop.run_in_executor(executor, get_swapi_resource, url, url_params, timeout)
+            for url, url_params in zip(urls, params)
+        ])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 
 # Problem 03
 def delete_items(dictionary, key_list):
@@ -91,6 +120,32 @@ def clean_person_dictionary(person, delete_list, home_list = None, species_list
     return(a)
 
 
+async def clean_person_dictionaries_async(people, delete_list, home_list=None, species_list=None, concurrency=8):
+    """Runs < clean_person_dictionary > for each person concurrently (the homeworld and species
+    lookups are blocking requests) on a pool of < concurrency > threads, so at most
+    < concurrency > people are in flight. Results are returned in the same order as < people >.
+
+    Parameters:
+        people (list): person dictionaries
+        delete_list (list): keys to remove from each person
+        home_list (list): optional homeworld keys to keep
+        species_list (list): optional species keys to keep
+        concurrency (int): maximum number of people cleaned at any one time
+
+    Returns:
+        list: cleaned person dictionaries
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        return await asyncio.gather(*[
+            loop.run_in_executor(executor, clean_person_dictionary, person, delete_list, home_list, species_list)
+            for person in people
+        ])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 
 
 # Problem 06
@@ -148,12 +203,17 @@ def main():
     species_keys_keep = ['name']
     new_passengers = []
     for i in passengers.values():
-        for a in i:
-            passengers_params = {'search': a['name']}
-            b = get_swapi_resource(base_url + '/people', passengers_params)['results'][0]
-            c = clean_person_dictionary(b, ['films', 'vehicles', 'starships', 'created', 'edited', 'url'], home_keys_keep, species_keys_keep)
-            a.update(c)
-            new_passengers.append(a)
+        new_passengers.extend(i)
+    search_params = [{'search': a['name']} for a in new_passengers]
+    found = asyncio.run(get_swapi_resources_async([base_url + '/people'] * len(search_params), search_params))
+    cleaned = asyncio.run(clean_person_dictionaries_async(
+        [b['results'][0] for b in found],
+        ['films', 'vehicles', 'starships', 'created', 'edited', 'url'],
+        home_keys_keep,
+        species_keys_keep
+    ))
+    for a, c in zip(new_passengers, cleaned):
+        a.update(c)
     #print(new_passengers)
 
 
@@ -1,8 +1,15 @@
 """ start setup """
 
+import asyncio
 import json
+import os
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 PEOPLE_URL = 'http://swapi.py4e.com/api/people/'
+SWAPI_CACHE_FILEPATH = '.swapi_cache.json' # responses saved between runs (see main)
+SWAPI_CACHE_TTL = 7 * 24 * 60 * 60 # seconds a saved response is reused
 
 """ end setup """
 
@@ -198,47 +205,115 @@ def read_json(filepath, encoding = 'utf-8'):
         return json.load(file_obj)
 
 # Problem 4.0
-def get_swapi_resource(resource, params = None, timeout = 10):
+def get_swapi_resource(resource, params = None, timeout = 10, cache = None):
     """
     This function initiates an HTTP GET request to the SWAPI service in order to return a
     representation of a resource. `params` is not included in the request if no params is passed to this
     function during the function call. Once a response is received, it is converted to a python dict.
+    If a `cache` dictionary is passed (see `read_swapi_cache`), an unexpired entry for the url and params
+    is returned without a request, and successful (2xx) responses are stored in it. Error responses
+    (e.g., 404) are returned but never cached.
     Parameters:
         resource (string): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments. The default value is None.
         timeout (int): timeout value in seconds. The default value is 20.
+        cache (dict): optional response cache. The default value is None.
     Returns:
         dict: dictionary representation of the decoded JSON.
     """
 
+    key = f"{resource}?{urlencode(sorted(params.items()))}" if params else resource
+    if cache is not None:
+        entry = cache.get(key)
+        if entry and time.time() - entry['stored_at'] <= SWAPI_CACHE_TTL:
+            return entry['data']
+
     if params:
-        return requests.get(resource, params, timeout = timeout).json()
+        response = requests.get(resource, params, timeout = timeout)
     else:
-        return requests.get(resource, timeout = timeout).json()
+        response = requests.get(resource, timeout = timeout)
+    data = response.json()
+
+    if cache is not None and 200 <= response.status_code < 300:
+        cache[key] = {'stored_at': time.time(), 'data': data}
+    return data
+
+
+async def get_swapi_resources_async(resources, concurrency = 8, timeout = 10, cache = None):
+    """
+    This function fetches many SWAPI resources concurrently. Each request is delegated to
+    `get_swapi_resource` on a pool of `concurrency` threads created for this call, which limits the
+    number of requests in flight (the loop's default executor would cap it at min(32, cpu_count + 4)).
+    Repeated urls (e.g., species that share a homeworld)
+    are fetched once and share one decoded result. Results are returned in the same order as
+    `resources`.
+    Parameters:
+        resources (list): urls that specify the resources.
+        concurrency (int): maximum number of requests in flight at any one time. The default is 8.
+        timeout (int): timeout value in seconds applied to each request. The default value is 10.
+        cache (dict): optional response cache passed to `get_swapi_resource`. The default value is None.
+    Returns:
+        list: dictionary representations of the decoded JSON, one per url
+    """
+    unique = list(dict.fromkeys(resources))
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers = concurrency)
+    try:
+        results = await asyncio.gather(*[
+            loop.run_in_executor(executor, get_swapi_resource, resource, None, timeout, cache)
+            for resource in unique
+        ])
+    finally:
+        executor.shutdown(wait = False, cancel_futures = True)
+
+    decoded = dict(zip(unique, results))
+    return [decoded[resource] for resource in resources]
 
 
 # Problem 5.1
-def fill_language_database(species_data, language_database):
+def fill_language_database(species_data, language_database, concurrency = 8, cache = None):
     """
     This function takes a list of dictionaries representing species and uses the information therin to fill
     a language database. This function should skip the 'Droid' species. For all other species, it should
     replace the url string at the 'homeworld' key with the name of the homeworld planet. It should then pass
     the updated dictionary to the `language_database`'s `add_language` method.
+    The homeworld urls are resolved concurrently (see `get_swapi_resources_async`) rather than
+    one blocking request per species.
     Parameters:
         species_data (list): a list of dicts, with each dict representing a single species
         language_database (Languages object): an instance of the Languages class
+        concurrency (int): maximum number of homeworld requests in flight at any one time
+        cache (dict): optional response cache (see `get_swapi_resource`)
     Returns:
         language_database (Languages object): an instance of the Languages class loaded with language data
     """
-    for species in species_data:
-        if species['name'] == 'Droid':
-            continue
-        species['homeworld'] = get_swapi_resource(species['homeworld'])['name']
+    species_data = [species for species in species_data if species['name'] != 'Droid']
+    homeworlds = asyncio.run(
+        get_swapi_resources_async(
+            [species['homeworld'] for species in species_data], concurrency, cache = cache
+        )
+    )
+    for species, homeworld in zip(species_data, homeworlds):
+        species['homeworld'] = homeworld['name']
         language_database.add_language(species)
     return(language_database)
 
 
 
+def read_swapi_cache(filepath = SWAPI_CACHE_FILEPATH):
+    """
+    This function returns the response cache saved by a previous run (see `get_swapi_resource`), or an
+    empty dictionary if there is none.
+    Parameters:
+        filepath (string): path to the cache file. The default value is SWAPI_CACHE_FILEPATH.
+    Returns:
+        dict: url (plus querystring) -> {'stored_at': timestamp, 'data': decoded JSON}
+    """
+    if not os.path.exists(filepath):
+        return {}
+    return read_json(filepath)
+
+
 # Problem 6.2
 def create_droid(data):
     """
@@ -271,13 +346,16 @@ def write_json(filepath, data):
         json.dump(data, file_obj)
 
 def main():
+    # SWAPI responses are cached between runs, so warm runs make no requests
+    swapi_cache = read_swapi_cache()
+
     # Problem 3.2
     species_data = read_json('swapi_species.json')
 
 
     # Problem 5.2
 
-    language_database = fill_language_database(species_data, Languages())
+    language_database = fill_language_database(species_data, Languages(), cache = swapi_cache)
     language_database.update_language_count()
     galactic_basic_speakers = language_database.get_speakers('Galactic Basic')
 
@@ -285,7 +363,8 @@ def main():
 
     # Problem 6.1
 
-    c3po_data = get_swapi_resource(PEOPLE_URL, {'search': 'C-3PO'})['results'][0]
+    c3po_data = get_swapi_resource(PEOPLE_URL, {'search': 'C-3PO'}, cache = swapi_cache)['results'][0]
+    write_json(SWAPI_CACHE_FILEPATH, swapi_cache)
 
     # Problem 6.3
     c3po = create_droid(c3po_data)
@@ -0,0 +1,116 @@
+import json
+
+
+# Named predicates evaluated by classify_planets(). Each accepts a Planet and returns a bool.
+PLANET_PREDICATES = {
+    'surface_water': lambda planet: planet.has_surface_water(),
+    'inhabited': lambda planet: planet.population is not None and planet.is_populated(),
+    'uninhabited': lambda planet: planet.population is not None and not planet.is_populated(),
+    'desert_only': lambda planet: planet.terrain == ['desert']
+}
+
+# Named extremes tracked by classify_planets(): name -> (attribute, largest). The problem set's
+# "smallest" planets are those with a diameter of zero, not the minimum; see PlanetTable.smallest.
+PLANET_EXTREMES = {
+    'biggest': ('diameter', True)
+}
+
+
+class JsonArraySink:
+    """Writes a JSON array to a file one element at a time.
+
+    The output is identical to json.dump() of the equivalent list (default separators, no
+    indentation), but elements are encoded and written as they arrive so the list never has to
+    be accumulated in memory.
+
+    Attributes:
+        filepath (str): the path to the file
+        count (int): number of elements written
+
+    Methods:
+        close: terminate the array and close the file
+        write: encode and write one element
+    """
+
+    def __init__(self, filepath, encoding='utf-8'):
+        """Initialize a JsonArraySink instance, opening < filepath > and writing "["."""
+
+        self.filepath = filepath
+        self.count = 0
+        self._file_obj = open(filepath, 'w', encoding=encoding)
+        self._file_obj.write('[')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Writes the closing "]" and closes the file."""
+
+        if not self._file_obj.closed:
+            self._file_obj.write(']')
+            self._file_obj.close()
+
+    def write(self, data):
+        """Encodes < data > as JSON and writes it as the next array element."""
+
+        if self.count:
+            self._file_obj.write(', ')
+        json.dump(data, self._file_obj)
+        self.count += 1
+
+
+def classify_planets(planets, predicates=PLANET_PREDICATES, extremes=PLANET_EXTREMES, sinks=None):
+    """Routes planets into named buckets in a single traversal. Every predicate in
+    < predicates > is evaluated once per planet and the planet is added to each bucket whose
+    predicate it satisfies. Each extreme in < extremes > keeps the planets holding the largest
+    (or smallest) non-null value of its attribute seen so far, ties included. A planet's
+    < jsonable() > representation is computed at most once, and only if it is routed somewhere.
+
+    Buckets named in < sinks > are streamed: each matching planet is written to the sink (any
+    object with a < write(data) > method, e.g., < JsonArraySink >) as soon as it is classified.
+    All other buckets are accumulated in lists and returned.
+
+    Parameters:
+        planets (iterable): < Planet > instances
+        predicates (dict): bucket name -> callable(planet) returning bool
+        extremes (dict): bucket name -> (attribute name, largest)
+        sinks (dict): optional bucket name -> sink for streamed buckets
+
+    Returns:
+        dict: bucket name -> list of planet dictionaries for the buckets not streamed to a sink
+    """
+
+    if sinks is None:
+        sinks = {}
+
+    buckets = {name: [] for name in predicates if name not in sinks}
+    leaders = {name: (None, []) for name in extremes}
+
+    for planet in planets:
+        data = None
+        for name, predicate in predicates.items():
+            if predicate(planet):
+                if data is None:
+                    data = planet.jsonable()
+                if name in sinks:
+                    sinks[name].write(data)
+                else:
+                    buckets[name].append(data)
+
+        for name, (attribute, largest) in extremes.items():
+            value = getattr(planet, attribute)
+            if value is None:
+                continue
+            best, members = leaders[name]
+            if best is None or (value > best if largest else value < best):
+                leaders[name] = (value, [planet])
+            elif value == best:
+                members.append(planet)
+
+    for name, (best, members) in leaders.items():
+        buckets[name] = [planet.jsonable() for planet in members]
+
+    return buckets
@@ -0,0 +1,231 @@
+from array import array
+from itertools import compress
+import swapi_entities as ent
+
+
+class PlanetTable:
+    """Column-oriented (struct-of-arrays) table of planets.
+
+    Numeric attributes are stored in typed < array > columns with a companion null mask
+    (bytearray, 1 = value is None); list/dict attributes and strings are stored in plain lists.
+    Queries are expressed as one mask computation over the relevant columns, and < Planet >
+    objects or JSON-friendly dictionaries are only materialized for the rows a query selects.
+
+    Attributes:
+        url (list): planet urls
+        name (list): planet names
+        rotation_period (array): int64 column
+        orbital_period (array): int64 column
+        diameter (array): int64 column
+        surface_water (array): float64 column
+        population (array): int64 column
+        climate (list): climate lists (None allowed)
+        gravity (list): gravity dictionaries (None allowed)
+        terrain (list): terrain lists (None allowed)
+        nulls (dict): numeric column name -> null mask
+
+    Methods:
+        append: add a < Planet > as a new row
+        biggest: mask of the planets with the largest diameter (ties included)
+        desert_only: mask of the planets whose only terrain is desert
+        inhabited: mask of the planets with a population greater than zero
+        jsonable_rows: JSON-friendly dictionaries for the rows selected by a mask
+        planet: materialize a single row as a < Planet >
+        planets: materialize the rows selected by a mask as < Planet > instances
+        smallest: mask of the planets with a diameter of zero
+        uninhabited: mask of the planets with a population of zero
+        with_surface_water: mask of the planets with surface water
+    """
+
+    NUMERIC_COLUMNS = {
+        'rotation_period': 'q',
+        'orbital_period': 'q',
+        'diameter': 'q',
+        'surface_water': 'd',
+        'population': 'q'
+    }
+    OBJECT_COLUMNS = ('url', 'name', 'climate', 'gravity', 'terrain')
+
+    def __init__(self, planets=None):
+        """Initialize a PlanetTable instance, appending each < Planet > in < planets > (if
+        any) as a row."""
+
+        for column, typecode in self.NUMERIC_COLUMNS.items():
+            setattr(self, column, array(typecode))
+        for column in self.OBJECT_COLUMNS:
+            setattr(self, column, [])
+        self.nulls = {column: bytearray() for column in self.NUMERIC_COLUMNS}
+
+        if planets:
+            for planet in planets:
+                self.append(planet)
+
+    def __len__(self):
+        return len(self.url)
+
+    def __str__(self):
+        """Return a string representation of the object."""
+
+        return f"PlanetTable: {len(self)} planets"
+
+    def append(self, planet):
+        """Adds a < Planet > (with converted values) to the table as a new row.
+
+        Parameters:
+            planet (Planet): planet to add
+
+        Returns:
+            None
+        """
+
+        for column in self.NUMERIC_COLUMNS:
+            value = getattr(planet, column)
+            getattr(self, column).append(0 if value is None else value)
+            self.nulls[column].append(value is None)
+        for column in self.OBJECT_COLUMNS:
+            getattr(self, column).append(getattr(planet, column))
+
+    def biggest(self):
+        """Returns a mask selecting every planet whose diameter equals the largest known diameter.
+        Planets with an unknown diameter are excluded.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return self._extreme('diameter', max)
+
+    def desert_only(self):
+        """Returns a mask selecting the planets whose terrain is exactly ["desert"]. Planets with
+        an unknown terrain are excluded.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return bytearray(terrain == ['desert'] for terrain in self.terrain)
+
+    def inhabited(self):
+        """Returns a mask selecting the planets with a known population greater than zero.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return bytearray(
+            not null and value > 0
+            for value, null in zip(self.population, self.nulls['population'])
+        )
+
+    def jsonable_rows(self, mask):
+        """Returns JSON-friendly dictionaries (see < Planet.jsonable >) for the rows selected by
+        < mask >, in row order.
+
+        Parameters:
+            mask (bytearray): row mask
+
+        Returns:
+            list: planet dictionaries
+        """
+
+        return [planet.jsonable() for planet in self.planets(mask)]
+
+    def planet(self, index):
+        """Materializes row < index > as a new < Planet > instance.
+
+        Parameters:
+            index (int): row index
+
+        Returns:
+            Planet: new < Planet > instance
+        """
+
+        planet = ent.Planet(self.url[index], self.name[index])
+        for column in self.NUMERIC_COLUMNS:
+            if not self.nulls[column][index]:
+                setattr(planet, column, getattr(self, column)[index])
+        planet.climate = self.climate[index]
+        planet.gravity = self.gravity[index]
+        planet.terrain = self.terrain[index]
+
+        return planet
+
+    def planets(self, mask):
+        """Materializes the rows selected by < mask > as new < Planet > instances, in row order.
+
+        Parameters:
+            mask (bytearray): row mask
+
+        Returns:
+            list: < Planet > instances
+        """
+
+        return [self.planet(index) for index in compress(range(len(self)), mask)]
+
+    def smallest(self):
+        """Returns a mask selecting the planets with a known diameter of zero (the problem set's
+        definition of "smallest"). Planets with an unknown diameter are excluded.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return bytearray(
+            not null and value == 0 for value, null in zip(self.diameter, self.nulls['diameter'])
+        )
+
+    def uninhabited(self):
+        """Returns a mask selecting the planets with a known population of zero.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return bytearray(
+            not null and value == 0
+            for value, null in zip(self.population, self.nulls['population'])
+        )
+
+    def with_surface_water(self):
+        """Returns a mask selecting the planets with a known surface water value greater than
+        zero.
+
+        Parameters:
+            None
+
+        Returns:
+            bytearray: row mask
+        """
+
+        return bytearray(
+            not null and value > 0
+            for value, null in zip(self.surface_water, self.nulls['surface_water'])
+        )
+
+    def _extreme(self, column, func):
+        """Returns a mask selecting the non-null rows of < column > equal to < func > (e.g., max)
+        of its non-null values."""
+
+        nulls = self.nulls[column]
+        values = getattr(self, column)
+        known = [value for value, null in zip(values, nulls) if not null]
+        if not known:
+            return bytearray(len(self))
+
+        target = func(known)
+        return bytearray(not null and value == target for value, null in zip(values, nulls))
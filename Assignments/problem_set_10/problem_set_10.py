@@ -3,6 +3,8 @@ from os import write
 
 from requests import NullHandler
 import swapi_entities as ent
+from planet_classifier import JsonArraySink, classify_planets
+from planet_table import PlanetTable
 
 # Problem 1.0
 def read_json(filepath, encoding='utf-8'):
@@ -50,51 +52,24 @@ def main():
         planets[data['name']] = ent.create_planet(data)
 
     # Problem 6.0
-    planets_with_surface_water = []
-    for key, value in planets.items():
-        if value.has_surface_water() == None:
-            continue
-        elif value.has_surface_water() == True:
-            planets_with_surface_water.append(value.jsonable())
-    write_json('stu_planets_with_surface_water.json', planets_with_surface_water)
-
-    planets_inhabited = []
-    planets_uninhabited = []
-    for key, value in planets.items():
-        if value.population == None:
-            continue
-        elif value.is_populated() == True:
-            planets_inhabited.append(value.jsonable())
-        elif value.is_populated() == False:
-            planets_uninhabited.append(value.jsonable())
-
-
-    write_json('stu_planets_inhabited.json', planets_inhabited)
-    write_json('stu_planets_uninhabited.json', planets_uninhabited)
-
-    planets_desert_only = []
-    for key, value in planets.items():
-        if value.terrain == None:
-            continue
-        if len(value.terrain) > 1:
-            continue
-        elif 'desert' in value.terrain :
-            planets_desert_only.append(value.jsonable())
-
-    write_json('stu_planets_desert_only.json', planets_desert_only)
-
-    planets_biggest_smallest = {"biggest": [], "smallest": []}
-
-    Max = 0
-    for key, value in planets.items():
-        if value.diameter == None:
-            continue
-        if value.diameter == 0:
-            planets_biggest_smallest['smallest'].append(value.jsonable())
-        if value.diameter > Max:
-            planets_biggest_smallest['biggest'].clear()
-            Max = value.diameter
-            planets_biggest_smallest['biggest'].append(value.jsonable())
+    # One traversal evaluates every category; matching planets stream straight to their files.
+    # The biggest/smallest planets are selected from the table's typed diameter column.
+    with JsonArraySink('stu_planets_with_surface_water.json') as surface_water, \
+            JsonArraySink('stu_planets_inhabited.json') as inhabited, \
+            JsonArraySink('stu_planets_uninhabited.json') as uninhabited, \
+            JsonArraySink('stu_planets_desert_only.json') as desert_only:
+        classify_planets(planets.values(), extremes={}, sinks={
+            'surface_water': surface_water,
+            'inhabited': inhabited,
+            'uninhabited': uninhabited,
+            'desert_only': desert_only
+        })
+
+    planet_table = PlanetTable(planets.values())
+    planets_biggest_smallest = {
+        "biggest": planet_table.jsonable_rows(planet_table.biggest()),
+        "smallest": planet_table.jsonable_rows(planet_table.smallest())
+    }
     print((planets_biggest_smallest['smallest']))
     print((planets_biggest_smallest['biggest']))
     write_json('stu_planets_biggest_smallest.json', planets_biggest_smallest )
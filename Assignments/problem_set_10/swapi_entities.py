@@ -79,7 +79,9 @@ class Planet:
 # Problem 3.0
 def convert_data(planet):
     """Convert string values of a dictionary to the appropriate type whenever possible.
-    Remember to set the value to None when the string is "unknown".
+    Remember to set the value to None when the string is "unknown". The conversions are
+    written out field by field (the same unrolled shape as the converters generated by
+    last_assignment/sw_schema.py); each value is read and lowercased once.
 
     Type conversions:
         rotation_period (str->int)
@@ -97,53 +99,37 @@ def convert_data(planet):
         dict: dictionary of a planet with its values converted
     """
 
-    if planet.get('rotation_period'):
-        if planet['rotation_period'].lower() == 'unknown':
-            planet['rotation_period'] = None
-        else:
-            planet['rotation_period'] = int(planet['rotation_period'])
-    if planet.get('orbital_period'):
-        if planet['orbital_period'].lower() == 'unknown':
-            planet['orbital_period'] = None
-        else:
-            planet['orbital_period'] = int(planet['orbital_period'])
-    if planet.get('diameter'):
-        if planet['diameter'].lower() == 'unknown':
-            planet['diameter'] = None
-        else:
-            planet['diameter'] = int(planet['diameter'])
-    if planet.get('climate'):
-        if planet['climate'].lower() == 'unknown':
-            planet['climate'] = None
-        else:
-            planet['climate'] = planet['climate'].split(', ')
-    if planet.get('gravity'):
-        if planet['gravity'].lower() == 'unknown':
+    value = planet.get('rotation_period')
+    if value:
+        planet['rotation_period'] = None if value.lower() == 'unknown' else int(value)
+    value = planet.get('orbital_period')
+    if value:
+        planet['orbital_period'] = None if value.lower() == 'unknown' else int(value)
+    value = planet.get('diameter')
+    if value:
+        planet['diameter'] = None if value.lower() == 'unknown' else int(value)
+    value = planet.get('climate')
+    if value:
+        planet['climate'] = None if value.lower() == 'unknown' else value.split(', ')
+    value = planet.get('gravity')
+    if value:
+        if value.lower() == 'unknown':
             planet['gravity'] = None
         else:
-            planet_list = planet['gravity'].split()
-            gravity_dict ={}
-            gravity_dict['measure'] = float(planet_list[0])
-            if len(planet_list) == 2:
-                gravity_dict['unit'] = planet_list[1]
-            else:
-                gravity_dict['unit'] = 'standard'
-            planet['gravity'] = gravity_dict
-    if planet.get('terrain'):
-        if planet['terrain'].lower() == 'unknown':
-            planet['terrain'] = None
-        else:
-            planet['terrain'] = planet['terrain'].split(', ')
-    if planet.get('surface_water'):
-        if planet['surface_water'].lower() == 'unknown':
-            planet['surface_water'] = None
-        else:
-            planet['surface_water'] = float(planet['surface_water'])
-    if planet.get('population'):
-        if planet['population'].lower() == 'unknown':
-            planet['population'] = None
-        else:
-            planet['population'] = int(planet['population'])
+            gravity_list = value.split()
+            planet['gravity'] = {
+                'measure': float(gravity_list[0]),
+                'unit': gravity_list[1] if len(gravity_list) == 2 else 'standard'
+            }
+    value = planet.get('terrain')
+    if value:
+        planet['terrain'] = None if value.lower() == 'unknown' else value.split(', ')
+    value = planet.get('surface_water')
+    if value:
+        planet['surface_water'] = None if value.lower() == 'unknown' else float(value)
+    value = planet.get('population')
+    if value:
+        planet['population'] = None if value.lower() == 'unknown' else int(value)
     return planet
 
 
@@ -1,5 +1,6 @@
 import json
 import requests
+from itertools import islice
 import swapi_utils as utl
 
 # LAB EXERCISE 10
@@ -125,7 +126,7 @@ def main():
     """
 
     # PROBLEM 01 (9 Points)
-    starships_data = utl.get_swapi_resource(utl.ENDPOINT + '/starships/')['results'][:10]
+    starships_data = list(islice(utl.iter_swapi_category('starships'), 10))
 
 
     # END PROBLEM 01
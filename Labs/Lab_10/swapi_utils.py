@@ -1,6 +1,7 @@
 # Import two modules
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor
 
 ENDPOINT = 'https://swapi.py4e.com/api'
 
@@ -24,6 +25,41 @@ def get_swapi_resource(url, params=None, timeout=10):
         return requests.get(url, timeout=timeout).json()
 
 
+def iter_swapi_category(category, params=None, timeout=10):
+    """Yields every entity in a SWAPI < category > (e.g., "starships"), following each page's
+    "next" link until the last page is reached. Pages are only requested once the consumer
+    moves past the previous page, so reading a prefix of the first page (e.g., with islice())
+    makes a single request. From the second page on, the following page is fetched on a
+    background thread while the current page's entities are yielded.
+    Parameters:
+        category (str): category name (e.g., "starships")
+        params (dict): optional dictionary of querystring arguments for the first page
+        timeout (int): timeout value in seconds
+    Returns:
+        generator: dictionary representations of the category's entities
+    """
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        page = get_swapi_resource(f"{ENDPOINT}/{category}/", params, timeout)
+        next_page = None
+        while page:
+            for entity in page['results']:
+                yield entity
+
+            # the consumer has moved past this page
+            if next_page:
+                page = next_page.result()
+            elif page.get('next'):
+                page = get_swapi_resource(page['next'], None, timeout)
+            else:
+                page = None
+
+            if page and page.get('next'):
+                next_page = executor.submit(get_swapi_resource, page['next'], None, timeout)
+            else:
+                next_page = None
+
+
 def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
     """Serializes object as JSON. Writes content to the provided filepath.
     Parameters: